@@ -9,7 +9,6 @@ from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
 from pants.contrib.avro.targets.java_avro_library import JavaAvroLibrary
-from pants.contrib.avro.tasks.avro_gen import AvroJavaGenTask
 
 
 def build_file_aliases():
@@ -21,4 +20,4 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='avro-java', action=AvroJavaGenTask).install('gen')
+  task(name='avro-java', action='pants.contrib.avro.tasks.avro_gen:AvroJavaGenTask').install('gen')
@@ -7,10 +7,10 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.buildrefactor.buildozer import Buildozer
-from pants.contrib.buildrefactor.meta_rename import MetaRename
 
 
 def register_goals():
-  task(name='buildozer', action=Buildozer).install('buildozer')
-  task(name='meta-rename', action=MetaRename).install('meta-rename')
+  task(name='buildozer',
+       action='pants.contrib.buildrefactor.buildozer:Buildozer').install('buildozer')
+  task(name='meta-rename',
+       action='pants.contrib.buildrefactor.meta_rename:MetaRename').install('meta-rename')
@@ -7,12 +7,12 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.codeanalysis.tasks.bundle_entries import BundleEntries
-from pants.contrib.codeanalysis.tasks.extract_java import ExtractJava
-from pants.contrib.codeanalysis.tasks.index_java import IndexJava
 
 
 def register_goals():
-  task(name='kythe-java-extract', action=ExtractJava).install('index')
-  task(name='kythe-java-index', action=IndexJava).install('index')
-  task(name='bundle-entries', action=BundleEntries).install('index')
+  task(name='kythe-java-extract',
+       action='pants.contrib.codeanalysis.tasks.extract_java:ExtractJava').install('index')
+  task(name='kythe-java-index',
+       action='pants.contrib.codeanalysis.tasks.index_java:IndexJava').install('index')
+  task(name='bundle-entries',
+       action='pants.contrib.codeanalysis.tasks.bundle_entries:BundleEntries').install('index')
@@ -7,8 +7,8 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.confluence.tasks.confluence_publish import ConfluencePublish
 
 
 def register_goals():
-  task(name='confluence', action=ConfluencePublish).install()
+  task(name='confluence',
+       action='pants.contrib.confluence.tasks.confluence_publish:ConfluencePublish').install()
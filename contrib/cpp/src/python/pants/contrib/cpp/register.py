@@ -10,10 +10,6 @@ from pants.goal.task_registrar import TaskRegistrar as task
 
 from pants.contrib.cpp.targets.cpp_binary import CppBinary
 from pants.contrib.cpp.targets.cpp_library import CppLibrary
-from pants.contrib.cpp.tasks.cpp_binary_create import CppBinaryCreate
-from pants.contrib.cpp.tasks.cpp_compile import CppCompile
-from pants.contrib.cpp.tasks.cpp_library_create import CppLibraryCreate
-from pants.contrib.cpp.tasks.cpp_run import CppRun
 
 
 def build_file_aliases():
@@ -26,7 +22,9 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='cpp', action=CppCompile).install('compile')
-  task(name='cpplib', action=CppLibraryCreate).install('binary')
-  task(name='cpp', action=CppBinaryCreate).install('binary')
-  task(name='cpp', action=CppRun).install('run')
+  task(name='cpp', action='pants.contrib.cpp.tasks.cpp_compile:CppCompile').install('compile')
+  task(name='cpplib',
+       action='pants.contrib.cpp.tasks.cpp_library_create:CppLibraryCreate').install('binary')
+  task(name='cpp',
+       action='pants.contrib.cpp.tasks.cpp_binary_create:CppBinaryCreate').install('binary')
+  task(name='cpp', action='pants.contrib.cpp.tasks.cpp_run:CppRun').install('run')
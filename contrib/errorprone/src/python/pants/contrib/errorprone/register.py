@@ -7,8 +7,8 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.errorprone.tasks.errorprone import ErrorProne
 
 
 def register_goals():
-  task(name='errorprone', action=ErrorProne).install('compile')
+  task(name='errorprone',
+       action='pants.contrib.errorprone.tasks.errorprone:ErrorProne').install('compile')
@@ -7,8 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.findbugs.tasks.findbugs import FindBugs
 
 
 def register_goals():
-  task(name='findbugs', action=FindBugs).install('compile')
+  task(name='findbugs', action='pants.contrib.findbugs.tasks.findbugs:FindBugs').install('compile')
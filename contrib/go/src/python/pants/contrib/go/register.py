@@ -12,16 +12,6 @@ from pants.contrib.go.targets.go_binary import GoBinary
 from pants.contrib.go.targets.go_library import GoLibrary
 from pants.contrib.go.targets.go_remote_library import GoRemoteLibrary
 from pants.contrib.go.targets.go_thrift_library import GoThriftLibrary
-from pants.contrib.go.tasks.go_binary_create import GoBinaryCreate
-from pants.contrib.go.tasks.go_buildgen import GoBuildgen
-from pants.contrib.go.tasks.go_checkstyle import GoCheckstyle
-from pants.contrib.go.tasks.go_compile import GoCompile
-from pants.contrib.go.tasks.go_fetch import GoFetch
-from pants.contrib.go.tasks.go_fmt import GoFmt
-from pants.contrib.go.tasks.go_go import GoEnv, GoGo
-from pants.contrib.go.tasks.go_run import GoRun
-from pants.contrib.go.tasks.go_test import GoTest
-from pants.contrib.go.tasks.go_thrift_gen import GoThriftGen
 
 
 def build_file_aliases():
@@ -38,14 +28,14 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='go-thrift', action=GoThriftGen).install('gen')
-  task(name='go', action=GoBuildgen).install('buildgen')
-  task(name='go', action=GoGo).install('go')
-  task(name='go-env', action=GoEnv).install()
-  task(name='go', action=GoFetch).install('resolve')
-  task(name='go', action=GoCompile).install('compile')
-  task(name='go', action=GoBinaryCreate).install('binary')
-  task(name='go', action=GoRun).install('run')
-  task(name='go', action=GoCheckstyle).install('lint')
-  task(name='go', action=GoTest).install('test')
-  task(name='go', action=GoFmt).install('fmt')
+  task(name='go-thrift', action='pants.contrib.go.tasks.go_thrift_gen:GoThriftGen').install('gen')
+  task(name='go', action='pants.contrib.go.tasks.go_buildgen:GoBuildgen').install('buildgen')
+  task(name='go', action='pants.contrib.go.tasks.go_go:GoGo').install('go')
+  task(name='go-env', action='pants.contrib.go.tasks.go_go:GoEnv').install()
+  task(name='go', action='pants.contrib.go.tasks.go_fetch:GoFetch').install('resolve')
+  task(name='go', action='pants.contrib.go.tasks.go_compile:GoCompile').install('compile')
+  task(name='go', action='pants.contrib.go.tasks.go_binary_create:GoBinaryCreate').install('binary')
+  task(name='go', action='pants.contrib.go.tasks.go_run:GoRun').install('run')
+  task(name='go', action='pants.contrib.go.tasks.go_checkstyle:GoCheckstyle').install('lint')
+  task(name='go', action='pants.contrib.go.tasks.go_test:GoTest').install('test')
+  task(name='go', action='pants.contrib.go.tasks.go_fmt:GoFmt').install('fmt')
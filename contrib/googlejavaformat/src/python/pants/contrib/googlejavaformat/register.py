@@ -7,10 +7,11 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.googlejavaformat.googlejavaformat import (GoogleJavaFormat,
-                                                             GoogleJavaFormatCheckFormat)
 
 
 def register_goals():
-  task(name='google-java-format', action=GoogleJavaFormat).install('fmt')
-  task(name='google-java-format', action=GoogleJavaFormatCheckFormat).install('lint')
+  task(name='google-java-format',
+       action='pants.contrib.googlejavaformat.googlejavaformat:GoogleJavaFormat').install('fmt')
+  task(name='google-java-format',
+       action='pants.contrib.googlejavaformat.googlejavaformat:'
+              'GoogleJavaFormatCheckFormat').install('lint')
@@ -9,7 +9,6 @@ from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
 from pants.contrib.jax_ws.targets.jax_ws_library import JaxWsLibrary
-from pants.contrib.jax_ws.tasks.jax_ws_gen import JaxWsGen
 
 
 def build_file_aliases():
@@ -21,4 +20,4 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='jax-ws', action=JaxWsGen).install('gen')
+  task(name='jax-ws', action='pants.contrib.jax_ws.tasks.jax_ws_gen:JaxWsGen').install('gen')
@@ -16,13 +16,6 @@ from pants.contrib.node.targets.node_module import NodeModule
 from pants.contrib.node.targets.node_preinstalled_module import NodePreinstalledModule
 from pants.contrib.node.targets.node_remote_module import NodeRemoteModule
 from pants.contrib.node.targets.node_test import NodeTest as NodeTestTarget
-from pants.contrib.node.tasks.javascript_style import JavascriptStyleFmt, JavascriptStyleLint
-from pants.contrib.node.tasks.node_build import NodeBuild
-from pants.contrib.node.tasks.node_bundle import NodeBundle as NodeBundleTask
-from pants.contrib.node.tasks.node_repl import NodeRepl
-from pants.contrib.node.tasks.node_resolve import NodeResolve
-from pants.contrib.node.tasks.node_run import NodeRun
-from pants.contrib.node.tasks.node_test import NodeTest as NodeTestTask
 
 
 def build_file_aliases():
@@ -38,15 +31,18 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='node', action=NodeRepl).install('repl')
-  task(name='node', action=NodeResolve).install('resolve')
-  task(name='node', action=NodeRun).install('run')
-  task(name='node', action=NodeBuild).install('compile', first=True)
-  task(name='node', action=NodeTestTask).install('test')
-  task(name='node', action=NodeBundleTask).install('bundle')
+  task(name='node', action='pants.contrib.node.tasks.node_repl:NodeRepl').install('repl')
+  task(name='node', action='pants.contrib.node.tasks.node_resolve:NodeResolve').install('resolve')
+  task(name='node', action='pants.contrib.node.tasks.node_run:NodeRun').install('run')
+  task(name='node',
+       action='pants.contrib.node.tasks.node_build:NodeBuild').install('compile', first=True)
+  task(name='node', action='pants.contrib.node.tasks.node_test:NodeTest').install('test')
+  task(name='node', action='pants.contrib.node.tasks.node_bundle:NodeBundle').install('bundle')
   # Linting
-  task(name='javascriptstyle', action=JavascriptStyleLint).install('lint')
-  task(name='javascriptstyle', action=JavascriptStyleFmt).install('fmt')
+  task(name='javascriptstyle',
+       action='pants.contrib.node.tasks.javascript_style:JavascriptStyleLint').install('lint')
+  task(name='javascriptstyle',
+       action='pants.contrib.node.tasks.javascript_style:JavascriptStyleFmt').install('fmt')
 
 
 def global_subsystems():
@@ -12,8 +12,6 @@ from pants.contrib.node.tasks.node_resolve import NodeResolve
 from pants.contrib.scalajs.subsystems.scala_js_platform import ScalaJSPlatform
 from pants.contrib.scalajs.targets.scala_js_binary import ScalaJSBinary
 from pants.contrib.scalajs.targets.scala_js_library import ScalaJSLibrary
-from pants.contrib.scalajs.tasks.scala_js_link import ScalaJSLink
-from pants.contrib.scalajs.tasks.scala_js_zinc_compile import ScalaJSZincCompile
 
 
 def build_file_aliases():
@@ -30,8 +28,11 @@ def register_goals():
   # NB: These task/goal assignments are pretty nuts, but are necessary in order to
   # prevent product-graph cycles between the JVM and node.js.
   #   see https://github.com/pantsbuild/pants/labels/engine
-  task(name='scala-js-compile', action=ScalaJSZincCompile).install('resolve')
-  task(name='scala-js-link', action=ScalaJSLink).install('resolve')
+  task(name='scala-js-compile',
+       action='pants.contrib.scalajs.tasks.scala_js_zinc_compile:'
+              'ScalaJSZincCompile').install('resolve')
+  task(name='scala-js-link',
+       action='pants.contrib.scalajs.tasks.scala_js_link:ScalaJSLink').install('resolve')
 
 
 def global_subsystems():
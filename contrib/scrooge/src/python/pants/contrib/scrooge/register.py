@@ -7,10 +7,9 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.scrooge.tasks.scrooge_gen import ScroogeGen
-from pants.contrib.scrooge.tasks.thrift_linter import ThriftLinter
 
 
 def register_goals():
-  task(name='thrift', action=ThriftLinter).install('lint')
-  task(name='scrooge', action=ScroogeGen).install('gen')
+  task(name='thrift',
+       action='pants.contrib.scrooge.tasks.thrift_linter:ThriftLinter').install('lint')
+  task(name='scrooge', action='pants.contrib.scrooge.tasks.scrooge_gen:ScroogeGen').install('gen')
@@ -8,7 +8,6 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
-from pants.contrib.thrifty.java_thrifty_gen import JavaThriftyGen
 from pants.contrib.thrifty.java_thrifty_library import JavaThriftyLibrary
 
 
@@ -21,4 +20,5 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='thrifty', action=JavaThriftyGen).install('gen')
+  task(name='thrifty',
+       action='pants.contrib.thrifty.java_thrifty_gen:JavaThriftyGen').install('gen')
@@ -5,9 +5,8 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from internal_backend.sitegen.tasks.sitegen import SiteGen
 from pants.goal.task_registrar import TaskRegistrar as task
 
 
 def register_goals():
-  task(name='sitegen', action=SiteGen).install()
+  task(name='sitegen', action='internal_backend.sitegen.tasks.sitegen:SiteGen').install()
@@ -19,5 +19,5 @@ def build_file_aliases():
 
 
 def register_goals():
-  from pants.backend.codegen.antlr.python.antlr_py_gen import AntlrPyGen
-  task(name='antlr-py', action=AntlrPyGen).install('gen')
+  task(name='antlr-py',
+       action='pants.backend.codegen.antlr.python.antlr_py_gen:AntlrPyGen').install('gen')
@@ -5,7 +5,6 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.backend.codegen.jaxb.jaxb_gen import JaxbGen
 from pants.backend.codegen.jaxb.jaxb_library import JaxbLibrary
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
@@ -20,4 +19,4 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='jaxb', action=JaxbGen).install('gen')
+  task(name='jaxb', action='pants.backend.codegen.jaxb.jaxb_gen:JaxbGen').install('gen')
@@ -6,7 +6,6 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 from pants.backend.codegen.protobuf.java.java_protobuf_library import JavaProtobufLibrary
-from pants.backend.codegen.protobuf.java.protobuf_gen import ProtobufGen
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
@@ -20,4 +19,5 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='protoc', action=ProtobufGen).install('gen')
+  task(name='protoc',
+       action='pants.backend.codegen.protobuf.java.protobuf_gen:ProtobufGen').install('gen')
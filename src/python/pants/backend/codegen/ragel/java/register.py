@@ -6,7 +6,6 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 from pants.backend.codegen.ragel.java.java_ragel_library import JavaRagelLibrary
-from pants.backend.codegen.ragel.java.ragel_gen import RagelGen
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
@@ -20,4 +19,4 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='ragel', action=RagelGen).install('gen')
+  task(name='ragel', action='pants.backend.codegen.ragel.java.ragel_gen:RagelGen').install('gen')
@@ -5,7 +5,6 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.backend.codegen.thrift.java.apache_thrift_java_gen import ApacheThriftJavaGen
 from pants.backend.codegen.thrift.java.java_thrift_library import JavaThriftLibrary
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
@@ -20,4 +19,6 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='thrift-java', action=ApacheThriftJavaGen).install('gen')
+  task(name='thrift-java',
+       action='pants.backend.codegen.thrift.java.apache_thrift_java_gen:'
+              'ApacheThriftJavaGen').install('gen')
@@ -5,7 +5,6 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.backend.codegen.thrift.python.apache_thrift_py_gen import ApacheThriftPyGen
 from pants.backend.codegen.thrift.python.python_thrift_library import PythonThriftLibrary
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
@@ -20,4 +19,6 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='thrift-py', action=ApacheThriftPyGen).install('gen')
+  task(name='thrift-py',
+       action='pants.backend.codegen.thrift.python.apache_thrift_py_gen:'
+              'ApacheThriftPyGen').install('gen')
@@ -6,7 +6,6 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 from pants.backend.codegen.wire.java.java_wire_library import JavaWireLibrary
-from pants.backend.codegen.wire.java.wire_gen import WireGen
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
@@ -20,4 +19,4 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='wire', action=WireGen).install('gen')
+  task(name='wire', action='pants.backend.codegen.wire.java.wire_gen:WireGen').install('gen')
@@ -6,8 +6,6 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 from pants.backend.docgen.targets.doc import Page, Wiki, WikiArtifact
-from pants.backend.docgen.tasks.generate_pants_reference import GeneratePantsReference
-from pants.backend.docgen.tasks.markdown_to_html import MarkdownToHtml
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.goal.task_registrar import TaskRegistrar as task
 
@@ -26,5 +24,8 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='markdown', action=MarkdownToHtml).install(),
-  task(name='reference', action=GeneratePantsReference).install()
+  task(name='markdown',
+       action='pants.backend.docgen.tasks.markdown_to_html:MarkdownToHtml').install(),
+  task(name='reference',
+       action='pants.backend.docgen.tasks.generate_pants_reference:'
+              'GeneratePantsReference').install()
@@ -5,26 +5,18 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.backend.graph_info.tasks.cloc import CountLinesOfCode
-from pants.backend.graph_info.tasks.dependees import ReverseDepmap
-from pants.backend.graph_info.tasks.filemap import Filemap
-from pants.backend.graph_info.tasks.filter import Filter
-from pants.backend.graph_info.tasks.list_owners import ListOwners
-from pants.backend.graph_info.tasks.listtargets import ListTargets
-from pants.backend.graph_info.tasks.minimal_cover import MinimalCover
-from pants.backend.graph_info.tasks.paths import Path, Paths
-from pants.backend.graph_info.tasks.sorttargets import SortTargets
 from pants.goal.task_registrar import TaskRegistrar as task
 
 
 def register_goals():
-  task(name='list', action=ListTargets).install()
-  task(name='path', action=Path).install()
-  task(name='paths', action=Paths).install()
-  task(name='dependees', action=ReverseDepmap).install()
-  task(name='filemap', action=Filemap).install()
-  task(name='minimize', action=MinimalCover).install()
-  task(name='filter', action=Filter).install()
-  task(name='sort', action=SortTargets).install()
-  task(name='cloc', action=CountLinesOfCode).install()
-  task(name='list-owners', action=ListOwners).install()
+  task(name='list', action='pants.backend.graph_info.tasks.listtargets:ListTargets').install()
+  task(name='path', action='pants.backend.graph_info.tasks.paths:Path').install()
+  task(name='paths', action='pants.backend.graph_info.tasks.paths:Paths').install()
+  task(name='dependees', action='pants.backend.graph_info.tasks.dependees:ReverseDepmap').install()
+  task(name='filemap', action='pants.backend.graph_info.tasks.filemap:Filemap').install()
+  task(name='minimize',
+       action='pants.backend.graph_info.tasks.minimal_cover:MinimalCover').install()
+  task(name='filter', action='pants.backend.graph_info.tasks.filter:Filter').install()
+  task(name='sort', action='pants.backend.graph_info.tasks.sorttargets:SortTargets').install()
+  task(name='cloc', action='pants.backend.graph_info.tasks.cloc:CountLinesOfCode').install()
+  task(name='list-owners', action='pants.backend.graph_info.tasks.list_owners:ListOwners').install()
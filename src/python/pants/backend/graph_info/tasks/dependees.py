@@ -33,42 +33,51 @@ class ReverseDepmap(ConsoleTask):
     self._closed = self.get_options().closed
 
   def console_output(self, _):
-    dependees_by_target = defaultdict(set)
-    for address in self.context.build_graph.inject_specs_closure([DescendantAddresses('')]):
-      target = self.context.build_graph.get_target(address)
-      # TODO(John Sirois): tighten up the notion of targets written down in a BUILD by a
-      # user vs. targets created by pants at runtime.
-      concrete_target = self.get_concrete_target(target)
-      for dependency in concrete_target.dependencies:
-        dependency = self.get_concrete_target(dependency)
-        dependees_by_target[dependency].add(concrete_target)
+    dependee_index = self.context.dependee_index
+    if dependee_index is not None:
+      # Only the BUILD files that changed since the index was last updated are parsed.
+      dependees_by_address = dependee_index.update().dependees_by_address
+    else:
+      dependees_by_address = self._dependees_by_address()
 
-    roots = set(self.context.target_roots)
+    roots = set(root.address for root in self.context.target_roots)
     if self.get_options().output_format == 'json':
       deps = defaultdict(list)
       for root in roots:
         if self._closed:
-          deps[root.address.spec].append(root.address.spec)
-        for dependent in self.get_dependents(dependees_by_target, [root]):
-          deps[root.address.spec].append(dependent.address.spec)
+          deps[root.spec].append(root.spec)
+        for dependent in self.get_dependents(dependees_by_address, [root]):
+          deps[root.spec].append(dependent.spec)
       for address in deps.keys():
         deps[address].sort()
       yield json.dumps(deps, indent=4, separators=(',', ': '), sort_keys=True)
     else:
       if self._closed:
         for root in roots:
-          yield root.address.spec
+          yield root.spec
 
-      for dependent in self.get_dependents(dependees_by_target, roots):
-        yield dependent.address.spec
+      for dependent in self.get_dependents(dependees_by_address, roots):
+        yield dependent.spec
+
+  def _dependees_by_address(self):
+    dependees_by_address = defaultdict(set)
+    for address in self.context.build_graph.inject_specs_closure([DescendantAddresses('')]):
+      target = self.context.build_graph.get_target(address)
+      # TODO(John Sirois): tighten up the notion of targets written down in a BUILD by a
+      # user vs. targets created by pants at runtime.
+      concrete_target = self.get_concrete_target(target)
+      for dependency in concrete_target.dependencies:
+        dependency = self.get_concrete_target(dependency)
+        dependees_by_address[dependency.address].add(concrete_target.address)
+    return dependees_by_address
 
-  def get_dependents(self, dependees_by_target, roots):
+  def get_dependents(self, dependees_by_address, roots):
     check = set(roots)
     known_dependents = set()
     while True:
       dependents = set(known_dependents)
-      for target in check:
-        dependents.update(dependees_by_target[target])
+      for address in check:
+        dependents.update(dependees_by_address.get(address, ()))
       check = dependents - known_dependents
       if not check or not self._transitive:
         return dependents - set(roots)
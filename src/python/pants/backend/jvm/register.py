@@ -10,7 +10,6 @@ from pants.backend.jvm.ossrh_publication_metadata import (Developer, License,
                                                           OSSRHPublicationMetadata, Scm)
 from pants.backend.jvm.repository import Repository as repo
 from pants.backend.jvm.scala_artifact import ScalaArtifact
-from pants.backend.jvm.subsystems.jar_dependency_management import JarDependencyManagementSetup
 from pants.backend.jvm.subsystems.scala_platform import ScalaPlatform
 from pants.backend.jvm.subsystems.shader import Shading
 from pants.backend.jvm.targets.annotation_processor import AnnotationProcessor
@@ -30,42 +29,6 @@ from pants.backend.jvm.targets.scala_jar_dependency import ScalaJarDependency
 from pants.backend.jvm.targets.scala_library import ScalaLibrary
 from pants.backend.jvm.targets.scalac_plugin import ScalacPlugin
 from pants.backend.jvm.targets.unpacked_jars import UnpackedJars
-from pants.backend.jvm.tasks.benchmark_run import BenchmarkRun
-from pants.backend.jvm.tasks.binary_create import BinaryCreate
-from pants.backend.jvm.tasks.bootstrap_jvm_tools import BootstrapJvmTools
-from pants.backend.jvm.tasks.bundle_create import BundleCreate
-from pants.backend.jvm.tasks.check_published_deps import CheckPublishedDeps
-from pants.backend.jvm.tasks.checkstyle import Checkstyle
-from pants.backend.jvm.tasks.classmap import ClassmapTask
-from pants.backend.jvm.tasks.consolidate_classpath import ConsolidateClasspath
-from pants.backend.jvm.tasks.coursier_resolve import CoursierResolve
-from pants.backend.jvm.tasks.detect_duplicates import DuplicateDetector
-from pants.backend.jvm.tasks.ivy_imports import IvyImports
-from pants.backend.jvm.tasks.ivy_outdated import IvyOutdated
-from pants.backend.jvm.tasks.ivy_resolve import IvyResolve
-from pants.backend.jvm.tasks.jar_create import JarCreate
-from pants.backend.jvm.tasks.jar_publish import JarPublish
-from pants.backend.jvm.tasks.javadoc_gen import JavadocGen
-from pants.backend.jvm.tasks.junit_run import JUnitRun
-from pants.backend.jvm.tasks.jvm_compile.jvm_classpath_publisher import RuntimeClasspathPublisher
-from pants.backend.jvm.tasks.jvm_compile.zinc.zinc_compile import ZincCompile
-from pants.backend.jvm.tasks.jvm_dependency_check import JvmDependencyCheck
-from pants.backend.jvm.tasks.jvm_dependency_usage import JvmDependencyUsage
-from pants.backend.jvm.tasks.jvm_platform_analysis import JvmPlatformExplain, JvmPlatformValidate
-from pants.backend.jvm.tasks.jvm_run import JvmRun
-from pants.backend.jvm.tasks.nailgun_task import NailgunKillall
-from pants.backend.jvm.tasks.prepare_resources import PrepareResources
-from pants.backend.jvm.tasks.prepare_services import PrepareServices
-from pants.backend.jvm.tasks.provide_tools_jar import ProvideToolsJar
-from pants.backend.jvm.tasks.run_jvm_prep_command import (RunBinaryJvmPrepCommand,
-                                                          RunCompileJvmPrepCommand,
-                                                          RunTestJvmPrepCommand)
-from pants.backend.jvm.tasks.scala_repl import ScalaRepl
-from pants.backend.jvm.tasks.scaladoc_gen import ScaladocGen
-from pants.backend.jvm.tasks.scalafix import ScalaFixCheck, ScalaFixFix
-from pants.backend.jvm.tasks.scalafmt import ScalaFmtCheckFormat, ScalaFmtFormat
-from pants.backend.jvm.tasks.scalastyle import Scalastyle
-from pants.backend.jvm.tasks.unpack_jars import UnpackJars
 from pants.base.deprecated import warn_or_error
 from pants.build_graph.app_base import Bundle, DirectoryReMapper
 from pants.build_graph.build_file_aliases import BuildFileAliases
@@ -142,82 +105,122 @@ def global_subsystems():
 
 # TODO https://github.com/pantsbuild/pants/issues/604 register_goals
 def register_goals():
-  ng_killall = task(name='ng-killall', action=NailgunKillall)
+  ng_killall = task(name='ng-killall', action='pants.backend.jvm.tasks.nailgun_task:NailgunKillall')
   ng_killall.install()
 
   Goal.by_name('invalidate').install(ng_killall, first=True)
   Goal.by_name('clean-all').install(ng_killall, first=True)
 
-  task(name='jar-dependency-management', action=JarDependencyManagementSetup).install('bootstrap')
+  task(name='jar-dependency-management',
+       action='pants.backend.jvm.subsystems.jar_dependency_management:'
+              'JarDependencyManagementSetup').install('bootstrap')
 
-  task(name='jvm-platform-explain', action=JvmPlatformExplain).install('jvm-platform-explain')
-  task(name='jvm-platform-validate', action=JvmPlatformValidate).install('jvm-platform-validate')
+  task(name='jvm-platform-explain',
+       action='pants.backend.jvm.tasks.jvm_platform_analysis:'
+              'JvmPlatformExplain').install('jvm-platform-explain')
+  task(name='jvm-platform-validate',
+       action='pants.backend.jvm.tasks.jvm_platform_analysis:'
+              'JvmPlatformValidate').install('jvm-platform-validate')
 
-  task(name='bootstrap-jvm-tools', action=BootstrapJvmTools).install('bootstrap')
-  task(name='provide-tools-jar', action=ProvideToolsJar).install('bootstrap')
+  task(name='bootstrap-jvm-tools',
+       action='pants.backend.jvm.tasks.bootstrap_jvm_tools:BootstrapJvmTools').install('bootstrap')
+  task(name='provide-tools-jar',
+       action='pants.backend.jvm.tasks.provide_tools_jar:ProvideToolsJar').install('bootstrap')
 
   # Compile
-  task(name='zinc', action=ZincCompile).install('compile')
+  task(name='zinc',
+       action='pants.backend.jvm.tasks.jvm_compile.zinc.zinc_compile:'
+              'ZincCompile').install('compile')
 
   # Dependency resolution.
-  task(name='ivy', action=IvyResolve).install('resolve', first=True)
-  task(name='coursier', action=CoursierResolve).install('resolve')
-  task(name='ivy-imports', action=IvyImports).install('imports')
-  task(name='unpack-jars', action=UnpackJars).install()
-  task(name='ivy', action=IvyOutdated).install('outdated')
+  task(name='ivy',
+       action='pants.backend.jvm.tasks.ivy_resolve:IvyResolve').install('resolve', first=True)
+  task(name='coursier',
+       action='pants.backend.jvm.tasks.coursier_resolve:CoursierResolve').install('resolve')
+  task(name='ivy-imports',
+       action='pants.backend.jvm.tasks.ivy_imports:IvyImports').install('imports')
+  task(name='unpack-jars', action='pants.backend.jvm.tasks.unpack_jars:UnpackJars').install()
+  task(name='ivy', action='pants.backend.jvm.tasks.ivy_outdated:IvyOutdated').install('outdated')
 
   # Resource preparation.
-  task(name='prepare', action=PrepareResources).install('resources')
-  task(name='services', action=PrepareServices).install('resources')
+  task(name='prepare',
+       action='pants.backend.jvm.tasks.prepare_resources:PrepareResources').install('resources')
+  task(name='services',
+       action='pants.backend.jvm.tasks.prepare_services:PrepareServices').install('resources')
 
-  task(name='export-classpath', action=RuntimeClasspathPublisher).install()
-  task(name='jvm-dep-check', action=JvmDependencyCheck).install('compile')
+  task(name='export-classpath',
+       action='pants.backend.jvm.tasks.jvm_compile.jvm_classpath_publisher:'
+              'RuntimeClasspathPublisher').install()
+  task(name='jvm-dep-check',
+       action='pants.backend.jvm.tasks.jvm_dependency_check:JvmDependencyCheck').install('compile')
 
-  task(name='jvm', action=JvmDependencyUsage).install('dep-usage')
+  task(name='jvm',
+       action='pants.backend.jvm.tasks.jvm_dependency_usage:'
+              'JvmDependencyUsage').install('dep-usage')
 
-  task(name='classmap', action=ClassmapTask).install('classmap')
+  task(name='classmap', action='pants.backend.jvm.tasks.classmap:ClassmapTask').install('classmap')
 
   # Generate documentation.
-  task(name='javadoc', action=JavadocGen).install('doc')
-  task(name='scaladoc', action=ScaladocGen).install('doc')
+  task(name='javadoc', action='pants.backend.jvm.tasks.javadoc_gen:JavadocGen').install('doc')
+  task(name='scaladoc', action='pants.backend.jvm.tasks.scaladoc_gen:ScaladocGen').install('doc')
 
   # Bundling.
-  task(name='create', action=JarCreate).install('jar')
-  detect_duplicates = task(name='dup', action=DuplicateDetector)
+  task(name='create', action='pants.backend.jvm.tasks.jar_create:JarCreate').install('jar')
+  detect_duplicates = task(name='dup',
+                           action='pants.backend.jvm.tasks.detect_duplicates:DuplicateDetector')
 
-  task(name='jvm', action=BinaryCreate).install('binary')
+  task(name='jvm', action='pants.backend.jvm.tasks.binary_create:BinaryCreate').install('binary')
   detect_duplicates.install('binary')
 
-  task(name='consolidate-classpath', action=ConsolidateClasspath).install('bundle')
-  task(name='jvm', action=BundleCreate).install('bundle')
+  task(name='consolidate-classpath',
+       action='pants.backend.jvm.tasks.consolidate_classpath:'
+              'ConsolidateClasspath').install('bundle')
+  task(name='jvm', action='pants.backend.jvm.tasks.bundle_create:BundleCreate').install('bundle')
   detect_duplicates.install('bundle')
 
-  task(name='detect-duplicates', action=DuplicateDetector).install()
+  task(name='detect-duplicates',
+       action='pants.backend.jvm.tasks.detect_duplicates:DuplicateDetector').install()
 
   # Publishing.
-  task(name='check-published-deps', action=CheckPublishedDeps).install('check-published-deps')
+  task(name='check-published-deps',
+       action='pants.backend.jvm.tasks.check_published_deps:'
+              'CheckPublishedDeps').install('check-published-deps')
 
-  task(name='jar', action=JarPublish).install('publish')
+  task(name='jar', action='pants.backend.jvm.tasks.jar_publish:JarPublish').install('publish')
 
   # Testing.
-  task(name='junit', action=JUnitRun).install('test')
-  task(name='bench', action=BenchmarkRun).install('bench')
+  task(name='junit', action='pants.backend.jvm.tasks.junit_run:JUnitRun').install('test')
+  task(name='bench', action='pants.backend.jvm.tasks.benchmark_run:BenchmarkRun').install('bench')
 
   # Linting.
-  task(name='scalafix', action=ScalaFixCheck).install('lint')
-  task(name='scalafmt', action=ScalaFmtCheckFormat, serialize=False).install('lint')
-  task(name='scalastyle', action=Scalastyle, serialize=False).install('lint')
-  task(name='checkstyle', action=Checkstyle, serialize=False).install('lint')
+  task(name='scalafix', action='pants.backend.jvm.tasks.scalafix:ScalaFixCheck').install('lint')
+  task(name='scalafmt',
+       action='pants.backend.jvm.tasks.scalafmt:'
+              'ScalaFmtCheckFormat', serialize=False).install('lint')
+  task(name='scalastyle',
+       action='pants.backend.jvm.tasks.scalastyle:Scalastyle', serialize=False).install('lint')
+  task(name='checkstyle',
+       action='pants.backend.jvm.tasks.checkstyle:Checkstyle', serialize=False).install('lint')
 
   # Formatting.
-  task(name='scalafmt', action=ScalaFmtFormat, serialize=False).install('fmt')
-  task(name='scalafix', action=ScalaFixFix).install('fmt')
+  task(name='scalafmt',
+       action='pants.backend.jvm.tasks.scalafmt:ScalaFmtFormat', serialize=False).install('fmt')
+  task(name='scalafix', action='pants.backend.jvm.tasks.scalafix:ScalaFixFix').install('fmt')
 
   # Running.
-  task(name='jvm', action=JvmRun, serialize=False).install('run')
-  task(name='jvm-dirty', action=JvmRun, serialize=False).install('run-dirty')
-  task(name='scala', action=ScalaRepl, serialize=False).install('repl')
-  task(name='scala-dirty', action=ScalaRepl, serialize=False).install('repl-dirty')
-  task(name='test-jvm-prep-command', action=RunTestJvmPrepCommand).install('test', first=True)
-  task(name='binary-jvm-prep-command', action=RunBinaryJvmPrepCommand).install('binary', first=True)
-  task(name='compile-jvm-prep-command', action=RunCompileJvmPrepCommand).install('compile', first=True)
+  task(name='jvm', action='pants.backend.jvm.tasks.jvm_run:JvmRun', serialize=False).install('run')
+  task(name='jvm-dirty',
+       action='pants.backend.jvm.tasks.jvm_run:JvmRun', serialize=False).install('run-dirty')
+  task(name='scala',
+       action='pants.backend.jvm.tasks.scala_repl:ScalaRepl', serialize=False).install('repl')
+  task(name='scala-dirty',
+       action='pants.backend.jvm.tasks.scala_repl:ScalaRepl', serialize=False).install('repl-dirty')
+  task(name='test-jvm-prep-command',
+       action='pants.backend.jvm.tasks.run_jvm_prep_command:'
+              'RunTestJvmPrepCommand').install('test', first=True)
+  task(name='binary-jvm-prep-command',
+       action='pants.backend.jvm.tasks.run_jvm_prep_command:'
+              'RunBinaryJvmPrepCommand').install('binary', first=True)
+  task(name='compile-jvm-prep-command',
+       action='pants.backend.jvm.tasks.run_jvm_prep_command:'
+              'RunCompileJvmPrepCommand').install('compile', first=True)
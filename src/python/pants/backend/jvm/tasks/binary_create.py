@@ -6,10 +6,50 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import os
+from hashlib import sha1
 
+from pants.backend.jvm.tasks.classpath_products import ClasspathEntry
 from pants.backend.jvm.tasks.jvm_binary_task import JvmBinaryTask
 from pants.base.build_environment import get_buildroot
-from pants.util.dirutil import safe_mkdir
+from pants.base.file_digest_cache import FileDigestCache
+from pants.base.fingerprint_strategy import DefaultFingerprintHashingMixin, FingerprintStrategy
+from pants.util.dirutil import safe_mkdir, safe_walk
+from pants.util.fileutil import atomic_copy
+
+
+class RuntimeClasspathFingerprintStrategy(DefaultFingerprintHashingMixin, FingerprintStrategy):
+  """Fingerprints targets on their configuration and the contents of their runtime classpaths.
+
+  Coupled with `invalidate_dependents`, this fingerprints a binary on its runtime classpath: the
+  compiled classes and resources of its internal dependencies, and the jars resolved for its
+  external dependencies, are all fingerprinted by content. So compiler, platform or snapshot jar
+  changes invalidate the binary, and the fingerprint doesn't depend on where the workdir is.
+  """
+
+  def __init__(self, classpath_products, digest_cache=None):
+    super(RuntimeClasspathFingerprintStrategy, self).__init__()
+    self._classpath_products = classpath_products
+    self._digest_cache = digest_cache or FileDigestCache.global_instance()
+
+  def compute_fingerprint(self, target):
+    hasher = sha1()
+    hasher.update(target.payload.fingerprint())
+    for conf, entry in self._classpath_products.get_classpath_entries_for_targets([target]):
+      coordinate = entry.coordinate if ClasspathEntry.is_artifact_classpath_entry(entry) else ''
+      hasher.update('{}\0{}\n'.format(conf, coordinate))
+      self._hash_contents(hasher, entry.path)
+    return hasher.hexdigest()
+
+  def _hash_contents(self, hasher, path):
+    if os.path.isfile(path):
+      hasher.update(self._digest_cache.digest(path))
+      return
+    for root, dirs, files in safe_walk(path):
+      dirs.sort()
+      for f in sorted(files):
+        filepath = os.path.join(root, f)
+        hasher.update('{}\0{}\n'.format(os.path.relpath(filepath, path),
+                                         self._digest_cache.digest(filepath)))
 
 
 class BinaryCreate(JvmBinaryTask):
@@ -26,15 +66,32 @@ class BinaryCreate(JvmBinaryTask):
   def execute(self):
     # TODO (peiyu) switch to `target.id` based naming to avoid potential `basename`
     # conflicts among binary targets.
-    for binary in self.context.targets(self.is_binary):
-      self.create_binary(binary)
+    binaries = self.context.targets(self.is_binary)
+    fingerprint_strategy = RuntimeClasspathFingerprintStrategy(
+      self.context.products.get_data('runtime_classpath'))
+    with self.invalidated(binaries,
+                          fingerprint_strategy=fingerprint_strategy,
+                          invalidate_dependents=True) as invalidation_check:
+      for vt in invalidation_check.all_vts:
+        self.create_binary(vt.target, vt.results_dir, vt.valid)
+
+  def create_binary(self, binary, results_dir, valid=False):
+    """Creates the deploy jar for the given binary in `results_dir`, and copies it to the distdir.
 
-  def create_binary(self, binary):
+    :param binary: The jvm_binary target to create a deploy jar for.
+    :param string results_dir: The directory to create the deploy jar in.
+    :param bool valid: True if `results_dir` already holds an up to date deploy jar.
+    """
     safe_mkdir(self._outdir)
     binary_jarname = '{}.jar'.format(binary.basename)
     binary_jarpath = os.path.join(self._outdir, binary_jarname)
-    self.context.log.info('creating {}'.format(os.path.relpath(binary_jarpath, get_buildroot())))
+    results_jarpath = os.path.join(results_dir, binary_jarname)
     self.context.products.get('jvm_binaries').add(binary, self._outdir).append(binary_jarname)
 
-    with self.monolithic_jar(binary, binary_jarpath) as jar:
-      self.add_main_manifest_entry(jar, binary)
+    if valid and os.path.isfile(results_jarpath):
+      self.context.log.info('reusing {}'.format(os.path.relpath(binary_jarpath, get_buildroot())))
+    else:
+      self.context.log.info('creating {}'.format(os.path.relpath(binary_jarpath, get_buildroot())))
+      with self.monolithic_jar(binary, results_jarpath) as jar:
+        self.add_main_manifest_entry(jar, binary)
+    atomic_copy(results_jarpath, binary_jarpath)
@@ -15,6 +15,7 @@ from pants.backend.jvm.tasks.classpath_products import ClasspathProducts
 from pants.backend.jvm.tasks.jvm_binary_task import JvmBinaryTask
 from pants.base.build_environment import get_buildroot
 from pants.base.exceptions import TargetDefinitionException, TaskError
+from pants.base.worker_pool import Work, WorkerPool
 from pants.build_graph.target_scopes import Scopes
 from pants.fs import archive
 from pants.util.dirutil import absolute_symlink, safe_mkdir, safe_mkdir_for
@@ -51,6 +52,9 @@ class BundleCreate(JvmBinaryTask):
     register('--use-basename-prefix', advanced=True, type=bool,
              help='Use target basename to prefix bundle folder or archive; otherwise a unique '
                   'identifier derived from target will be used.')
+    register('--worker-count', advanced=True, type=int, default=1,
+             help='The number of apps to bundle and archive concurrently. When greater than 1, '
+                  'the jar tool and shader are not run in nailgun.')
 
   @classmethod
   def implementation_version(cls):
@@ -86,6 +90,12 @@ class BundleCreate(JvmBinaryTask):
   def cache_target_dirs(self):
     return True
 
+  @property
+  def use_nailgun(self):
+    # Concurrent bundles run the jar tool and shader at once, which must not race to (re)start a
+    # single shared nailgun server.
+    return self.get_options().worker_count <= 1 and super(BundleCreate, self).use_nailgun
+
   # TODO (Benjy): The following CLI > target > config logic
   # should be implemented in the options system.
   # https://github.com/pantsbuild/pants/issues/3538
@@ -134,20 +144,19 @@ class BundleCreate(JvmBinaryTask):
       bundle_archive_product = self.context.products.get('deployable_archives')
       jvm_archive_product = self.context.products.get('jvm_archives')
 
-      for vt in invalidation_check.all_vts:
-        app = self.App.create_app(vt.target,
-                                  self._resolved_option(vt.target, 'deployjar'),
-                                  self._resolved_option(vt.target, 'archive'))
+      vts_and_apps = [(vt, self.App.create_app(vt.target,
+                                               self._resolved_option(vt.target, 'deployjar'),
+                                               self._resolved_option(vt.target, 'archive')))
+                      for vt in invalidation_check.all_vts]
+      self._bundle_and_archive_all([(vt, app) for vt, app in vts_and_apps if not vt.valid])
+
+      for vt, app in vts_and_apps:
         archiver = archive.archiver(app.archive) if app.archive else None
 
         bundle_dir = self._get_bundle_dir(app, vt.results_dir)
         ext = archive.archive_extensions.get(app.archive, app.archive)
         filename = '{}.{}'.format(app.id, ext)
         archive_path = os.path.join(vt.results_dir, filename) if app.archive else ''
-        if not vt.valid:
-          self.bundle(app, vt.results_dir)
-          if app.archive:
-            archiver.create(bundle_dir, vt.results_dir, app.id)
 
         self._add_product(jvm_bundles_product, app, bundle_dir)
         if archiver:
@@ -158,16 +167,53 @@ class BundleCreate(JvmBinaryTask):
         if vt.target in self.context.target_roots:
           self._store_results(vt, bundle_dir, archive_path, app)
 
+  def _bundle_and_archive_all(self, vts_and_apps):
+    """Bundles and archives the given apps, up to `--worker-count` of them concurrently.
+
+    Each app is bundled into its own `results_dir`, so apps don't share any files while bundling.
+    """
+    consolidated_classpath = self.context.products.get_data('consolidated_classpath')
+    worker_count = min(self.get_options().worker_count, len(vts_and_apps))
+    if worker_count <= 1:
+      for vt, app in vts_and_apps:
+        self._bundle_and_archive(app, vt.results_dir, consolidated_classpath)
+      return
+
+    def classpath_copy():
+      # Each worker gets its own copy of the classpath products, since querying them memoizes.
+      return None if consolidated_classpath is None else consolidated_classpath.copy()
+
+    args_tuples = [(app, vt.results_dir, classpath_copy()) for vt, app in vts_and_apps]
+    with self.context.new_workunit(name='bundle-apps') as workunit:
+      worker_pool = WorkerPool(workunit, self.context.run_tracker, worker_count)
+      try:
+        worker_pool.submit_work_and_wait(Work(self._bundle_and_archive, args_tuples),
+                                         workunit_parent=workunit)
+      except BaseException:
+        worker_pool.abort()
+        raise
+      else:
+        worker_pool.shutdown()
+
+  def _bundle_and_archive(self, app, results_dir, consolidated_classpath):
+    self.bundle(app, results_dir, consolidated_classpath=consolidated_classpath)
+    if app.archive:
+      archive.archiver(app.archive).create(self._get_bundle_dir(app, results_dir), results_dir,
+                                           app.id)
+
   class BasenameConflictError(TaskError):
     """Indicates the same basename is used by two targets."""
 
   def _get_bundle_dir(self, app, results_dir):
     return os.path.join(results_dir, '{}-bundle'.format(app.id))
 
-  def bundle(self, app, results_dir):
+  def bundle(self, app, results_dir, consolidated_classpath=None):
     """Create a self-contained application bundle.
 
     The bundle will contain the target classes, dependencies and resources.
+
+    :param ClasspathProducts consolidated_classpath: The classpath products to bundle from; by
+                                                     default the `consolidated_classpath` product.
     """
     assert(isinstance(app, BundleCreate.App))
 
@@ -183,7 +229,8 @@ class BundleCreate(JvmBinaryTask):
     lib_dir = os.path.join(bundle_dir, self.LIBS_DIR)
     if not app.deployjar:
       os.mkdir(lib_dir)
-      consolidated_classpath = self.context.products.get_data('consolidated_classpath')
+      if consolidated_classpath is None:
+        consolidated_classpath = self.context.products.get_data('consolidated_classpath')
       classpath.update(ClasspathProducts.create_canonical_classpath(
         consolidated_classpath,
         app.target.closure(bfs=True, **self._target_closure_kwargs),
@@ -14,12 +14,12 @@ from pants.backend.jvm.tasks.nailgun_task import NailgunTask
 from pants.base.exceptions import TaskError
 from pants.java.jar.jar_dependency import JarDependency
 from pants.option.custom_types import dict_with_files_option, file_option
-from pants.process.xargs import Xargs
 from pants.task.lint_task_mixin import LintTaskMixin
+from pants.task.sharded_source_check_mixin import ShardedSourceCheckMixin
 from pants.util.dirutil import safe_open
 
 
-class Checkstyle(LintTaskMixin, NailgunTask):
+class Checkstyle(LintTaskMixin, ShardedSourceCheckMixin, NailgunTask):
   """Check Java code for style violations.
 
   :API: public
@@ -70,6 +70,16 @@ class Checkstyle(LintTaskMixin, NailgunTask):
     if options.include_user_classpath:
       round_manager.require_data('runtime_classpath')
 
+  @property
+  def use_nailgun(self):
+    return not self.sharded and super(Checkstyle, self).use_nailgun
+
+  @property
+  def cache_source_results(self):
+    # Checks against the user classpath may change with it, rather than with the sources.
+    return (not self.get_options().include_user_classpath and
+            super(Checkstyle, self).cache_source_results)
+
   def _is_checked(self, target):
     return target.has_sources(self._JAVA_SOURCE_EXTENSION) and not target.is_synthetic
 
@@ -93,7 +103,7 @@ class Checkstyle(LintTaskMixin, NailgunTask):
     for target in targets:
       sources.update(source for source in target.sources_relative_to_buildroot()
                      if source.endswith(self._JAVA_SOURCE_EXTENSION))
-    return sources
+    return sorted(sources)
 
   def checkstyle(self, targets, sources):
     union_classpath = OrderedSet(self.tool_classpath('checkstyle'))
@@ -126,6 +136,5 @@ class Checkstyle(LintTaskMixin, NailgunTask):
       return self.runjava(classpath=union_classpath, main=self._CHECKSTYLE_MAIN,
                           jvm_options=self.get_options().jvm_options,
                           args=args + xargs, workunit_name='checkstyle')
-    checks = Xargs(call)
 
-    return checks.execute(sources)
+    return self.check_sources(call, sources)
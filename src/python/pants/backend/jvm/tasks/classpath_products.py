@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 import re
+from collections import Iterator, OrderedDict
 
 from twitter.common.collections import OrderedSet
 
@@ -144,10 +145,16 @@ def _matches_exclude(coordinate, exclude):
 
 
 def _not_excluded_filter(excludes):
+  # The same classpath entry is typically associated with many targets: check it only once.
+  excluded_by_entry = {}
+
   def not_excluded(product_to_target):
     path_tuple = product_to_target[0]
     conf, classpath_entry = path_tuple
-    return not classpath_entry.is_excluded_by(excludes)
+    excluded = excluded_by_entry.get(classpath_entry)
+    if excluded is None:
+      excluded = excluded_by_entry[classpath_entry] = classpath_entry.is_excluded_by(excludes)
+    return not excluded
   return not_excluded
 
 
@@ -160,10 +167,20 @@ class ClasspathProducts(object):
   :API: public
   """
 
-  def __init__(self, pants_workdir, classpaths=None, excludes=None):
+  # The maximum number of memoized classpath queries.
+  _MAX_MEMOIZED_QUERIES = 256
+
+  def __init__(self, pants_workdir, classpaths=None, excludes=None, interned_elements=None):
     self._classpaths = classpaths or UnionProducts()
     self._excludes = excludes or UnionProducts()
     self._pants_workdir = pants_workdir
+    # Canonical instances of the (conf, ClasspathEntry) tuples added for targets, so that an
+    # element added for many targets is stored once. This only ever grows, so may be shared by
+    # copies.
+    self._interned_elements = {} if interned_elements is None else interned_elements
+    # Memoized query results, keyed by the query, targets and `respect_excludes`. Cleared whenever
+    # the classpaths or excludes are edited.
+    self._memoized_queries = OrderedDict()
 
   @staticmethod
   def init_func(pants_workdir):
@@ -286,13 +303,16 @@ class ClasspathProducts(object):
     excludes in the original. The copy is shallow though, so edits to the copy's product values
     will mutate the original's product values.  See `UnionProducts.copy`.
 
+    The copy is copy-on-write, so copying is cheap even for large classpaths.
+
     :API: public
 
     :rtype: :class:`ClasspathProducts`
     """
     return ClasspathProducts(pants_workdir=self._pants_workdir,
                              classpaths=self._classpaths.copy(),
-                             excludes=self._excludes.copy())
+                             excludes=self._excludes.copy(),
+                             interned_elements=self._interned_elements)
 
   def add_for_targets(self, targets, classpath_elements):
     """Adds classpath path elements to the products of all the provided targets."""
@@ -331,6 +351,7 @@ class ClasspathProducts(object):
 
   def remove_for_target(self, target, classpath_elements):
     """Removes the given entries for the target."""
+    self._memoized_queries.clear()
     self._classpaths.remove_for_target(target, self._wrap_path_elements(classpath_elements))
 
   def get_for_target(self, target):
@@ -369,9 +390,11 @@ class ClasspathProducts(object):
     :rtype: list of (string, :class:`ClasspathEntry`)
     """
 
-    # remove the duplicate, preserve the ordering.
-    return list(OrderedSet([cp for cp, target in self.get_product_target_mappings_for_targets(
-                            targets, respect_excludes)]))
+    def classpath_entries():
+      # remove the duplicate, preserve the ordering.
+      return list(OrderedSet([cp for cp, target in self.get_product_target_mappings_for_targets(
+                              targets, respect_excludes)]))
+    return self._memoized_query('classpath_entries', targets, respect_excludes, classpath_entries)
 
   def get_product_target_mappings_for_targets(self, targets, respect_excludes=True):
     """Gets the classpath products-target associations for the given targets.
@@ -382,11 +405,14 @@ class ClasspathProducts(object):
     :param bool respect_excludes: `True` to respect excludes; `False` to ignore them.
     :returns: The ordered (classpath products, target) tuples.
     """
-    classpath_target_tuples = self._classpaths.get_product_target_mappings_for_targets(targets)
-    if respect_excludes:
-      return self._filter_by_excludes(classpath_target_tuples, targets)
-    else:
-      return classpath_target_tuples
+    def product_target_mappings():
+      classpath_target_tuples = self._classpaths.get_product_target_mappings_for_targets(targets)
+      if respect_excludes:
+        return self._filter_by_excludes(classpath_target_tuples, targets)
+      else:
+        return classpath_target_tuples
+    return self._memoized_query('product_target_mappings', targets, respect_excludes,
+                                product_target_mappings)
 
   def get_artifact_classpath_entries_for_targets(self, targets, respect_excludes=True):
     """Gets the artifact classpath products for the given targets.
@@ -424,19 +450,39 @@ class ClasspathProducts(object):
     """Adds the contents of other to this ClasspathProducts."""
     if self._pants_workdir != other._pants_workdir:
       raise ValueError('Other ClasspathProducts from a different pants workdir {}'.format(other._pants_workdir))
+    self._memoized_queries.clear()
     for target, products in other._classpaths._products_by_target.items():
-      self._classpaths.add_for_target(target, products)
+      self._classpaths.add_for_target(target, [self._intern(element) for element in products])
     for target, products in other._excludes._products_by_target.items():
       self._excludes.add_for_target(target, products)
 
+  def _memoized_query(self, query, targets, respect_excludes, compute):
+    """Returns a copy of the memoized result of `compute` for the given query and targets."""
+    if isinstance(targets, Iterator):
+      # The targets can only be iterated once, and so can't be both a key and an input.
+      return compute()
+
+    key = (query, tuple(targets), respect_excludes)
+    result = self._memoized_queries.pop(key, None)
+    if result is None:
+      result = compute()
+      if len(self._memoized_queries) >= self._MAX_MEMOIZED_QUERIES:
+        self._memoized_queries.popitem(last=False)
+    # Re-insert the result, to evict the least recently used queries first.
+    self._memoized_queries[key] = result
+    return list(result)
+
   def _filter_by_excludes(self, classpath_target_tuples, root_targets):
     # Excludes are always applied transitively, so regardless of whether a transitive
     # set of targets was included here, their closure must be included.
     closure = BuildGraph.closure(root_targets, bfs=True)
     excludes = self._excludes.get_for_targets(closure)
+    if not excludes:
+      return list(classpath_target_tuples)
     return filter(_not_excluded_filter(excludes), classpath_target_tuples)
 
   def _add_excludes_for_target(self, target):
+    self._memoized_queries.clear()
     if isinstance(target, ExportableJvmLibrary) and target.provides:
       self._excludes.add_for_target(target, [Exclude(target.provides.org,
                                                      target.provides.name)])
@@ -446,9 +492,13 @@ class ClasspathProducts(object):
   def _wrap_path_elements(self, classpath_elements):
     return [(element[0], ClasspathEntry(element[1])) for element in classpath_elements]
 
+  def _intern(self, element):
+    return self._interned_elements.setdefault(element, element)
+
   def _add_elements_for_target(self, target, elements):
     self._validate_classpath_tuples(elements, target)
-    self._classpaths.add_for_target(target, elements)
+    self._memoized_queries.clear()
+    self._classpaths.add_for_target(target, [self._intern(element) for element in elements])
 
   def _validate_classpath_tuples(self, classpath, target):
     """Validates that all files are located within the working directory, to simplify relativization.
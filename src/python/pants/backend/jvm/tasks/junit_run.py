@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import fnmatch
 import functools
+import glob
 import itertools
 import os
 import shutil
@@ -146,6 +147,10 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
 
     register('--batch-size', advanced=True, type=int, default=cls._BATCH_ALL, fingerprint=True,
              help='Run at most this many tests in a single test process.')
+    register('--parallel-jvms', advanced=True, type=int, default=1,
+             help='Run up to this many test processes at once, each with its own output dir. Tests '
+                  'are split into test processes by --batch-size and by the properties of their '
+                  'targets, like cwd, platform, jvm options and environment variables.')
     register('--test', type=list, fingerprint=True,
              help='Force running of just these tests.  Tests can be specified using any of: '
                   '[classname], [classname]#[methodname], [filename] or [filename]#[methodname]')
@@ -314,13 +319,17 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
     :param Executor executor: the java subprocess executor to use. If not specified, construct
       using the distribution.
     :param Distribution distribution: The JDK or JRE installed.
+    :param env_vars: An optional sequence of (name, value) pairs of extra environment variables for
+      the process. They are only set while the process is spawned, since other test processes may
+      be spawned while it runs.
     :rtype: ProcessHandler
     """
 
     actual_executor = executor or SubprocessExecutor(distribution)
-    return distribution.execute_java_async(*args,
-                                           executor=actual_executor,
-                                           **kwargs)
+    with environment_as(**dict(kwargs.pop('env_vars', ()))):
+      return distribution.execute_java_async(*args,
+                                             executor=actual_executor,
+                                             **kwargs)
 
   def execute_java_for_coverage(self, targets, *args, **kwargs):
     """Execute java for targets directly and don't use the test mixin.
@@ -392,6 +401,11 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
   def _batched(self):
     return self._batch_size != self._BATCH_ALL
 
+  @property
+  def _batch_output_dirs(self):
+    # Concurrent batches must not share an output dir.
+    return self._batched or self.get_options().parallel_jvms > 1
+
   def run_tests(self, fail_fast, test_targets, output_dir, coverage):
     test_registry = self._collect_test_targets(test_targets)
     if test_registry.empty:
@@ -409,12 +423,21 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
     # back to runtime_classpath
     classpath_product = self.context.products.get_data('instrument_classpath')
 
-    result = 0
-    for batch_id, (properties, batch) in enumerate(self._iter_batches(test_registry)):
+    batches = [(batch_id, properties, batch)
+               for batch_id, (properties, batch) in enumerate(self._iter_batches(test_registry))]
+    parallel_jvms = min(self.get_options().parallel_jvms, len(batches))
+    results = []
+
+    # Batches are numbered per run, and a prior run may have run different tests: remove its batch
+    # output dirs, so that its results are not reported as this run's.
+    for stale_batch_output_dir in glob.glob(os.path.join(output_dir, 'batch-*')):
+      safe_rmtree(stale_batch_output_dir)
+
+    def run_batch(batch_id, properties, batch):
       (workdir, platform, target_jvm_options, target_env_vars, concurrency, threads) = properties
 
       batch_output_dir = output_dir
-      if self._batched:
+      if self._batch_output_dirs:
         batch_output_dir = os.path.join(batch_output_dir, 'batch-{}'.format(batch_id))
 
       run_modifications = coverage.run_modifications(batch_output_dir)
@@ -455,35 +478,42 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
         with self._chroot(relevant_targets, workdir) as chroot:
           self.context.log.debug('CWD = {}'.format(chroot))
           self.context.log.debug('platform = {}'.format(platform))
-          with environment_as(**dict(target_env_vars)):
-            subprocess_result = self._spawn_and_wait(
-              executor=SubprocessExecutor(distribution),
-              distribution=distribution,
-              classpath=complete_classpath,
-              main=JUnit.RUNNER_MAIN,
-              jvm_options=self.jvm_options + extra_jvm_options + list(target_jvm_options),
-              args=args + batch_tests,
-              workunit_factory=self.context.new_workunit,
-              workunit_name='run',
-              workunit_labels=[WorkUnitLabel.TEST],
-              cwd=chroot,
-              synthetic_jar_dir=batch_output_dir,
-              create_synthetic_jar=self.synthetic_classpath,
-            )
-            self.context.log.debug('JUnit subprocess exited with result ({})'
-                                   .format(subprocess_result))
-            result += abs(subprocess_result)
-
-        tests_info = self.parse_test_info(batch_output_dir, parse_error_handler, ['classname'])
-        for test_name, test_info in tests_info.items():
-          test_item = Test(test_info['classname'], test_name)
-          test_target = test_registry.get_owning_target(test_item)
-          self.report_all_info_for_single_test(self.options_scope, test_target,
-                                               test_name, test_info)
-
-        if result != 0 and fail_fast:
+          subprocess_result = self._spawn_and_wait(
+            executor=SubprocessExecutor(distribution),
+            distribution=distribution,
+            classpath=complete_classpath,
+            main=JUnit.RUNNER_MAIN,
+            jvm_options=self.jvm_options + extra_jvm_options + list(target_jvm_options),
+            args=args + batch_tests,
+            workunit_factory=self.context.new_workunit,
+            workunit_name='run',
+            workunit_labels=[WorkUnitLabel.TEST],
+            cwd=chroot,
+            synthetic_jar_dir=batch_output_dir,
+            create_synthetic_jar=self.synthetic_classpath,
+            env_vars=target_env_vars,
+          )
+          self.context.log.debug('JUnit subprocess exited with result ({})'
+                                 .format(subprocess_result))
+          results.append(abs(subprocess_result))
+
+      tests_info = self.parse_test_info(batch_output_dir, parse_error_handler, ['classname'])
+      for test_name, test_info in tests_info.items():
+        test_item = Test(test_info['classname'], test_name)
+        test_target = test_registry.get_owning_target(test_item)
+        self.report_all_info_for_single_test(self.options_scope, test_target,
+                                             test_name, test_info)
+
+      return subprocess_result == 0
+
+    if parallel_jvms > 1:
+      self._run_concurrently('batches', run_batch, batches, parallel_jvms, fail_fast)
+    else:
+      for batch_args in batches:
+        if not run_batch(*batch_args) and fail_fast:
           break
 
+    result = sum(results)
     if result == 0:
       return TestResult.rc(0)
 
@@ -612,6 +642,9 @@ class JUnitRun(PartitionedTestRunnerTaskMixin, JvmToolTaskMixin, JvmTask):
     run_dir = '_runs'
     mode_dir = 'isolated' if per_target else 'combined'
     batch_dir = str(self._batch_size) if self._batched else 'all'
+    if self._batch_output_dirs and not self._batched:
+      # Keep results written to batch output dirs apart from those written to the output dir itself.
+      batch_dir = '{}-parallel'.format(batch_dir)
     output_dir = os.path.join(self.workdir,
                               run_dir,
                               Target.identify(all_targets),
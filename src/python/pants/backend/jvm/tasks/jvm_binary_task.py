@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 from contextlib import contextmanager
+from hashlib import sha1
 
 from twitter.common.collections.orderedset import OrderedSet
 
@@ -17,6 +18,7 @@ from pants.base.exceptions import TaskError
 from pants.build_graph.target_scopes import Scopes
 from pants.java.util import execute_runner
 from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_concurrent_creation, safe_rm_oldest_items_in_dir
 from pants.util.fileutil import atomic_copy
 from pants.util.memo import memoized_property
 
@@ -101,9 +103,8 @@ class JvmBinaryTask(JarBuilderTask):
           # in general, at least efficiently.
           with self.context.new_workunit(name='add-dependency-jars'):
             dependencies = self.list_external_jar_dependencies(binary)
-            for jar, coordinate in dependencies:
-              self.context.log.debug('  dumping {} from {}'.format(coordinate, jar))
-              monolithic_jar.writejar(jar)
+            if dependencies:
+              monolithic_jar.writejar(self._external_jars_jar(binary, dependencies))
 
         yield monolithic_jar
 
@@ -111,6 +112,50 @@ class JvmBinaryTask(JarBuilderTask):
         with self.context.new_workunit('shade-monolithic-jar'):
           self.shade_jar(binary.shading_rules, jar_path=path)
 
+  # The number of stale merged external jars to keep per binary, besides the one in use.
+  _STALE_MERGED_JARS_TO_KEEP = 1
+
+  def _external_jars_jar(self, binary, dependencies):
+    """Returns the path of a jar holding the contents of the given external jars.
+
+    Since the jar tool applies the binary's deploy jar rules to the merged jar just as it would to
+    the external jars themselves, the merged jar can stand in for them in a monolithic jar. It is
+    kept in the workdir keyed by the jars it holds, so that when only a binary's internal classes
+    change, rebuilding its monolithic jar reads one pre-merged jar rather than every external jar.
+
+    :param binary: The jvm_binary target the external jars are for.
+    :param dependencies: A list of (jar path, coordinate) tuples as returned by
+                         `list_external_jar_dependencies`.
+    :returns: The path of the merged jar.
+    """
+    hasher = sha1()
+    hasher.update(binary.deploy_jar_rules.fingerprint())
+    for jar, coordinate in dependencies:
+      stat = os.stat(jar)
+      hasher.update('{}\0{}\0{}\0{}\n'.format(jar, coordinate, stat.st_size, stat.st_mtime))
+
+    jars_dir = os.path.join(self.workdir, 'external-jars', binary.id)
+    path = os.path.join(jars_dir, '{}.jar'.format(hasher.hexdigest()))
+    if os.path.exists(path):
+      self.context.log.debug('  reusing external jars of {} from {}'.format(binary.address.spec,
+                                                                           path))
+      return path
+
+    with self.context.new_workunit(name='merge-dependency-jars'):
+      with safe_concurrent_creation(path) as tmp_path:
+        with self.open_jar(tmp_path,
+                           jar_rules=binary.deploy_jar_rules,
+                           overwrite=True,
+                           compressed=True) as external_jars_jar:
+          for jar, coordinate in dependencies:
+            self.context.log.debug('  dumping {} from {}'.format(coordinate, jar))
+            external_jars_jar.writejar(jar)
+    # Don't prune the jar in use, nor any merged jar still being created by a concurrent bundle.
+    excludes = frozenset([path] + [os.path.join(jars_dir, name) for name in os.listdir(jars_dir)
+                                   if not name.endswith('.jar')])
+    safe_rm_oldest_items_in_dir(jars_dir, self._STALE_MERGED_JARS_TO_KEEP, excludes=excludes)
+    return path
+
   @memoized_property
   def shader(self):
     return Shader.Factory.create(self.context)
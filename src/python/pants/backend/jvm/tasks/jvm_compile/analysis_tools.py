@@ -11,6 +11,15 @@ import shutil
 from pants.util.contextutil import temporary_dir
 
 
+def call_localize(tup):
+  """Importable helper for multi-proc calling of AnalysisTools.localize on an instance.
+
+  :param tup: A tuple of an AnalysisTools instance and args for AnalysisTools.localize.
+  """
+  analysis_tools, src_analysis, localized_analysis = tup
+  analysis_tools.localize(src_analysis, localized_analysis)
+
+
 class AnalysisTools(object):
   """Analysis manipulation methods required by JvmCompile."""
   _PANTS_BUILDROOT_PLACEHOLDER = b'/_PANTS_BUILDROOT_PLACEHOLDER'
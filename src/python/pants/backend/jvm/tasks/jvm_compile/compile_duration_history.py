@@ -0,0 +1,102 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import json
+import logging
+import os
+import threading
+
+from pants.util.dirutil import safe_concurrent_creation
+
+
+logger = logging.getLogger(__name__)
+
+
+class CompileDurationHistory(object):
+  """Records how long each target took to fully compile, so that later compiles can be prioritized.
+
+  Durations are persisted as a JSON object of target id to seconds, and are used by
+  `estimate_sizes` in place of a size estimator's output for targets that have been compiled before.
+  """
+
+  def __init__(self, path):
+    """
+    :param str path: The file in which durations are persisted between runs.
+    """
+    self._path = path
+    self._durations = None
+    self._recorded = {}
+    self._lock = threading.Lock()
+
+  def _loaded_durations(self):
+    if self._durations is None:
+      self._durations = self._load()
+    return self._durations
+
+  def _load(self):
+    if not os.path.isfile(self._path):
+      return {}
+    try:
+      with open(self._path, 'rb') as fp:
+        durations = json.load(fp)
+      return {target_id: float(seconds) for target_id, seconds in durations.items()}
+    except (IOError, ValueError, AttributeError, TypeError) as e:
+      logger.debug('Ignoring unreadable compile durations in {}: {}'.format(self._path, e))
+      return {}
+
+  def record(self, target_id, seconds):
+    """Records the duration of a full (non-incremental) compile of the given target.
+
+    Safe to call from worker threads.
+    """
+    with self._lock:
+      self._recorded[target_id] = seconds
+
+  def estimate_sizes(self, estimates):
+    """Returns the given job size estimates with the sizes of previously compiled targets replaced.
+
+    Targets with a recorded duration are sized by it. The remaining targets keep their estimates,
+    scaled into seconds by the ratio of recorded durations to estimates across the targets that do
+    have a recorded duration, so that both kinds of size are comparable along a critical path.
+
+    :param dict estimates: A dict of target id to the size estimator's estimate for that target.
+    :returns: A dict of target id to job size.
+    """
+    with self._lock:
+      durations = dict(self._loaded_durations())
+      durations.update(self._recorded)
+
+    known = [target_id for target_id in estimates if target_id in durations]
+    if not known:
+      return dict(estimates)
+
+    known_duration = sum(durations[target_id] for target_id in known)
+    known_estimate = sum(estimates[target_id] for target_id in known)
+
+    def scaled(estimate):
+      if known_estimate:
+        return estimate * known_duration / known_estimate
+      # No estimate to scale by: assume an unseen target is as slow as the average seen one.
+      return known_duration / len(known)
+
+    return {target_id: durations[target_id] if target_id in durations else scaled(estimate)
+            for target_id, estimate in estimates.items()}
+
+  def save(self):
+    """Persists the durations recorded since the last save."""
+    with self._lock:
+      if not self._recorded:
+        return
+      # Re-read the file, to retain durations recorded by concurrent runs for other targets.
+      durations = self._load()
+      durations.update(self._recorded)
+      self._durations = durations
+      self._recorded = {}
+
+    with safe_concurrent_creation(self._path) as tmp_path:
+      with open(tmp_path, 'wb') as fp:
+        json.dump(durations, fp)
@@ -21,9 +21,11 @@ from pants.backend.jvm.targets.javac_plugin import JavacPlugin
 from pants.backend.jvm.targets.jvm_target import JvmTarget
 from pants.backend.jvm.targets.scalac_plugin import ScalacPlugin
 from pants.backend.jvm.tasks.classpath_util import ClasspathUtil
+from pants.backend.jvm.tasks.jvm_compile.analysis_tools import call_localize
 from pants.backend.jvm.tasks.jvm_compile.class_not_found_error_patterns import \
   CLASS_NOT_FOUND_ERROR_PATTERNS
 from pants.backend.jvm.tasks.jvm_compile.compile_context import CompileContext, DependencyContext
+from pants.backend.jvm.tasks.jvm_compile.compile_duration_history import CompileDurationHistory
 from pants.backend.jvm.tasks.jvm_compile.execution_graph import (ExecutionFailure, ExecutionGraph,
                                                                  Job)
 from pants.backend.jvm.tasks.jvm_compile.missing_dependency_finder import (CompileErrorExtractor,
@@ -169,6 +171,10 @@ class JvmCompile(NailgunTaskBase):
                   'constraints). Choose \'random\' to choose random sizes for each target, which '
                   'may be useful for distributed builds.')
 
+    register('--historical-job-sizes', advanced=True, type=bool, default=True,
+             help='Size targets by how long they took to compile in previous runs, and use the '
+                  'size estimator only for targets that have not been compiled before.')
+
     register('--capture-log', advanced=True, type=bool,
              fingerprint=True,
              help='Capture compilation output to per-target logs.')
@@ -382,6 +388,12 @@ class JvmCompile(NailgunTaskBase):
                                           dict(include_scopes=Scopes.JVM_COMPILE_SCOPES,
                                                respect_intransitive=True))
 
+  @memoized_property
+  def _compile_duration_history(self):
+    if not self.get_options().historical_job_sizes:
+      return None
+    return CompileDurationHistory(os.path.join(self.workdir, 'compile_durations.json'))
+
   @property
   def _unused_deps_check_enabled(self):
     return self.get_options().unused_deps != 'ignore'
@@ -555,6 +567,9 @@ class JvmCompile(NailgunTaskBase):
       exec_graph.execute(worker_pool, self.context.log)
     except ExecutionFailure as e:
       raise TaskError("Compilation failure: {}".format(e))
+    finally:
+      if self._compile_duration_history:
+        self._compile_duration_history.save()
 
   def _record_compile_classpath(self, classpath, targets, outdir):
     relative_classpaths = [fast_relpath(path, self.get_options().pants_workdir) for path in classpath]
@@ -675,10 +690,17 @@ class JvmCompile(NailgunTaskBase):
   def check_artifact_cache(self, vts):
     """Localizes the fetched analysis for targets we found in the cache."""
     def post_process(cached_vts):
+      localize_args = []
       for vt in cached_vts:
         cc = self._compile_context(vt.target, vt.results_dir)
         safe_delete(cc.analysis_file)
-        self._analysis_tools.localize(cc.portable_analysis_file, cc.analysis_file)
+        localize_args.append((self._analysis_tools, cc.portable_analysis_file, cc.analysis_file))
+      # Rebasing is CPU bound, so localize the analysis for many targets in subprocesses.
+      if len(localize_args) > 1:
+        self.context.subproc_map(call_localize, localize_args)
+      else:
+        for args in localize_args:
+          call_localize(args)
     return self.do_check_artifact_cache(vts, post_process_cached_vts=post_process)
 
   def _create_empty_products(self):
@@ -939,6 +961,10 @@ class JvmCompile(NailgunTaskBase):
                             fatal_warnings,
                             zinc_file_manager,
                             counter)
+        # An incremental compile may only recompile a few sources, and so says little about how long
+        # the next compile of the target will take: only record full compiles.
+        if self._compile_duration_history and not is_incremental:
+          self._compile_duration_history.record(tgt.id, timer.elapsed)
         self._record_target_stats(tgt,
                                   len(cp_entries),
                                   len(ctx.sources),
@@ -959,6 +985,11 @@ class JvmCompile(NailgunTaskBase):
       if not hit_cache and self._unused_deps_check_enabled:
         self._check_unused_deps(ctx)
 
+    job_sizes = {ivts.target.id: self._size_estimator(compile_contexts[ivts.target].sources)
+                 for ivts in invalid_vts}
+    if self._compile_duration_history:
+      job_sizes = self._compile_duration_history.estimate_sizes(job_sizes)
+
     jobs = []
     invalid_target_set = set(invalid_targets)
     for ivts in invalid_vts:
@@ -971,7 +1002,7 @@ class JvmCompile(NailgunTaskBase):
       jobs.append(Job(self.exec_graph_key_for_target(compile_target),
                       functools.partial(work_for_vts, ivts, compile_context),
                       [self.exec_graph_key_for_target(target) for target in invalid_dependencies],
-                      self._size_estimator(compile_context.sources),
+                      job_sizes[compile_target.id],
                       # If compilation and analysis work succeeds, validate the vts.
                       # Otherwise, fail it.
                       on_success=ivts.update,
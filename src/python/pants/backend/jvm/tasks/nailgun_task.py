@@ -53,12 +53,23 @@ class NailgunTaskBase(JvmToolTaskMixin, TaskBase):
     self._executor_workdir = os.path.join(self.context.options.for_global_scope().pants_workdir,
                                           *id_tuple)
 
+  @property
+  def use_nailgun(self):
+    """Return `True` if java should be run in this task's nailgun server.
+
+    Subclasses that run java concurrently should override this to return `False`, since this task
+    has a single nailgun server.
+
+    :API: public
+    """
+    return self.get_options().use_nailgun
+
   def create_java_executor(self):
     """Create java executor that uses this task's ng daemon, if allowed.
 
     Call only in execute() or later. TODO: Enforce this.
     """
-    if self.get_options().use_nailgun:
+    if self.use_nailgun:
       classpath = os.pathsep.join(self.tool_classpath('nailgun-server'))
       return NailgunExecutor(self._identity,
                              self._executor_workdir,
@@ -84,7 +95,7 @@ class NailgunTaskBase(JvmToolTaskMixin, TaskBase):
     # Creating synthetic jar to work around system arg length limit is not necessary
     # when `NailgunExecutor` is used because args are passed through socket, therefore turning off
     # creating synthetic jar if nailgun is used.
-    create_synthetic_jar = not self.get_options().use_nailgun
+    create_synthetic_jar = not self.use_nailgun
     try:
       return util.execute_java(classpath=classpath,
                                main=main,
@@ -11,12 +11,12 @@ from abc import abstractmethod, abstractproperty
 from pants.backend.jvm.tasks.nailgun_task import NailgunTask
 from pants.base.build_environment import get_buildroot
 from pants.base.exceptions import TaskError
-from pants.process.xargs import Xargs
+from pants.task.sharded_source_check_mixin import ShardedSourceCheckMixin
 from pants.util.memo import memoized_property
 from pants.util.meta import AbstractClass
 
 
-class RewriteBase(NailgunTask, AbstractClass):
+class RewriteBase(ShardedSourceCheckMixin, NailgunTask, AbstractClass):
   """Abstract base class for JVM-based tools that check/rewrite sources."""
 
   @classmethod
@@ -49,6 +49,15 @@ class RewriteBase(NailgunTask, AbstractClass):
   def cache_target_dirs(self):
     return not self.sideeffecting
 
+  @property
+  def use_nailgun(self):
+    return not self.sharded and super(RewriteBase, self).use_nailgun
+
+  @property
+  def cache_source_results(self):
+    # Sources rewritten in place are not known to be clean until they are checked again.
+    return not self.sideeffecting and super(RewriteBase, self).cache_source_results
+
   def execute(self):
     """Runs the tool on all source files that are located."""
     relevant_targets = self._get_non_synthetic_targets(self.get_targets())
@@ -66,7 +75,8 @@ class RewriteBase(NailgunTask, AbstractClass):
     if not target_sources:
       return
 
-    result = Xargs(self._invoke_tool_in_place).execute(target_sources)
+    result = self.check_sources(self._invoke_tool_in_place, target_sources,
+                                source_path=lambda target_source: target_source[1])
     if result != 0:
       raise TaskError('{} is improperly implemented: a failed process '
                       'should raise an exception earlier.'.format(type(self).__name__))
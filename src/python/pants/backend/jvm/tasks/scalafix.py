@@ -53,6 +53,11 @@ class ScalaFix(RewriteBase):
     if options.semantic:
       round_manager.require_data('runtime_classpath')
 
+  @property
+  def cache_source_results(self):
+    # Semantic rules inspect the compiled classpath of the checked targets.
+    return not self.get_options().semantic and super(ScalaFix, self).cache_source_results
+
   def _compute_classpath(self, targets):
     classpaths = self.context.products.get_data('runtime_classpath')
     return [entry for _, entry in classpaths.get_for_targets(targets)]
@@ -13,8 +13,8 @@ from pants.backend.jvm.tasks.nailgun_task import NailgunTask
 from pants.base.exceptions import TaskError
 from pants.build_graph.target import Target
 from pants.option.custom_types import file_option
-from pants.process.xargs import Xargs
 from pants.task.lint_task_mixin import LintTaskMixin
+from pants.task.sharded_source_check_mixin import ShardedSourceCheckMixin
 from pants.util.dirutil import touch
 
 
@@ -41,7 +41,7 @@ class FileExcluder(object):
     return True
 
 
-class Scalastyle(LintTaskMixin, NailgunTask):
+class Scalastyle(LintTaskMixin, ShardedSourceCheckMixin, NailgunTask):
   """Checks scala source files to ensure they're stylish.
 
   Scalastyle only checks scala sources in non-synthetic targets.
@@ -119,6 +119,10 @@ class Scalastyle(LintTaskMixin, NailgunTask):
   def cache_target_dirs(self):
     return True
 
+  @property
+  def use_nailgun(self):
+    return not self.sharded and super(Scalastyle, self).use_nailgun
+
   def execute(self):
     # Don't even try and validate options if we're irrelevant.
     targets = self.get_non_synthetic_scala_targets(self.get_targets())
@@ -159,7 +163,7 @@ class Scalastyle(LintTaskMixin, NailgunTask):
                               jvm_options=self.get_options().jvm_options,
                               args=scalastyle_args + srcs)
 
-        result = Xargs(call).execute(scala_sources)
+        result = self.check_sources(call, scala_sources)
         if result != 0:
           raise TaskError('java {entry} ... exited non-zero ({exit_code})'.format(
             entry=Scalastyle._MAIN, exit_code=result))
@@ -92,16 +92,35 @@ class ZincAnalysisParser(object):
       with open(outfile_path, 'wb') as outfile:
         self.rebase(infile, outfile, rebase_mappings, java_home)
 
+  # The number of items rebased at once: sections are streamed through in chunks of this size.
+  _REBASE_CHUNK_SIZE = 10000
+
   def rebase(self, infile, outfile, rebase_mappings, java_home=None):
     self._verify_version(infile)
     outfile.write(ZincAnalysis.FORMAT_VERSION_LINE)
 
-    # Ensure we replace the longest match first, since the shorter one might be prefix of the longer.
-    rebase_mappings_sorted = [(old_base, rebase_mappings[old_base])
-                              for old_base in sorted(rebase_mappings, key=len, reverse=True)]
+    if rebase_mappings:
+      # A single regex matching any of the old bases. Alternatives are tried in order, so we list
+      # the longest first, since the shorter one might be prefix of the longer.
+      old_bases = b'|'.join(re.escape(old_base)
+                            for old_base in sorted(rebase_mappings, key=len, reverse=True))
+      anywhere_re = re.compile(old_bases)
+      prefix_re = re.compile(b'^(?:' + old_bases + b')', re.MULTILINE)
+      new_base = lambda match: rebase_mappings[match.group(0)]
+      rebase_anywhere = lambda text: anywhere_re.sub(new_base, text)
+      rebase_prefix = lambda text: prefix_re.sub(new_base, text)
+    else:
+      rebase_anywhere = rebase_prefix = None
+
     def rebase_element(cls):
       for header in cls.headers:
-        self._rebase_section(cls, header, infile, outfile, rebase_mappings_sorted, java_home)
+        if header in cls.pants_home_anywhere:
+          rebase_text = rebase_anywhere
+        elif header in cls.pants_home_prefix_only:
+          rebase_text = rebase_prefix
+        else:
+          rebase_text = None
+        self._rebase_section(cls, header, infile, outfile, rebase_text, java_home)
 
     rebase_element(CompileSetup)
     rebase_element(Relations)
@@ -110,10 +129,13 @@ class ZincAnalysisParser(object):
     rebase_element(SourceInfos)
     rebase_element(Compilations)
 
-  def _rebase_section(self, cls, header, lines_iter, outfile, rebase_mappings, java_home=None):
-    # Booleans describing the rebasing logic to apply, if any.
-    rebase_pants_home_anywhere = header in cls.pants_home_anywhere
-    rebase_pants_home_prefix = header in cls.pants_home_prefix_only
+  def _rebase_section(self, cls, header, lines_iter, outfile, rebase_text, java_home=None):
+    """Rebase a single section, a chunk of items at a time.
+
+    :param rebase_text: A function that rebases a block of whole lines, or None if the section
+                        needs no rebasing.
+    """
+    # Booleans describing the dropping logic to apply, if any.
     filter_java_home_anywhere = java_home and header in cls.java_home_anywhere
     filter_java_home_prefix = java_home and header in cls.java_home_prefix_only
 
@@ -123,36 +145,47 @@ class ZincAnalysisParser(object):
       raise self.ParseError('Expected: "{}:". Found: "{}"'.format(header, line))
     n = self._parse_num_items(next(lines_iter))
 
-    # Iterate over the lines, applying rebasing/dropping logic as required.
-    rebased_lines = []
-    num_rebased_items = 0
-    for _ in range(n):
-      line = next(lines_iter)
-      drop_line = ((filter_java_home_anywhere and java_home in line) or
-                   (filter_java_home_prefix and line.startswith(java_home)))
-      if not drop_line:
-        rebased_line = line
-        if rebase_pants_home_anywhere:
-          for rebased_from, rebased_to in rebase_mappings:
-            rebased_line = rebased_line.replace(rebased_from, rebased_to)
-        elif rebase_pants_home_prefix:
-          for rebased_from, rebased_to in rebase_mappings:
-            if line.startswith(rebased_from):
-              rebased_line = rebased_to + line[len(rebased_from):]
-              break
-        rebased_lines.append(rebased_line)
-        num_rebased_items += 1
-        if not cls.inline_vals:  # These values are blobs and never need to be rebased.
-          rebased_lines.append(next(lines_iter))
-      elif not cls.inline_vals:
-        next(lines_iter)  # Also drop the non-inline value.
-
-    # Write the rebased lines back out.
-    outfile.write(header + b':\n')
-    outfile.write(b'{} items\n'.format(num_rebased_items))
-    chunk_size = 10000
-    for i in range(0, len(rebased_lines), chunk_size):
-      outfile.write(b''.join(rebased_lines[i:i+chunk_size]))
+    def rebased_chunks():
+      """Yields (number of items, rebased text) for each chunk of the section's items."""
+      remaining = n
+      while remaining:
+        chunk_size = min(remaining, self._REBASE_CHUNK_SIZE)
+        remaining -= chunk_size
+        keys = []
+        vals = []
+        for _ in range(chunk_size):
+          line = next(lines_iter)
+          val = None if cls.inline_vals else next(lines_iter)
+          if ((filter_java_home_anywhere and java_home in line) or
+              (filter_java_home_prefix and line.startswith(java_home))):
+            continue
+          keys.append(line)
+          if val is not None:
+            vals.append(val)
+
+        if cls.inline_vals:
+          text = b''.join(keys)
+          yield len(keys), rebase_text(text) if rebase_text else text
+        else:
+          # The values are blobs and never need to be rebased.
+          if rebase_text:
+            keys = [rebase_text(key) for key in keys]
+          yield len(keys), b''.join(line for item in zip(keys, vals) for line in item)
+
+    def write_header(num_items):
+      outfile.write(header + b':\n')
+      outfile.write(b'{} items\n'.format(num_items))
+
+    if filter_java_home_anywhere or filter_java_home_prefix:
+      # Dropping lines changes the number of items, which must be written before them.
+      chunks = list(rebased_chunks())
+      write_header(sum(num_items for num_items, _ in chunks))
+      for _, text in chunks:
+        outfile.write(text)
+    else:
+      write_header(n)
+      for _, text in rebased_chunks():
+        outfile.write(text)
 
   def _find_repeated_at_header(self, lines_iter, header):
     header_line = header + b':\n'
@@ -5,11 +5,6 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.backend.project_info.tasks.dependencies import Dependencies
-from pants.backend.project_info.tasks.depmap import Depmap
-from pants.backend.project_info.tasks.export import Export
-from pants.backend.project_info.tasks.filedeps import FileDeps
-from pants.backend.project_info.tasks.idea_plugin_gen import IdeaPluginGen
 from pants.goal.task_registrar import TaskRegistrar as task
 
 
@@ -18,9 +13,12 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='idea-plugin', action=IdeaPluginGen).install()
-  task(name='export', action=Export).install()
+  task(name='idea-plugin',
+       action='pants.backend.project_info.tasks.idea_plugin_gen:IdeaPluginGen').install()
+  task(name='export', action='pants.backend.project_info.tasks.export:Export').install()
 
-  task(name='depmap', action=Depmap).install()
-  task(name='dependencies', action=Dependencies).install()
-  task(name='filedeps', action=FileDeps).install('filedeps')
+  task(name='depmap', action='pants.backend.project_info.tasks.depmap:Depmap').install()
+  task(name='dependencies',
+       action='pants.backend.project_info.tasks.dependencies:Dependencies').install()
+  task(name='filedeps',
+       action='pants.backend.project_info.tasks.filedeps:FileDeps').install('filedeps')
@@ -14,18 +14,7 @@ from pants.backend.python.targets.python_distribution import PythonDistribution
 from pants.backend.python.targets.python_library import PythonLibrary
 from pants.backend.python.targets.python_requirement_library import PythonRequirementLibrary
 from pants.backend.python.targets.python_tests import PythonTests
-from pants.backend.python.tasks.build_local_python_distributions import \
-  BuildLocalPythonDistributions
-from pants.backend.python.tasks.gather_sources import GatherSources
-from pants.backend.python.tasks.pytest_prep import PytestPrep
-from pants.backend.python.tasks.pytest_run import PytestRun
-from pants.backend.python.tasks.python_binary_create import PythonBinaryCreate
-from pants.backend.python.tasks.python_isort import IsortPythonTask
-from pants.backend.python.tasks.python_repl import PythonRepl
-from pants.backend.python.tasks.python_run import PythonRun
-from pants.backend.python.tasks.resolve_requirements import ResolveRequirements
-from pants.backend.python.tasks.select_interpreter import SelectInterpreter
-from pants.backend.python.tasks.setup_py import SetupPy, create_setup_py_rules
+from pants.backend.python.tasks.setup_py import create_setup_py_rules
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.build_graph.resources import Resources
 from pants.goal.task_registrar import TaskRegistrar as task
@@ -54,17 +43,27 @@ def build_file_aliases():
 
 
 def register_goals():
-  task(name='interpreter', action=SelectInterpreter).install('pyprep')
-  task(name='build-local-dists', action=BuildLocalPythonDistributions).install('pyprep')
-  task(name='requirements', action=ResolveRequirements).install('pyprep')
-  task(name='sources', action=GatherSources).install('pyprep')
-  task(name='py', action=PythonRun).install('run')
-  task(name='pytest-prep', action=PytestPrep).install('test')
-  task(name='pytest', action=PytestRun).install('test')
-  task(name='py', action=PythonRepl).install('repl')
-  task(name='setup-py', action=SetupPy).install()
-  task(name='py', action=PythonBinaryCreate).install('binary')
-  task(name='isort', action=IsortPythonTask).install('fmt')
+  task(name='interpreter',
+       action='pants.backend.python.tasks.select_interpreter:SelectInterpreter').install('pyprep')
+  task(name='build-local-dists',
+       action='pants.backend.python.tasks.build_local_python_distributions:'
+              'BuildLocalPythonDistributions').install('pyprep')
+  task(name='requirements',
+       action='pants.backend.python.tasks.resolve_requirements:'
+              'ResolveRequirements').install('pyprep')
+  task(name='sources',
+       action='pants.backend.python.tasks.gather_sources:GatherSources').install('pyprep')
+  task(name='py', action='pants.backend.python.tasks.python_run:PythonRun').install('run')
+  task(name='pytest-prep',
+       action='pants.backend.python.tasks.pytest_prep:PytestPrep').install('test')
+  task(name='pytest', action='pants.backend.python.tasks.pytest_run:PytestRun').install('test')
+  task(name='py', action='pants.backend.python.tasks.python_repl:PythonRepl').install('repl')
+  task(name='setup-py', action='pants.backend.python.tasks.setup_py:SetupPy').install()
+  task(name='py',
+       action='pants.backend.python.tasks.python_binary_create:'
+              'PythonBinaryCreate').install('binary')
+  task(name='isort',
+       action='pants.backend.python.tasks.python_isort:IsortPythonTask').install('fmt')
 
 
 def rules():
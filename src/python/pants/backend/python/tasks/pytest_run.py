@@ -30,7 +30,7 @@ from pants.base.workunit import WorkUnitLabel
 from pants.build_graph.target import Target
 from pants.task.task import Task
 from pants.task.testrunner_task_mixin import PartitionedTestRunnerTaskMixin, TestResult
-from pants.util.contextutil import environment_as, pushd, temporary_dir, temporary_file
+from pants.util.contextutil import pushd, temporary_dir, temporary_file
 from pants.util.dirutil import mergetree, safe_mkdir, safe_mkdir_for
 from pants.util.memo import memoized_method, memoized_property
 from pants.util.objects import datatype
@@ -125,6 +125,12 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
              help='Subset of tests to run, in the form M/N, 0 <= M < N. For example, 1/3 means '
                   'run tests number 2, 5, 8, 11, ...')
 
+    register('--parallelism', advanced=True, type=int, default=1,
+             help='The number of test partitions to run concurrently. With --no-fast, where each '
+                  'target is its own partition, this is the number of concurrent pytest '
+                  'processes. When greater than 1, the coverage data of all partitions is also '
+                  'merged into a single report.')
+
   @classmethod
   def supports_passthru_args(cls):
     return True
@@ -192,12 +198,16 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
     cp.set(plugin_module, 'src_chroot_path', src_chroot_path)
     cp.set(plugin_module, 'src_to_target_base', json.dumps(src_to_target_base))
 
-  def _generate_coverage_config(self, src_to_target_base):
+  def _generate_coverage_config(self, src_to_target_base, data_file):
     cp = configparser.SafeConfigParser()
     cp.readfp(StringIO(self.DEFAULT_COVERAGE_CONFIG))
 
     self._add_plugin_config(cp, self._source_chroot_path, src_to_target_base)
 
+    # Keep coverage data with the partition's results rather than in the (possibly shared) cwd.
+    self._ensure_section(cp, 'run')
+    cp.set('run', 'data_file', data_file)
+
     # See the debug options here: http://nedbatchelder.com/code/coverage/cmd.html#cmd-run-debug
     if self._debug:
       debug_options = self._format_string_list([
@@ -217,36 +227,67 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
       or name.startswith('COVERAGE_')  # These are from `coverage`.
     )
 
-  @contextmanager
-  def _scrub_cov_env_vars(self):
-    cov_env_vars = {k: v for k, v in os.environ.items() if self._is_coverage_env_var(k)}
+  def _scrub_cov_env_vars(self, env):
+    """Returns a copy of the given environment without coverage environment variables.
+
+    NB: The environment is scrubbed in a copy passed to the test process rather than in
+    `os.environ`, since partitions may run concurrently.
+    """
+    cov_env_vars = {k: v for k, v in env.items() if self._is_coverage_env_var(k)}
     if cov_env_vars:
       self.context.log.warn('Scrubbing coverage environment variables\n\t{}'
                             .format('\n\t'.join(sorted('{}={}'.format(k, v)
                                                        for k, v in cov_env_vars.items()))))
-      with environment_as(**{k: None for k in cov_env_vars}):
-        yield
-    else:
-      yield
+    return {k: v for k, v in env.items() if k not in cov_env_vars}
 
   @contextmanager
-  def _cov_setup(self, workdirs, coverage_morfs, src_to_target_base):
-    cp = self._generate_coverage_config(src_to_target_base=src_to_target_base)
+  def _coverage_rc(self, root_dir, src_to_target_base, data_file):
+    cp = self._generate_coverage_config(src_to_target_base=src_to_target_base, data_file=data_file)
     # Note that it's important to put the tmpfile under the workdir, because pytest
     # uses all arguments that look like paths to compute its rootdir, and we want
     # it to pick the buildroot.
-    with temporary_file(root_dir=workdirs.root_dir) as fp:
+    with temporary_file(root_dir=root_dir) as fp:
       cp.write(fp)
       fp.close()
-      coverage_rc = fp.name
+      yield fp.name
+
+  @contextmanager
+  def _cov_setup(self, workdirs, coverage_morfs, src_to_target_base):
+    data_file = os.path.join(workdirs.coverage_path, '.coverage')
+    # We want to ensure our reporting is based off coverage data from this run.
+    if os.path.exists(data_file):
+      os.unlink(data_file)
+
+    with self._coverage_rc(workdirs.root_dir, src_to_target_base, data_file) as coverage_rc:
       # Note that --cov-report= with no value turns off terminal reporting, which
       # we handle separately.
       args = ['--cov-report=', '--cov-config', coverage_rc]
       for morf in coverage_morfs:
         args.extend(['--cov', morf])
 
-      with self._scrub_cov_env_vars():
-        yield args, coverage_rc
+      yield args, coverage_rc, data_file
+
+  def _src_to_target_base(self, test_targets):
+    src_to_target_base = {}
+    for target in test_targets:
+      libs = (tgt for tgt in target.closure()
+              if tgt.has_sources('.py') and not isinstance(tgt, PythonTests))
+      for lib in libs:
+        for src in lib.sources_relative_to_source_root():
+          src_to_target_base[src] = lib.target_base
+    return src_to_target_base
+
+  def _coverage_run(self, pex, subcommand, arguments):
+    return self._pex_run(pex,
+                         workunit_name='coverage-{}'.format(subcommand),
+                         args=[subcommand] + arguments,
+                         env={'PEX_MODULE': 'coverage.cmdline:main'})
+
+  def _coverage_report(self, pex, coverage_rc, coverage_workdir):
+    self._coverage_run(pex, 'report', ['-i', '--rcfile', coverage_rc])
+    self._coverage_run(pex, 'html', ['-i', '--rcfile', coverage_rc, '-d', coverage_workdir])
+    coverage_xml = os.path.join(coverage_workdir, 'coverage.xml')
+    self._coverage_run(pex, 'xml', ['-i', '--rcfile', coverage_rc, '-o', coverage_xml])
 
   @contextmanager
   def _maybe_emit_coverage_data(self, workdirs, test_targets, pex):
@@ -257,13 +298,7 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
 
     pex_src_root = os.path.relpath(self._source_chroot_path, get_buildroot())
 
-    src_to_target_base = {}
-    for target in test_targets:
-      libs = (tgt for tgt in target.closure()
-              if tgt.has_sources('.py') and not isinstance(tgt, PythonTests))
-      for lib in libs:
-        for src in lib.sources_relative_to_source_root():
-          src_to_target_base[src] = lib.target_base
+    src_to_target_base = self._src_to_target_base(test_targets)
 
     def ensure_trailing_sep(path):
       return path if path.endswith(os.path.sep) else path + os.path.sep
@@ -321,33 +356,43 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
 
     with self._cov_setup(workdirs,
                          coverage_morfs=coverage_morfs,
-                         src_to_target_base=src_to_target_base) as (args, coverage_rc):
+                         src_to_target_base=src_to_target_base) as (args, coverage_rc, data_file):
       try:
         yield args
       finally:
-        env = {
-          'PEX_MODULE': 'coverage.cmdline:main'
-        }
-        def coverage_run(subcommand, arguments):
-          return self._pex_run(pex,
-                               workunit_name='coverage-{}'.format(subcommand),
-                               args=[subcommand] + arguments,
-                               env=env)
-
-        # The '.coverage' data file is output in the CWD of the test run above; so we make sure to
-        # look for it there.
-        with self._maybe_run_in_chroot():
-          # On failures or timeouts, the .coverage file won't be written.
-          if not os.path.exists('.coverage'):
-            self.context.log.warn('No .coverage file was found! Skipping coverage reporting.')
-          else:
-            coverage_run('report', ['-i', '--rcfile', coverage_rc])
-
-            coverage_workdir = workdirs.coverage_path
-            coverage_run('html', ['-i', '--rcfile', coverage_rc, '-d', coverage_workdir])
-
-            coverage_xml = os.path.join(coverage_workdir, 'coverage.xml')
-            coverage_run('xml', ['-i', '--rcfile', coverage_rc, '-o', coverage_xml])
+        # On failures or timeouts, the .coverage file won't be written.
+        if not os.path.exists(data_file):
+          self.context.log.warn('No .coverage file was found! Skipping coverage reporting.')
+        else:
+          self._coverage_report(pex, coverage_rc, workdirs.coverage_path)
+
+  def _merge_coverage(self, test_targets, all_workdirs):
+    """Combines the coverage data of all the given partitions into a single report."""
+    data_files = [os.path.join(workdirs.coverage_path, '.coverage') for workdirs in all_workdirs]
+    data_files = [data_file for data_file in data_files if os.path.exists(data_file)]
+    if len(data_files) < 2:
+      return
+
+    pex = self.context.products.get_data(PytestPrep.PytestBinary).pex
+    merged_workdir = os.path.join(self.workdir, 'merged_coverage')
+    safe_mkdir(merged_workdir, clean=True)
+    with temporary_dir(root_dir=self.workdir) as tmpdir:
+      data_file = os.path.join(tmpdir, '.coverage')
+      # `coverage combine` consumes the `<data_file>.*` files it combines, so give it copies.
+      for i, partition_data_file in enumerate(data_files):
+        shutil.copy2(partition_data_file, '{}.{}'.format(data_file, i))
+      with self._coverage_rc(tmpdir, self._src_to_target_base(test_targets),
+                             data_file) as coverage_rc:
+        self._coverage_run(pex, 'combine', ['--rcfile', coverage_rc])
+        self._coverage_report(pex, coverage_rc, merged_workdir)
+
+    coverage_output_dir = self.get_options().coverage_output_dir
+    if coverage_output_dir:
+      target_dir = coverage_output_dir
+    else:
+      pants_distdir = self.context.options.for_global_scope().pants_distdir
+      target_dir = os.path.join(pants_distdir, 'coverage', 'merged')
+    mergetree(merged_workdir, target_dir)
 
   def _get_shard_conftest_content(self):
     shard_spec = self.get_options().test_shard
@@ -480,6 +525,8 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
   def _do_run_tests_with_args(self, pex, args):
     try:
       env = dict(os.environ)
+      if self.get_options().coverage is not None:
+        env = self._scrub_cov_env_vars(env)
 
       # Ensure we don't leak source files or undeclared 3rdparty requirements into the py.test PEX
       # environment.
@@ -577,14 +624,29 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
         yield tuple(test_targets)
 
     workdir = self.workdir
+    all_workdirs = []
 
     def iter_partitions_with_args():
       for partition in iter_partitions():
         workdirs = _Workdirs.for_partition(workdir, partition)
+        all_workdirs.append(workdirs)
         args = (workdirs,)
         yield partition, args
 
-    yield iter_partitions_with_args
+    try:
+      yield iter_partitions_with_args
+    finally:
+      if self.get_options().coverage and self.partition_parallelism > 1:
+        # A failure to report coverage must not mask the outcome of the tests.
+        try:
+          self._merge_coverage(test_targets, all_workdirs)
+        except Exception as e:
+          self.context.log.warn('Failed to merge coverage data: {}'.format(e))
+          self.context.log.debug(traceback.format_exc())
+
+  @property
+  def partition_parallelism(self):
+    return self.get_options().parallelism
 
   # TODO(John Sirois): Its probably worth generalizing a means to mark certain options or target
   # attributes as making results un-cacheable. See: https://github.com/pantsbuild/pants/issues/4748
@@ -684,8 +746,7 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
       if os.path.exists(junitxml_path):
         os.unlink(junitxml_path)
 
-      with self._maybe_run_in_chroot():
-        result = self._do_run_tests_with_args(pytest_binary.pex, args)
+      result = self._do_run_tests_with_args(pytest_binary.pex, args)
 
       # There was a problem prior to test execution preventing junit xml file creation so just let
       # the failure result bubble.
@@ -731,11 +792,14 @@ class PytestRun(PartitionedTestRunnerTaskMixin, Task):
 
   def _spawn(self, pex, workunit, args, setsid=False, env=None):
     env = env or {}
-    process = pex.run(args,
-                      with_chroot=False,  # We handle chrooting ourselves.
-                      blocking=False,
-                      setsid=setsid,
-                      env=env,
-                      stdout=workunit.output('stdout'),
-                      stderr=workunit.output('stderr'))
+    # NB: We only change the cwd while spawning, since partitions may run concurrently while
+    # waiting on their processes.
+    with self._maybe_run_in_chroot():
+      process = pex.run(args,
+                        with_chroot=False,  # We handle chrooting ourselves.
+                        blocking=False,
+                        setsid=setsid,
+                        env=env,
+                        stdout=workunit.output('stdout'),
+                        stderr=workunit.output('stderr'))
     return SubprocessProcessHandler(process)
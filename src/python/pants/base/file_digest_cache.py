@@ -0,0 +1,126 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import errno
+import io
+import os
+import threading
+import time
+
+from pants.base.hash_utils import hash_file
+from pants.util.dirutil import safe_mkdir_for
+
+
+class FileDigestCache(object):
+  """Memoizes the sha1 digests of files, keyed by their (path, mtime, size, inode).
+
+  A file is only re-read when its stat metadata changes. If constructed with a `path`, digests are
+  also persisted there in an append-only log, so that later runs don't re-read unchanged files
+  either. The log is compacted when it is loaded and has accumulated many superseded records.
+  """
+
+  # Digests of files modified this recently are not persisted, since a subsequent write within the
+  # filesystem's mtime granularity could leave their stat metadata unchanged.
+  _RACY_WINDOW_SECS = 2
+
+  _COMPACTION_RATIO = 2
+  _COMPACTION_MIN_RECORDS = 10000
+
+  _global_instance = None
+
+  @classmethod
+  def global_instance(cls):
+    """Returns the FileDigestCache installed for this run, or a non-persistent one if none was."""
+    if cls._global_instance is None:
+      cls._global_instance = cls()
+    return cls._global_instance
+
+  @classmethod
+  def set_global_instance(cls, digest_cache):
+    """Installs the given FileDigestCache as the one returned by `global_instance`."""
+    cls._global_instance = digest_cache
+
+  def __init__(self, path=None):
+    """
+    :param str path: An optional file in which to persist digests between runs.
+    """
+    self._path = path
+    self._entries = None
+    self._log = None
+    self._lock = threading.Lock()
+
+  @property
+  def path(self):
+    return self._path
+
+  def digest(self, path):
+    """Returns the hex sha1 digest of the contents of the file at the given absolute `path`."""
+    st = os.stat(path)
+    stat_key = (st.st_mtime, st.st_size, st.st_ino)
+    with self._lock:
+      entry = self._loaded_entries().get(path)
+      if entry and entry[0] == stat_key:
+        return entry[1]
+
+    digest = hash_file(path)
+    with self._lock:
+      self._entries[path] = (stat_key, digest)
+      if self._path and time.time() - st.st_mtime > self._RACY_WINDOW_SECS:
+        self._append(path, stat_key, digest)
+    return digest
+
+  def _loaded_entries(self):
+    if self._entries is None:
+      self._entries = self._load() if self._path else {}
+    return self._entries
+
+  def _load(self):
+    entries = {}
+    records = 0
+    try:
+      with io.open(self._path, 'r', encoding='utf-8') as fd:
+        for line in fd:
+          if not line.endswith('\n'):
+            # A torn write: ignore it.
+            continue
+          try:
+            path, mtime, size, ino, digest = line[:-1].rsplit('\t', 4)
+            entries[path] = ((float(mtime), int(size), int(ino)), digest)
+          except ValueError:
+            continue
+          records += 1
+    except IOError as e:
+      if e.errno != errno.ENOENT:
+        raise
+    if records >= max(self._COMPACTION_MIN_RECORDS, self._COMPACTION_RATIO * len(entries)):
+      self._compact(entries)
+    return entries
+
+  @staticmethod
+  def _record(path, stat_key, digest):
+    mtime, size, ino = stat_key
+    return '{}\t{!r}\t{}\t{}\t{}\n'.format(path, mtime, size, ino, digest)
+
+  def _compact(self, entries):
+    tmp_path = '{}.compact.{}'.format(self._path, os.getpid())
+    with io.open(tmp_path, 'w', encoding='utf-8') as fd:
+      for path, (stat_key, digest) in entries.items():
+        fd.write(self._record(path, stat_key, digest))
+    os.rename(tmp_path, self._path)
+
+  def _append(self, path, stat_key, digest):
+    if '\n' in path:
+      return
+    try:
+      record = self._record(path, stat_key, digest).encode('utf-8')
+    except UnicodeError:
+      return
+    if self._log is None:
+      safe_mkdir_for(self._path)
+      # Unbuffered, so that each record is written with a single write() to the end of the log.
+      self._log = io.open(self._path, 'ab', buffering=0)
+    self._log.write(record)
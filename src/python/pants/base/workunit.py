@@ -125,6 +125,9 @@ class WorkUnit(object):
     self._outputs = {}  # name -> output buffer.
     self._output_paths = {}
 
+    # The path of a cProfile of the Python CPU time spent in this workunit, if it was profiled.
+    self.profile_path = None
+
     # Do this last, as the parent's _self_time() might get called before we're
     # done initializing ourselves.
     # TODO: Ensure that a parent can't be ended before all its children are.
@@ -74,7 +74,7 @@ class DaemonPantsRunner(ProcessManager):
   """
 
   def __init__(self, socket, exiter, args, env, target_roots, graph_helper, fork_lock,
-               preceding_graph_size, deferred_exception=None):
+               preceding_graph_size, deferred_exception=None, invalidation_stats=None):
     """
     :param socket socket: A connected socket capable of speaking the nailgun protocol.
     :param Exiter exiter: The Exiter instance for this run.
@@ -88,6 +88,8 @@ class DaemonPantsRunner(ProcessManager):
     :param int preceding_graph_size: The size of the graph pre-warming, for stats.
     :param Exception deferred_exception: A deferred exception from the daemon's graph construction.
                                          If present, this will be re-raised in the client context.
+    :param dict invalidation_stats: Stats for the daemon's filesystem event invalidations since the
+                                    previous run (see `SchedulerService.consume_invalidation_stats`).
     """
     super(DaemonPantsRunner, self).__init__(name=self._make_identity())
     self._socket = socket
@@ -99,6 +101,7 @@ class DaemonPantsRunner(ProcessManager):
     self._fork_lock = fork_lock
     self._preceding_graph_size = preceding_graph_size
     self._deferred_exception = deferred_exception
+    self._invalidation_stats = invalidation_stats
 
   def _make_identity(self):
     """Generate a ProcessManager identity for a given pants run.
@@ -233,8 +236,9 @@ class DaemonPantsRunner(ProcessManager):
         # Setup the Exiter's finalizer.
         self._exiter.set_finalizer(finalizer)
 
-        # Clean global state.
-        clean_global_runtime_state(reset_subsystem=True)
+        # Clean global state, retaining the backends/plugins and registered options that pantsd
+        # already loaded while computing the target roots for this run.
+        clean_global_runtime_state(reset_subsystem=True, reset_backends=False)
 
         # Re-raise any deferred exceptions, if present.
         self._raise_deferred_exc()
@@ -249,6 +253,8 @@ class DaemonPantsRunner(ProcessManager):
         )
         runner.set_start_time(self._maybe_get_client_start_time_from_env(self._env))
         runner.set_preceding_graph_size(self._preceding_graph_size)
+        if self._invalidation_stats:
+          runner.set_invalidation_stats(self._invalidation_stats)
         runner.run()
       except KeyboardInterrupt:
         self._exiter.exit(1, msg='Interrupted by user.\n')
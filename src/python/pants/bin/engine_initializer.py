@@ -6,6 +6,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import logging
+import os
 from collections import namedtuple
 
 from pants.base.build_environment import get_buildroot, get_scm
@@ -15,8 +16,9 @@ from pants.engine.build_files import create_graph_rules
 from pants.engine.fs import create_fs_rules
 from pants.engine.isolated_process import create_process_rules
 from pants.engine.legacy.address_mapper import LegacyAddressMapper
-from pants.engine.legacy.graph import (LegacyBuildGraph, TransitiveHydratedTargets,
-                                       create_legacy_graph_tasks)
+from pants.engine.legacy.dependee_index import DependeeIndex
+from pants.engine.legacy.graph import (LegacyBuildGraph, TargetCache, TransitiveHydratedTargets,
+                                       create_legacy_graph_tasks, target_types_from_symbol_table)
 from pants.engine.legacy.parser import LegacyPythonCallbacksParser
 from pants.engine.legacy.structs import (AppAdaptor, GoTargetAdaptor, JavaLibraryAdaptor,
                                          JunitTestsAdaptor, PythonLibraryAdaptor,
@@ -72,8 +74,16 @@ class LegacySymbolTable(SymbolTable):
 
 
 class LegacyGraphHelper(namedtuple('LegacyGraphHelper', ['scheduler', 'symbol_table',
-                                                         'change_calculator'])):
-  """A container for the components necessary to construct a legacy BuildGraph facade."""
+                                                         'change_calculator', 'target_cache',
+                                                         'dependee_index'])):
+  """A container for the components necessary to construct a legacy BuildGraph facade.
+
+  If the helper has a `target_cache`, warming the product graph also instantiates (and fingerprints
+  the payloads of) the Targets for the warmed roots, so that BuildGraphs created later (including in
+  processes forked from pantsd) can reuse them.
+
+  The `dependee_index`, if any, is shared by the `change_calculator` and the `dependees` goal.
+  """
 
   def warm_product_graph(self, target_roots):
     """Warm the scheduler's `ProductGraph` with `TransitiveHydratedTargets` products.
@@ -87,6 +97,16 @@ class LegacyGraphHelper(namedtuple('LegacyGraphHelper', ['scheduler', 'symbol_ta
     if result.error:
       raise result.error
 
+    if self.target_cache is not None:
+      graph = LegacyBuildGraph.create(self.scheduler, self.symbol_table,
+                                      target_cache=self.target_cache)
+      for _ in graph.inject_roots_closure(target_roots):
+        pass
+      # Payload fingerprints are memoized in payloads, which are shared with cached Targets.
+      for target in graph.targets():
+        target.payload.fingerprint()
+      logger.debug('target cache holds %d targets', len(self.target_cache))
+
   def create_build_graph(self, target_roots, build_root=None):
     """Construct and return a `BuildGraph` given a set of input specs.
 
@@ -95,7 +115,8 @@ class LegacyGraphHelper(namedtuple('LegacyGraphHelper', ['scheduler', 'symbol_ta
     :returns: A tuple of (BuildGraph, AddressMapper).
     """
     logger.debug('target_roots are: %r', target_roots)
-    graph = LegacyBuildGraph.create(self.scheduler, self.symbol_table)
+    graph = LegacyBuildGraph.create(self.scheduler, self.symbol_table,
+                                    target_cache=self.target_cache)
     logger.debug('build_graph is: %s', graph)
     # Ensure the entire generator is unrolled.
     for _ in graph.inject_roots_closure(target_roots):
@@ -125,7 +146,9 @@ class EngineInitializer(object):
                          build_ignore_patterns=None,
                          exclude_target_regexps=None,
                          subproject_roots=None,
-                         include_trace_on_error=True):
+                         include_trace_on_error=True,
+                         cache_targets=False,
+                         use_dependee_index=True):
     """Construct and return the components necessary for LegacyBuildGraph construction.
 
     :param list pants_ignore_patterns: A list of path ignore patterns for FileSystemProjectTree,
@@ -145,6 +168,10 @@ class EngineInitializer(object):
                                   under the current build root.
     :param bool include_trace_on_error: If True, when an error occurs, the error message will
                 include the graph trace.
+    :param bool cache_targets: If True, instantiated Targets are cached for reuse by subsequently
+                               created BuildGraphs; for use by long-lived processes like pantsd.
+    :param bool use_dependee_index: If True, dependees are found with a `DependeeIndex`, rather than
+                                    by constructing the whole build graph.
     :returns: A tuple of (scheduler, engine, symbol_table, build_graph_cls).
     """
 
@@ -186,6 +213,19 @@ class EngineInitializer(object):
     )
 
     scheduler = LocalScheduler(workdir, dict(), tasks, project_tree, native, include_trace_on_error=include_trace_on_error)
-    change_calculator = EngineChangeCalculator(scheduler, symbol_table, scm) if scm else None
-
-    return LegacyGraphHelper(scheduler, symbol_table, change_calculator)
+    dependee_index = None
+    if use_dependee_index:
+      dependee_index = DependeeIndex(scheduler,
+                                     target_types_from_symbol_table(symbol_table),
+                                     build_patterns=address_mapper.build_patterns,
+                                     build_ignore_patterns=build_ignore_patterns,
+                                     exclude_target_regexps=exclude_target_regexps,
+                                     path=os.path.join(workdir, 'dependee_index', 'index.json'))
+    change_calculator = (EngineChangeCalculator(scheduler, symbol_table, scm,
+                                                dependee_index=dependee_index)
+                         if scm else None)
+
+    target_cache = TargetCache() if cache_targets else None
+
+    return LegacyGraphHelper(scheduler, symbol_table, change_calculator, target_cache,
+                             dependee_index)
@@ -6,9 +6,11 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import logging
+import os
 import sys
 
 from pants.base.cmd_line_spec_parser import CmdLineSpecParser
+from pants.base.file_digest_cache import FileDigestCache
 from pants.base.workunit import WorkUnit, WorkUnitLabel
 from pants.bin.engine_initializer import EngineInitializer
 from pants.bin.repro import Reproducer
@@ -95,7 +97,7 @@ class GoalRunnerFactory(object):
     :param TargetRoots target_roots: The existing `TargetRoots` object, if any.
     :param LegacyGraphHelper graph_helper: A LegacyGraphHelper to use for graph construction,
                                            if available. This would usually come from the daemon.
-    :returns: A tuple of (BuildGraph, AddressMapper, opt Scheduler, TargetRoots).
+    :returns: A tuple of (BuildGraph, AddressMapper, opt Scheduler, TargetRoots, opt DependeeIndex).
     """
     # The daemon may provide a `graph_helper`. If that's present, use it for graph construction.
     if not graph_helper:
@@ -111,7 +113,8 @@ class GoalRunnerFactory(object):
         build_ignore_patterns=build_ignore_patterns,
         exclude_target_regexps=exclude_target_regexps,
         subproject_roots=subproject_build_roots,
-        include_trace_on_error=self._options.for_global_scope().print_exception_stacktrace
+        include_trace_on_error=self._options.for_global_scope().print_exception_stacktrace,
+        use_dependee_index=self._global_options.dependee_index
       )
 
     target_roots = target_roots or TargetRootsCalculator.create(
@@ -120,7 +123,7 @@ class GoalRunnerFactory(object):
       change_calculator=graph_helper.change_calculator
     )
     graph, address_mapper = graph_helper.create_build_graph(target_roots, self._root_dir)
-    return graph, address_mapper, graph_helper.scheduler, target_roots
+    return graph, address_mapper, graph_helper.scheduler, target_roots, graph_helper.dependee_index
 
   def _determine_goals(self, requested_goals):
     """Check and populate the requested goals for a given run."""
@@ -159,9 +162,20 @@ class GoalRunnerFactory(object):
 
     return any(goal.has_task_of_type(QuietTaskMixin) for goal in goals)
 
+  def _init_file_digest_cache(self):
+    """Install the FileDigestCache used to fingerprint sources, before any targets are created."""
+    digest_cache_path = None
+    if self._global_options.persist_file_digests:
+      digest_cache_path = os.path.join(self._global_options.pants_workdir, 'file_digests', 'digests')
+    current = FileDigestCache.global_instance()
+    if current.path != digest_cache_path:
+      FileDigestCache.set_global_instance(FileDigestCache(digest_cache_path))
+
   def _setup_context(self):
     with self._run_tracker.new_workunit(name='setup', labels=[WorkUnitLabel.SETUP]):
-      self._build_graph, self._address_mapper, scheduler, target_roots = self._init_graph(
+      self._init_file_digest_cache()
+      (self._build_graph, self._address_mapper, scheduler, target_roots,
+       dependee_index) = self._init_graph(
         self._global_options.pants_ignore,
         self._global_options.build_ignore,
         self._global_options.exclude_target_regexp,
@@ -171,6 +185,8 @@ class GoalRunnerFactory(object):
         self._daemon_graph_helper,
         self._global_options.subproject_roots
       )
+      if self._global_options.build_graph_closure_index:
+        self._build_graph.enable_closure_index()
 
       goals = self._determine_goals(self._requested_goals)
       is_quiet = self._should_be_quiet(goals)
@@ -193,7 +209,8 @@ class GoalRunnerFactory(object):
                         build_file_parser=self._build_file_parser,
                         address_mapper=self._address_mapper,
                         invalidation_report=invalidation_report,
-                        scheduler=scheduler)
+                        scheduler=scheduler,
+                        dependee_index=dependee_index)
       return goals, context
 
   def setup(self):
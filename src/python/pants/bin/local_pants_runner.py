@@ -35,11 +35,15 @@ class LocalPantsRunner(object):
     self._daemon_build_graph = daemon_build_graph
     self._options_bootstrapper = options_bootstrapper
     self._preceding_graph_size = -1
+    self._invalidation_stats = None
     self._run_start_time = None
 
   def set_preceding_graph_size(self, size):
     self._preceding_graph_size = size
 
+  def set_invalidation_stats(self, stats):
+    self._invalidation_stats = stats
+
   def set_start_time(self, start_time):
     self._run_start_time = start_time
 
@@ -65,6 +69,9 @@ class LocalPantsRunner(object):
 
     # Verify the configs here.
     if global_options.verify_config:
+      # Config may set the options of tasks that were not loaded, so load them to verify against.
+      OptionsInitializer.load_tasks_for_scopes(options_bootstrapper.get_config_scopes(),
+                                               options.is_known_scope)
       options_bootstrapper.verify_configs_against_options(options)
 
     # Launch RunTracker as early as possible (just after Subsystem options are initialized).
@@ -83,6 +90,8 @@ class LocalPantsRunner(object):
 
       # Record the preceding product graph size.
       run_tracker.pantsd_stats.set_preceding_graph_size(self._preceding_graph_size)
+      if self._invalidation_stats:
+        run_tracker.pantsd_stats.set_invalidation_stats(**self._invalidation_stats)
 
       # Setup and run GoalRunner.
       goal_runner = GoalRunner.Factory(root_dir,
@@ -9,7 +9,9 @@ import logging
 import os
 import sys
 
+from pants.base.build_environment import pants_version
 from pants.bin.remote_pants_runner import RemotePantsRunner
+from pants.option.arg_splitter import ArgSplitter
 from pants.option.options_bootstrapper import OptionsBootstrapper
 
 
@@ -30,7 +32,16 @@ class PantsRunner(object):
     self._env = env or os.environ
     self._start_time = start_time
 
+  def _is_version_request(self):
+    args = self._args[1:]
+    return bool(args) and all(arg in ArgSplitter.HELP_VERSION_ARGS for arg in args)
+
   def run(self):
+    # N.B. Printing the version needs neither the daemon nor any backends, so skip loading them.
+    if self._is_version_request():
+      print(pants_version())
+      return self._exiter.exit(0)
+
     options_bootstrapper = OptionsBootstrapper(env=self._env, args=self._args)
     bootstrap_options = options_bootstrapper.get_bootstrap_options()
 
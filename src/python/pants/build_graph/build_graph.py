@@ -14,6 +14,7 @@ from twitter.common.collections import OrderedSet
 
 from pants.build_graph.address import Address
 from pants.build_graph.address_lookup_error import AddressLookupError
+from pants.build_graph.closure_index import ClosureIndex
 from pants.build_graph.injectables_mixin import InjectablesMixin
 from pants.build_graph.target import Target
 from pants.util.meta import AbstractClass
@@ -96,6 +97,8 @@ class BuildGraph(AbstractClass):
     """
     return Target.closure_for_targets(*vargs, **kwargs)
 
+  _closure_index_enabled = False
+
   def __init__(self):
     self.reset()
 
@@ -131,6 +134,37 @@ class BuildGraph(AbstractClass):
     self._derived_from_by_derivative = {}  # Address -> Address.
     self._derivatives_by_derived_from = defaultdict(list)   # Address -> list of Address.
     self.synthetic_addresses = set()
+    self._invalidate_closure_index()
+
+  def enable_closure_index(self):
+    """Memoizes the transitive closures walked in this BuildGraph until it is next mutated.
+
+    While enabled, walks of the dependencies or dependees of addresses that use neither a
+    `predicate` nor a `dep_predicate` are answered from a `ClosureIndex`, so that repeated walks of
+    the same roots (by many tasks, or via `Target.closure`) don't repeat the traversal.
+
+    :API: public
+    """
+    self._closure_index_enabled = True
+    self._invalidate_closure_index()
+
+  def _invalidate_closure_index(self):
+    # The indexes are created lazily, so that building a graph doesn't create one per mutation.
+    self._dependency_closure_index = None
+    self._dependee_closure_index = None
+
+  def _closure_index(self, dependees=False):
+    if not self._closure_index_enabled:
+      return None
+    if dependees:
+      if self._dependee_closure_index is None:
+        self._dependee_closure_index = ClosureIndex(self._target_by_address,
+                                                    self._target_dependees_by_address)
+      return self._dependee_closure_index
+    if self._dependency_closure_index is None:
+      self._dependency_closure_index = ClosureIndex(self._target_by_address,
+                                                    self._target_dependencies_by_address)
+    return self._dependency_closure_index
 
   def contains_address(self, address):
     """
@@ -273,6 +307,7 @@ class BuildGraph(AbstractClass):
       self.synthetic_addresses.add(address)
 
     self._target_by_address[address] = target
+    self._invalidate_closure_index()
 
     for dependency_address in dependencies:
       self.inject_dependency(dependent=address, dependency=dependency_address)
@@ -315,6 +350,7 @@ class BuildGraph(AbstractClass):
     else:
       self._target_dependencies_by_address[dependent].add(dependency)
       self._target_dependees_by_address[dependency].add(dependent)
+      self._invalidate_closure_index()
 
   def targets(self, predicate=None):
     """Returns all the targets in the graph in no particular order.
@@ -366,6 +402,12 @@ class BuildGraph(AbstractClass):
       when traversing the closure. If it is given, when the predicate fails, the edge to the dependency
       will not be expanded.
     """
+    closure_index = self._closure_index()
+    if closure_index is not None and not predicate and not dep_predicate:
+      for target in closure_index.walk(addresses, postorder=postorder):
+        work(target)
+      return
+
     walk = self._walk_factory(dep_predicate)
 
     def _walk_rec(addr, level=0):
@@ -402,6 +444,12 @@ class BuildGraph(AbstractClass):
 
     :API: public
     """
+    closure_index = self._closure_index(dependees=True)
+    if closure_index is not None and not predicate:
+      for target in closure_index.walk(addresses, postorder=postorder):
+        work(target)
+      return
+
     walked = set()
 
     def _walk_rec(addr):
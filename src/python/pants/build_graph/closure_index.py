@@ -0,0 +1,144 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import binascii
+import threading
+from collections import OrderedDict
+
+from twitter.common.collections import OrderedSet
+
+
+class ClosureIndex(object):
+  """Memoizes unfiltered depth-first walks of the transitive closures of addresses in a BuildGraph.
+
+  Each walked address is memoized with the targets its walk visits, in order, and with a bitset of
+  the members of its closure (a long, with a bit per address at that address's dense integer id).
+
+  The targets visited by a walk of several roots that shares its visited set between them are
+  closed under their edges. So a root whose bit is already covered is skipped without a walk, and a
+  root whose memoized closure is disjoint from the covered set contributes its memoized walk as is.
+  Any other root is walked directly, stopping at covered targets, so that a walk of many roots costs
+  no more than a single traversal of their combined closure.
+
+  An index is only valid for the edges it was created with: it must be discarded whenever the graph
+  is mutated. It may be walked from several threads at once.
+  """
+
+  def __init__(self, target_by_address, edges_by_address, max_memoized_targets=2 ** 20):
+    """
+    :param dict target_by_address: The Targets in the graph, by Address.
+    :param dict edges_by_address: The Addresses adjacent to each Address in the direction walked:
+      either its dependencies or its dependees.
+    :param int max_memoized_targets: The most targets to hold across all memoized walks; the least
+      recently used walks are discarded beyond it.
+    """
+    self._target_by_address = target_by_address
+    self._edges_by_address = edges_by_address
+    self._max_memoized_targets = max_memoized_targets
+    self._lock = threading.Lock()
+    self._ids = {}
+    self._walks = OrderedDict()
+    self._memoized_targets = 0
+
+  def walk(self, addresses, postorder=False):
+    """Returns the targets visited by a depth-first walk of the closure of the given addresses.
+
+    :param list addresses: The root addresses of the walk.
+    :param bool postorder: True to order each target after the targets adjacent to it, rather than
+      before them.
+    :rtype: :class:`twitter.common.collections.OrderedSet`
+    """
+    walked = OrderedSet()
+    covered = 0
+    for address in addresses:
+      if covered and (covered >> self._id(address)) & 1:
+        continue
+      walk = self._memoized_walk(address, postorder, memoize=not covered)
+      if walk is not None and not walk[1] & covered:
+        targets, members = walk
+      else:
+        targets = self._walk(address, postorder, walked)
+        members = self._bitset(t.address for t in targets)
+      walked.update(targets)
+      covered |= members
+    return walked
+
+  def _id(self, address):
+    with self._lock:
+      return self._id_of(address)
+
+  def _id_of(self, address):
+    # NB: Callers must hold the lock, so that concurrent walks never hand out the same id twice.
+    id = self._ids.get(address)
+    if id is None:
+      id = self._ids[address] = len(self._ids)
+    return id
+
+  def _memoized_walk(self, address, postorder, memoize):
+    key = (address, postorder)
+    with self._lock:
+      walk = self._walks.pop(key, None)
+      if walk is not None:
+        self._walks[key] = walk
+        return walk
+    if not memoize:
+      return None
+
+    targets = self._walk(address, postorder)
+    walk = (targets, self._bitset(t.address for t in targets))
+    with self._lock:
+      if key not in self._walks and len(targets) <= self._max_memoized_targets:
+        self._walks[key] = walk
+        self._memoized_targets += len(targets)
+        while self._memoized_targets > self._max_memoized_targets:
+          _, (evicted, _) = self._walks.popitem(last=False)
+          self._memoized_targets -= len(evicted)
+    return walk
+
+  def _walk(self, root, postorder, walked=()):
+    # Iterative, so that deep graphs don't exhaust the stack. Each stack entry holds a target and an
+    # iterator over its unvisited edges. Targets that were already `walked` are not expanded.
+    targets = []
+    expanded = {root}
+
+    def expand(address):
+      target = self._target_by_address[address]
+      if not postorder:
+        targets.append(target)
+      return target, iter(self._edges_by_address[address])
+
+    stack = [expand(root)]
+    while stack:
+      target, edges = stack[-1]
+      for address in edges:
+        if address not in expanded:
+          expanded.add(address)
+          if self._target_by_address[address] in walked:
+            continue
+          stack.append(expand(address))
+          break
+      else:
+        stack.pop()
+        if postorder:
+          targets.append(target)
+    return tuple(targets)
+
+  def _bitset(self, addresses):
+    # Setting bits on a bytearray is linear in the number of members, whereas or-ing each bit into
+    # a long would be quadratic.
+    bits = bytearray()
+    with self._lock:
+      for address in addresses:
+        id = self._id_of(address)
+        byte = id >> 3
+        if byte >= len(bits):
+          bits.extend(b'\0' * (byte + 1 - len(bits)))
+        bits[byte] |= 1 << (id & 7)
+    if not bits:
+      return 0
+    bits.reverse()
+    return int(binascii.hexlify(bits), 16)
@@ -5,6 +5,7 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import copy
 import logging
 import os
 from hashlib import sha1
@@ -396,6 +397,27 @@ class Target(AbstractTarget):
     self.mark_extra_invalidation_hash_dirty()
     self.payload.mark_dirty()
 
+  def copy_for_build_graph(self, build_graph):
+    """Returns a shallow copy of this target that lives within the given BuildGraph.
+
+    The copy shares this target's (frozen) payload, and so any payload fingerprints already
+    memoized, but none of the memoized state that depends on the target's dependencies.
+
+    :API: public
+
+    :param build_graph: The BuildGraph that the copy lives within.
+    :type build_graph: :class:`pants.build_graph.build_graph.BuildGraph`
+    """
+    target = copy.copy(self)
+    target._build_graph = build_graph
+    target._tags = set(self._tags)
+    target._cached_fingerprint_map = {}
+    target._cached_all_transitive_fingerprint_map = {}
+    target._cached_direct_transitive_fingerprint_map = {}
+    target._cached_strict_dependencies_map = {}
+    target._cached_exports_addresses = None
+    return target
+
   def transitive_invalidation_hash(self, fingerprint_strategy=None, depth=0):
     """
     :API: public
@@ -442,10 +464,13 @@ class Target(AbstractTarget):
         hasher.update(dep_hash)
       target_hash = self.invalidation_hash(fingerprint_strategy)
       if target_hash is None and not dep_hashes:
-        return None
-      dependencies_hash = hasher.hexdigest()[:12]
-      combined_hash = '{target_hash}.{deps_hash}'.format(target_hash=target_hash,
-                                                         deps_hash=dependencies_hash)
+        # Memoized too, so that targets that don't contribute to the fingerprint aren't re-walked
+        # by every dependee and every check.
+        combined_hash = None
+      else:
+        dependencies_hash = hasher.hexdigest()[:12]
+        combined_hash = '{target_hash}.{deps_hash}'.format(target_hash=target_hash,
+                                                           deps_hash=dependencies_hash)
       fingerprint_map[fingerprint_strategy] = combined_hash
     return fingerprint_map[fingerprint_strategy]
 
@@ -114,6 +114,16 @@ class ArtifactCache(object):
   def has(self, cache_key):
     pass
 
+  def has_all(self, cache_keys):
+    """Check whether each of the given keys is in the cache.
+
+    Subclasses may override this to check many keys more cheaply than one at a time.
+
+    :param list cache_keys: A list of CacheKey objects.
+    :returns: A list of booleans, parallel to `cache_keys`.
+    """
+    return [self.has(cache_key) for cache_key in cache_keys]
+
   def use_cached_files(self, cache_key, results_dir=None):
     """Use the files cached for the given key.
 
@@ -14,6 +14,7 @@ from six.moves import range
 
 from pants.base.build_environment import get_buildroot
 from pants.cache.artifact_cache import ArtifactCacheError
+from pants.cache.content_addressed_artifact_cache import ContentAddressedLocalArtifactCache
 from pants.cache.local_artifact_cache import LocalArtifactCache, TempLocalArtifactCache
 from pants.cache.pinger import BestUrlSelector, Pinger
 from pants.cache.resolver import NoopResolver, Resolver, RESTfulResolver
@@ -74,12 +75,25 @@ class CacheSetup(Subsystem):
                   'a RESTful cache, a path of a filesystem cache, or a pipe-separated list of '
                   'alternate caches to choose from. This list is also used as input to '
                   'the resolver. When resolver is \'none\' list is used as is.')
+    register('--local-backend', advanced=True, choices=['tarball', 'content-addressed'],
+             default='tarball',
+             help='Select how artifacts are stored in local filesystem caches. tarball: one '
+                  'gzipped tarball per artifact. content-addressed: one manifest per artifact, '
+                  'pointing into a blob store shared by all tasks using the same cache path, so '
+                  'identical files are stored once.')
+    register('--local-hardlink', advanced=True, type=bool, default=False,
+             help='When reading from a content-addressed local cache, hardlink files into place '
+                  'instead of copying them. Hardlinked files are read-only, and tasks must not '
+                  'modify extracted files in place.')
     register('--compression-level', advanced=True, type=int, default=5,
              help='The gzip compression level (0-9) for created artifacts.')
     register('--dereference-symlinks', type=bool, default=True, fingerprint=True,
              help='Dereference symlinks when creating cache tarball.')
     register('--max-entries-per-target', advanced=True, type=int, default=8,
              help='Maximum number of old cache files to keep per task target pair')
+    register('--max-concurrent-requests', advanced=True, type=int, default=16,
+             help='The maximum number of requests to have in flight at once when checking a '
+                  'remote artifact cache for many artifacts.')
     register('--pinger-timeout', advanced=True, type=float, default=0.5,
              help='number of seconds before pinger times out')
     register('--pinger-tries', advanced=True, type=int, default=2,
@@ -95,6 +109,10 @@ class CacheSetup(Subsystem):
 
 class CacheFactory(object):
 
+  # The blob store for content-addressed local caches lives alongside the per-task cache dirs, which
+  # are named by task fingerprint, so that blobs are shared between all tasks.
+  _BLOB_DIRNAME = 'blobs'
+
   def __init__(self, options, log, task, pinger=None, resolver=None):
     """Create a cache factory from settings.
 
@@ -275,6 +293,14 @@ class CacheFactory(object):
       path = os.path.join(parent_path, self._cache_dirname)
       self._log.debug('{0} {1} local artifact cache at {2}'
                       .format(self._task.stable_name(), action, path))
+      if self._options.local_backend == 'content-addressed':
+        return ContentAddressedLocalArtifactCache(artifact_root, path,
+                                                  os.path.join(parent_path, self._BLOB_DIRNAME),
+                                                  compression,
+                                                  self._options.max_entries_per_target,
+                                                  permissions=self._options.write_permissions,
+                                                  dereference=self._options.dereference_symlinks,
+                                                  hardlink=self._options.local_hardlink)
       return LocalArtifactCache(artifact_root, path, compression,
                                 self._options.max_entries_per_target,
                                 permissions=self._options.write_permissions,
@@ -288,7 +314,8 @@ class CacheFactory(object):
           ['{}/{}'.format(url.rstrip('/'), self._cache_dirname) for url in urls]
         )
         local_cache = local_cache or TempLocalArtifactCache(artifact_root, compression)
-        return RESTfulArtifactCache(artifact_root, best_url_selector, local_cache)
+        return RESTfulArtifactCache(artifact_root, best_url_selector, local_cache,
+                                    max_concurrent_requests=self._options.max_concurrent_requests)
 
     local_cache = create_local_cache(spec.local) if spec.local else None
     remote_cache = create_remote_cache(spec.remote, local_cache) if spec.remote else None
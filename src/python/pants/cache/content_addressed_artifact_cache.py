@@ -0,0 +1,330 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import errno
+import json
+import logging
+import os
+import shutil
+import stat
+import time
+from contextlib import contextmanager
+
+from pants.base.hash_utils import hash_file
+from pants.cache.artifact_cache import UnreadableArtifact
+from pants.cache.local_artifact_cache import BaseLocalArtifactCache
+from pants.util.dirutil import (safe_concurrent_creation, safe_delete, safe_mkdir, safe_mkdir_for,
+                                safe_rm_oldest_items_in_dir, safe_rmtree, safe_walk, touch)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ContentAddressedLocalArtifactCache(BaseLocalArtifactCache):
+  """A local artifact cache that stores each artifact as a manifest of content-addressed blobs.
+
+  Rather than storing one tarball per cache key, every file in an artifact is stored once (keyed
+  by the sha1 of its content) in a blob store that may be shared between many caches, and each
+  cache key maps to a small manifest listing the paths in the artifact and the blobs backing them.
+  Identical files produced by many targets (or by many versions of one target) are stored once,
+  and extraction copies (or optionally hardlinks) blobs into place rather than decompressing and
+  writing every byte.
+
+  Blobs are read-only, so that a task modifying a hardlinked file in place fails rather than
+  silently corrupting every artifact sharing the blob. Blobs that are no longer referenced by any
+  manifest are collected by `prune`, at most once every `_BLOB_GC_INTERVAL_SECS`: every cache
+  sharing a blob root must store its manifests under the parent directory of the blob root.
+
+  Artifacts handed to and received from a remote cache are still tarballs, so this cache can back a
+  `RESTfulArtifactCache` exactly as `LocalArtifactCache` does.
+  """
+
+  _MANIFEST_VERSION = 1
+
+  # Manifest entry kinds.
+  _DIR = 'd'
+  _FILE = 'f'
+  _EXECUTABLE = 'x'
+  _SYMLINK = 'l'
+
+  # Errors from `os.link` that indicate we should fall back to copying.
+  _LINK_UNSUPPORTED_ERRNOS = frozenset([errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOTSUP])
+
+  # Collecting unreferenced blobs reads every manifest sharing the blob root, so it is rate limited
+  # via the mtime of a marker file in the blob root.
+  _BLOB_GC_INTERVAL_SECS = 60 * 60
+  _BLOB_GC_MARKER = '.last_gc'
+
+  def __init__(self, artifact_root, cache_root, blob_root, compression,
+               max_entries_per_target=None, permissions=None, dereference=True, hardlink=False):
+    """
+    :param str artifact_root: The path under which cacheable products will be read/written.
+    :param str cache_root: The manifests for this cache are stored under this directory.
+    :param str blob_root: The directory holding the content-addressed blobs; may be shared by many
+                          caches.
+    :param int compression: The gzip compression level for tarballs created for remote caches.
+    :param int max_entries_per_target: The maximum number of old manifests to leave behind on a
+                                       cache miss.
+    :param str permissions: File permissions to use when creating manifest files.
+    :param bool dereference: Dereference symlinks when collecting artifacts.
+    :param bool hardlink: Hardlink blobs into place on extraction instead of copying them. Tasks
+                          must then not modify extracted files in place.
+    """
+    super(ContentAddressedLocalArtifactCache, self).__init__(
+      artifact_root,
+      compression,
+      permissions=int(permissions.strip(), base=8) if permissions else None,
+      dereference=dereference
+    )
+    self._cache_root = os.path.realpath(os.path.expanduser(cache_root))
+    self._blob_root = os.path.realpath(os.path.expanduser(blob_root))
+    self._max_entries_per_target = max_entries_per_target
+    self._hardlink = hardlink
+    safe_mkdir(self._cache_root)
+    safe_mkdir(self._blob_root)
+
+  def prune(self, root):
+    """Prune stale manifests, keeping the newest `max_entries_per_target` in `root`.
+
+    Blobs are shared between manifests (and possibly between caches), so they are only removed by a
+    periodic collection of the blobs that no manifest references.
+
+    :param str root: The path under which stale manifests will be cleaned.
+    """
+    max_entries_per_target = self._max_entries_per_target
+    if os.path.isdir(root) and max_entries_per_target:
+      safe_rm_oldest_items_in_dir(root, max_entries_per_target)
+      self._maybe_collect_garbage()
+
+  def _maybe_collect_garbage(self):
+    marker = os.path.join(self._blob_root, self._BLOB_GC_MARKER)
+    try:
+      if time.time() - os.path.getmtime(marker) < self._BLOB_GC_INTERVAL_SECS:
+        return
+    except OSError:
+      pass
+    # Claim this collection before running it, so that concurrent caches skip theirs.
+    touch(marker)
+    self._collect_garbage()
+
+  def _referenced_blobs(self):
+    """Return the paths of the blobs referenced by every manifest sharing our blob root."""
+    referenced = set()
+    manifests_root = os.path.dirname(self._blob_root)
+    for dirpath, dirnames, filenames in safe_walk(manifests_root):
+      if dirpath == manifests_root and os.path.basename(self._blob_root) in dirnames:
+        dirnames.remove(os.path.basename(self._blob_root))
+      for filename in filenames:
+        if not filename.endswith('.manifest'):
+          continue
+        try:
+          entries = self._read_manifest(os.path.join(dirpath, filename))
+        except (IOError, OSError, ValueError) as e:
+          # Unreadable manifests are deleted when they are used.
+          logger.debug('Ignoring unreadable manifest {}: {}'.format(filename, e))
+          continue
+        for _, kind, value in entries:
+          if kind in (self._FILE, self._EXECUTABLE):
+            referenced.add(self._blob_path(value, kind == self._EXECUTABLE))
+    return referenced
+
+  def _collect_garbage(self):
+    """Delete the blobs that are not referenced by any manifest sharing our blob root."""
+    referenced = self._referenced_blobs()
+    removed = 0
+    for prefix in os.listdir(self._blob_root):
+      prefix_dir = os.path.join(self._blob_root, prefix)
+      if not os.path.isdir(prefix_dir):
+        continue
+      for name in os.listdir(prefix_dir):
+        blob = os.path.join(prefix_dir, name)
+        if blob not in referenced:
+          safe_delete(blob)
+          removed += 1
+    if removed:
+      logger.debug('Removed {} unreferenced blobs from {}.'.format(removed, self._blob_root))
+
+  def has(self, cache_key):
+    return os.path.isfile(self._manifest_file_for_key(cache_key))
+
+  def try_insert(self, cache_key, paths):
+    self._store_manifest(cache_key, paths)
+
+  @contextmanager
+  def insert_paths(self, cache_key, paths):
+    """Store paths in this cache, and yield the path to a tarball of them for a remote cache."""
+    self._store_manifest(cache_key, paths)
+    with self._tmpfile(cache_key, 'write') as tmp:
+      self._artifact(tmp.name).collect(paths)
+      yield tmp.name
+
+  def store_and_use_artifact(self, cache_key, src, results_dir=None):
+    """Extract the tarball from the given `src` iterator, and then store its contents.
+
+    :param cache_key: Cache key for the artifact.
+    :param src: Iterator over binary tarball data for the artifact.
+    :param str results_dir: The path to the expected destination of the artifact extraction: will
+      be cleared both before extraction, and after a failure to extract.
+    """
+    with self._tmpfile(cache_key, 'read') as tmp:
+      for chunk in src:
+        tmp.write(chunk)
+      tmp.close()
+      artifact = self._artifact(tmp.name)
+
+      if results_dir is not None:
+        safe_mkdir(results_dir, clean=True)
+
+      try:
+        artifact.extract()
+      except Exception:
+        if results_dir is not None:
+          safe_mkdir(results_dir, clean=True)
+        raise
+
+      self._store_manifest(cache_key, list(artifact.get_paths()))
+      return True
+
+  def use_cached_files(self, cache_key, results_dir=None):
+    manifest_file = self._manifest_file_for_key(cache_key)
+    try:
+      if not os.path.isfile(manifest_file):
+        return False
+      entries = self._read_manifest(manifest_file)
+      if results_dir is not None:
+        safe_rmtree(results_dir)
+      self._materialize(entries)
+      return True
+    except Exception as e:
+      logger.warn('Error while reading {0} from local artifact cache: {1}'.format(manifest_file, e))
+      safe_delete(manifest_file)
+      return UnreadableArtifact(cache_key, e)
+
+  def delete(self, cache_key):
+    safe_delete(self._manifest_file_for_key(cache_key))
+
+  def _manifest_file_for_key(self, cache_key):
+    # As with `LocalArtifactCache`, both the id and the hash are used, because two different
+    # targets may have the same hash.
+    return os.path.join(self._cache_root, cache_key.id, cache_key.hash) + '.manifest'
+
+  def _blob_path(self, digest, executable):
+    # Executable and non-executable copies of the same content are distinct blobs, since a hardlink
+    # shares its mode with the blob.
+    name = '{}.x'.format(digest) if executable else digest
+    return os.path.join(self._blob_root, digest[:2], name)
+
+  def _store_blob(self, path, executable):
+    digest = hash_file(path)
+    blob = self._blob_path(digest, executable)
+    if not os.path.exists(blob):
+      with safe_concurrent_creation(blob) as tmp_blob:
+        shutil.copyfile(path, tmp_blob)
+        os.chmod(tmp_blob, 0o555 if executable else 0o444)
+    return digest
+
+  def _entry_for_file(self, path):
+    if not self._dereference and os.path.islink(path):
+      return self._SYMLINK, os.readlink(path)
+    executable = bool(os.stat(path).st_mode & stat.S_IXUSR)
+    return (self._EXECUTABLE if executable else self._FILE), self._store_blob(path, executable)
+
+  def _collect_entries(self, paths):
+    """Store blobs for all files under `paths`, returning a dict of relpath to manifest entry."""
+    entries = {}
+
+    def add(path):
+      relpath = os.path.relpath(path, self.artifact_root)
+      if relpath in entries:
+        return False
+      if os.path.isdir(path) and (self._dereference or not os.path.islink(path)):
+        entries[relpath] = (self._DIR, None)
+      else:
+        entries[relpath] = self._entry_for_file(path)
+      return True
+
+    for path in paths or ():
+      # Directories that were already walked as a descendant of an earlier path are skipped.
+      if add(path) and entries[os.path.relpath(path, self.artifact_root)][0] == self._DIR:
+        for dirpath, dirnames, filenames in safe_walk(path, followlinks=self._dereference):
+          for name in dirnames + filenames:
+            add(os.path.join(dirpath, name))
+    return entries
+
+  def _store_manifest(self, cache_key, paths):
+    entries = self._collect_entries(paths)
+    manifest = {
+      'version': self._MANIFEST_VERSION,
+      'entries': sorted([relpath, kind, value] for relpath, (kind, value) in entries.items()),
+    }
+    dest = self._manifest_file_for_key(cache_key)
+    safe_mkdir_for(dest)
+    with self._tmpfile(cache_key, 'manifest') as tmp:
+      json.dump(manifest, tmp)
+      tmp.close()
+      os.rename(tmp.name, dest)
+    if self._permissions:
+      os.chmod(dest, self._permissions)
+
+    # A concurrent collection may have removed blobs that already existed before our manifest
+    # referenced them: store them again.
+    for relpath, (kind, value) in entries.items():
+      if kind in (self._FILE, self._EXECUTABLE):
+        executable = kind == self._EXECUTABLE
+        if not os.path.isfile(self._blob_path(value, executable)):
+          self._store_blob(os.path.join(self.artifact_root, relpath), executable)
+
+    self.prune(os.path.dirname(dest))
+    return dest
+
+  def _read_manifest(self, manifest_file):
+    with open(manifest_file, 'rb') as fp:
+      manifest = json.load(fp)
+    if manifest.get('version') != self._MANIFEST_VERSION:
+      raise ValueError('Unsupported manifest version: {}'.format(manifest.get('version')))
+    return manifest['entries']
+
+  def _ensure_dir(self, path):
+    # Artifacts may be extracted concurrently into shared parent directories.
+    try:
+      os.makedirs(path)
+    except OSError as e:
+      if e.errno != errno.EEXIST:
+        raise
+
+  def _link_or_copy(self, blob, dst):
+    if self._hardlink:
+      try:
+        os.link(blob, dst)
+        return
+      except OSError as e:
+        if e.errno not in self._LINK_UNSUPPORTED_ERRNOS:
+          raise
+        logger.debug('Unable to hardlink {} to {}, falling back to copying: {}'.format(blob, dst, e))
+        self._hardlink = False
+    shutil.copyfile(blob, dst)
+    # Blobs are read-only, but copies of them may be modified.
+    os.chmod(dst, stat.S_IMODE(os.stat(blob).st_mode) | stat.S_IWUSR)
+
+  def _materialize(self, entries):
+    # Entries are sorted by relpath, so parent directories precede their contents.
+    for relpath, kind, value in entries:
+      dst = os.path.join(self.artifact_root, relpath)
+      if kind == self._DIR:
+        self._ensure_dir(dst)
+        continue
+      self._ensure_dir(os.path.dirname(dst))
+      safe_delete(dst)
+      if kind == self._SYMLINK:
+        os.symlink(value, dst)
+      elif kind in (self._FILE, self._EXECUTABLE):
+        blob = self._blob_path(value, kind == self._EXECUTABLE)
+        if not os.path.isfile(blob):
+          raise IOError(errno.ENOENT, 'Missing blob for {}'.format(relpath), blob)
+        self._link_or_copy(blob, dst)
+      else:
+        raise ValueError('Unknown manifest entry kind {!r} for {}'.format(kind, relpath))
@@ -5,6 +5,7 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import threading
 import urlparse
 from collections import Counter, deque
 from contextlib import contextmanager
@@ -88,6 +89,18 @@ class BestUrlSelector(object):
     self.parsed_urls = deque(self._parse_urls(available_urls))
     self.unsuccessful_calls = Counter()
     self.max_failures = max_failures
+    self._lock = threading.Lock()
+
+  def __getstate__(self):
+    # Selectors are pickled to be used by the subprocesses of `Context.subproc_map`, which each get
+    # their own lock.
+    state = self.__dict__.copy()
+    del state['_lock']
+    return state
+
+  def __setstate__(self, state):
+    self.__dict__.update(state)
+    self._lock = threading.Lock()
 
   def _parse_urls(self, urls):
     parsed_urls = [urlparse.urlparse(url) for url in urls]
@@ -108,16 +121,20 @@ class BestUrlSelector(object):
     by one element).
     """
 
-    best_url = self.parsed_urls[0]
+    with self._lock:
+      best_url = self.parsed_urls[0]
     try:
       yield best_url
     except Exception:
-      self.unsuccessful_calls[best_url] += 1
-
-      # Not thread-safe but pool used by cache is based on subprocesses, therefore no race.
-      if self.unsuccessful_calls[best_url] > self.max_failures:
-        self.parsed_urls.rotate(-1)
-        self.unsuccessful_calls[best_url] = 0
+      # Urls may be selected concurrently by threads: only the failures of the current best url
+      # count towards rotating it, so that concurrent failures rotate the urls at most once.
+      with self._lock:
+        if self.parsed_urls[0] == best_url:
+          self.unsuccessful_calls[best_url] += 1
+          if self.unsuccessful_calls[best_url] > self.max_failures:
+            self.parsed_urls.rotate(-1)
+            self.unsuccessful_calls[best_url] = 0
       raise
     else:
-      self.unsuccessful_calls[best_url] = 0
+      with self._lock:
+        self.unsuccessful_calls[best_url] = 0
@@ -7,11 +7,14 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import logging
 import multiprocessing
+import os
 import Queue
 import threading
+from multiprocessing.pool import ThreadPool
 
 import requests
 from requests import RequestException
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from pants.cache.artifact_cache import ArtifactCache, NonfatalArtifactCacheError, UnreadableArtifact
 
@@ -25,11 +28,29 @@ logging.getLogger('requests').setLevel(logging.WARNING)
 
 class RequestsSession(object):
   _session = None
+  _pid = None
+  _max_connections_per_host = DEFAULT_POOLSIZE
 
   @classmethod
-  def instance(cls):
-    if cls._session is None:
+  def instance(cls, max_connections_per_host=None):
+    """Returns a Session for this process that keeps connections to each cache host alive.
+
+    :param int max_connections_per_host: The number of keep-alive connections to keep open per cache
+      host. This should be at least the number of requests issued concurrently, so that they re-use
+      connections rather than re-connecting.
+    """
+    # Connections must not be shared with the subprocesses of `Context.subproc_map`, which are
+    # forked from this process: each process gets its own session.
+    pid = os.getpid()
+    if cls._session is None or cls._pid != pid or (
+        max_connections_per_host and max_connections_per_host > cls._max_connections_per_host):
+      cls._max_connections_per_host = max(max_connections_per_host or 0,
+                                          cls._max_connections_per_host)
       cls._session = requests.Session()
+      adapter = HTTPAdapter(pool_maxsize=cls._max_connections_per_host)
+      cls._session.mount('http://', adapter)
+      cls._session.mount('https://', adapter)
+      cls._pid = pid
     return cls._session
 
 
@@ -38,19 +59,23 @@ class RESTfulArtifactCache(ArtifactCache):
 
   READ_SIZE_BYTES = 4 * 1024 * 1024
 
-  def __init__(self, artifact_root, best_url_selector, local):
+  def __init__(self, artifact_root, best_url_selector, local, max_concurrent_requests=16):
     """
     :param string artifact_root: The path under which cacheable products will be read/written.
     :param BestUrlSelector best_url_selector: Url selector that supports fail-over. Each returned
       url represents prefix for some RESTful service. We must be able to PUT and GET to any path
       under this base.
     :param BaseLocalArtifactCache local: local cache instance for storing and creating artifacts
+    :param int max_concurrent_requests: The maximum number of requests to have in flight at once
+      when checking for many artifacts in `has_all`, and so the number of keep-alive connections to
+      keep open to each cache host.
     """
     super(RESTfulArtifactCache, self).__init__(artifact_root)
 
     self.best_url_selector = best_url_selector
     self._timeout_secs = 4.0
     self._localcache = local
+    self._max_concurrent_requests = max_concurrent_requests
 
   def try_insert(self, cache_key, paths):
     # Delegate creation of artifact to local cache.
@@ -65,6 +90,44 @@ class RESTfulArtifactCache(ArtifactCache):
       return True
     return self._request('HEAD', cache_key) is not None
 
+  def has_all(self, cache_keys):
+    """Checks for many keys at once, issuing the remote existence checks concurrently.
+
+    Keys found in the local cache are not checked remotely. The remaining keys are checked with
+    up to `max_concurrent_requests` requests in flight over keep-alive connections, so that checking
+    thousands of keys is not dominated by serialized round trips.
+
+    A key whose remote check fails with an error is reported as missing. After the first error, the
+    keys that remain to be checked are reported as missing without a request, so that an unavailable
+    cache costs a single timeout rather than one per key.
+    """
+    results = [self._localcache.has(cache_key) for cache_key in cache_keys]
+    remote_indices = [i for i, found in enumerate(results) if not found]
+    if remote_indices:
+      failed = threading.Event()
+
+      def remote_has(cache_key):
+        if failed.is_set():
+          return False
+        try:
+          return self._request('HEAD', cache_key) is not None
+        except NonfatalArtifactCacheError as e:
+          if not failed.is_set():
+            failed.set()
+            logger.warn('\nError while checking remote artifact cache, treating the remaining '
+                        'artifacts as missing: {0}\n'.format(e))
+          return False
+
+      pool = ThreadPool(processes=min(self._max_concurrent_requests, len(remote_indices)))
+      try:
+        found = pool.map(remote_has, [cache_keys[i] for i in remote_indices], chunksize=1)
+      finally:
+        pool.close()
+        pool.join()
+      for i, was_found in zip(remote_indices, found):
+        results[i] = was_found
+    return results
+
   def use_cached_files(self, cache_key, results_dir=None):
     if self._localcache.has(cache_key):
       return self._localcache.use_cached_files(cache_key, results_dir)
@@ -101,7 +164,7 @@ class RESTfulArtifactCache(ArtifactCache):
   # Returns a response if we get a 200, None if we get a 404 and raises an exception otherwise.
   def _request(self, method, cache_key, body=None):
 
-    session = RequestsSession.instance()
+    session = RequestsSession.instance(self._max_concurrent_requests)
     with self.best_url_selector.select_best_url() as best_url:
       url = self._url_for_key(best_url, cache_key)
       logger.debug('Sending {0} request to {1}'.format(method, url))
@@ -5,20 +5,6 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
-from pants.core_tasks.bash_completion import BashCompletion
-from pants.core_tasks.clean import Clean
-from pants.core_tasks.deferred_sources_mapper import DeferredSourcesMapper
-from pants.core_tasks.explain_options_task import ExplainOptionsTask
-from pants.core_tasks.list_goals import ListGoals
-from pants.core_tasks.noop import NoopCompile, NoopTest
-from pants.core_tasks.pantsd_kill import PantsDaemonKill
-from pants.core_tasks.reporting_server_kill import ReportingServerKill
-from pants.core_tasks.reporting_server_run import ReportingServerRun
-from pants.core_tasks.roots import ListRoots
-from pants.core_tasks.run_prep_command import (RunBinaryPrepCommand, RunCompilePrepCommand,
-                                               RunTestPrepCommand)
-from pants.core_tasks.substitute_aliased_targets import SubstituteAliasedTargets
-from pants.core_tasks.targets_help import TargetsHelp
 from pants.goal.goal import Goal
 from pants.goal.task_registrar import TaskRegistrar as task
 from pants.task.fmt_task_mixin import FmtTaskMixin
@@ -54,10 +40,10 @@ def register_goals():
   # Register tasks.
 
   # Cleaning.
-  task(name='clean-all', action=Clean).install('clean-all')
+  task(name='clean-all', action='pants.core_tasks.clean:Clean').install('clean-all')
 
   # Pantsd.
-  kill_pantsd = task(name='kill-pantsd', action=PantsDaemonKill)
+  kill_pantsd = task(name='kill-pantsd', action='pants.core_tasks.pantsd_kill:PantsDaemonKill')
   kill_pantsd.install()
   # Kill pantsd/watchman first, so that they're not using any files
   # in .pants.d at the time of removal.
@@ -65,32 +51,45 @@ def register_goals():
 
   # Reporting server.
   # TODO: The reporting server should be subsumed into pantsd, and not run via a task.
-  task(name='server', action=ReportingServerRun, serialize=False).install()
-  task(name='killserver', action=ReportingServerKill, serialize=False).install()
+  task(name='server',
+       action='pants.core_tasks.reporting_server_run:ReportingServerRun', serialize=False).install()
+  task(name='killserver',
+       action='pants.core_tasks.reporting_server_kill:'
+              'ReportingServerKill', serialize=False).install()
 
   # Getting help.
-  task(name='goals', action=ListGoals).install()
-  task(name='options', action=ExplainOptionsTask).install()
-  task(name='targets', action=TargetsHelp).install()
+  task(name='goals', action='pants.core_tasks.list_goals:ListGoals').install()
+  task(name='options', action='pants.core_tasks.explain_options_task:ExplainOptionsTask').install()
+  task(name='targets', action='pants.core_tasks.targets_help:TargetsHelp').install()
 
   # Stub for other goals to schedule 'compile'. See noop_exec_task.py for why this is useful.
-  task(name='compile', action=NoopCompile).install('compile')
+  task(name='compile', action='pants.core_tasks.noop:NoopCompile').install('compile')
 
   # Prep commands must be the first thing we register under its goal.
-  task(name='test-prep-command', action=RunTestPrepCommand).install('test', first=True)
-  task(name='binary-prep-command', action=RunBinaryPrepCommand).install('binary', first=True)
-  task(name='compile-prep-command', action=RunCompilePrepCommand).install('compile', first=True)
+  task(name='test-prep-command',
+       action='pants.core_tasks.run_prep_command:RunTestPrepCommand').install('test', first=True)
+  task(name='binary-prep-command',
+       action='pants.core_tasks.run_prep_command:'
+              'RunBinaryPrepCommand').install('binary', first=True)
+  task(name='compile-prep-command',
+       action='pants.core_tasks.run_prep_command:'
+              'RunCompilePrepCommand').install('compile', first=True)
 
   # Stub for other goals to schedule 'test'. See noop_exec_task.py for why this is useful.
-  task(name='test', action=NoopTest).install('test')
+  task(name='test', action='pants.core_tasks.noop:NoopTest').install('test')
 
   # Workspace information.
-  task(name='roots', action=ListRoots).install()
-  task(name='bash-completion', action=BashCompletion).install()
+  task(name='roots', action='pants.core_tasks.roots:ListRoots').install()
+  task(name='bash-completion', action='pants.core_tasks.bash_completion:BashCompletion').install()
+  task(name='stats-report', action='pants.core_tasks.stats_report:StatsReport').install()
+  task(name='startup-benchmark',
+       action='pants.core_tasks.startup_benchmark:StartupBenchmark').install()
 
   # Handle sources that aren't loose files in the repo.
-  task(name='deferred-sources', action=DeferredSourcesMapper).install()
+  task(name='deferred-sources',
+       action='pants.core_tasks.deferred_sources_mapper:DeferredSourcesMapper').install()
 
   # Processing aliased targets has to occur very early.
-  task(name='substitute-aliased-targets', action=SubstituteAliasedTargets).install(
+  task(name='substitute-aliased-targets',
+       action='pants.core_tasks.substitute_aliased_targets:SubstituteAliasedTargets').install(
     'bootstrap', first=True)
@@ -0,0 +1,98 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import json
+import os
+import sys
+
+from pkg_resources import Requirement, working_set
+from twitter.common.collections import OrderedSet
+
+from pants.base.exceptions import TaskError
+from pants.core_tasks.stats_report import percentile
+from pants.task.console_task import ConsoleTask
+from pants.util.process_handler import subprocess
+
+
+# Imports the comma-separated modules named by each of its args in order, and writes the time each
+# arg took as a json list.
+_IMPORT_TIMER = """
+import importlib, json, sys, time
+times = []
+for modules in sys.argv[1:]:
+  start = time.time()
+  for module in filter(None, modules.split(',')):
+    importlib.import_module(module)
+  times.append(time.time() - start)
+json.dump(times, sys.stdout)
+"""
+
+
+class StartupBenchmark(ConsoleTask):
+  """Measure the time that a cold start spends importing each backend and plugin.
+
+  By default, backends and then plugins are imported in the order that they are loaded in, in a
+  fresh interpreter, so that each is charged only for the modules that no earlier one imported.
+  Tasks that are installed by the names of their classes are only imported once their goals are
+  scheduled, so they are not charged to the backends that install them.
+  """
+
+  @classmethod
+  def register_options(cls, register):
+    super(StartupBenchmark, cls).register_options(register)
+    register('--repeats', type=int, default=3,
+             help='Import the backends and plugins in this many fresh interpreters and report '
+                  'median times.')
+    register('--isolated', type=bool,
+             help='Import each backend and plugin in its own fresh interpreter, charging it for '
+                  'all of the modules that it imports.')
+
+  def _time_imports(self, modules, paths):
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(OrderedSet(sys.path + paths))
+    cmd = [sys.executable, '-c', _IMPORT_TIMER] + modules
+    try:
+      return json.loads(subprocess.check_output(cmd, env=env))
+    except (subprocess.CalledProcessError, ValueError) as e:
+      raise TaskError('Failed to time the import of {}: {}'.format(', '.join(modules), e))
+
+  def _plugin_modules(self, plugin):
+    dist = working_set.find(Requirement.parse(plugin))
+    if not dist:
+      raise TaskError('Could not find plugin: {}'.format(plugin))
+    entry_points = dist.get_entry_map().get('pantsbuild.plugin', {})
+    modules = OrderedSet(entry_point.module_name for _, entry_point in sorted(entry_points.items()))
+    return dist.location, ','.join(modules)
+
+  def console_output(self, targets):
+    # NB: This mirrors the order that `pants.init.extension_loader` loads backends and plugins in.
+    global_options = self.context.options.for_global_scope()
+    backends = list(OrderedSet(['pants.build_graph', 'pants.core_tasks'] +
+                               global_options.backend_packages))
+    names = backends + global_options.plugins
+    modules = ['{}.register'.format(backend) for backend in backends]
+    paths = []
+    for plugin in global_options.plugins:
+      path, plugin_modules = self._plugin_modules(plugin)
+      paths.append(path)
+      modules.append(plugin_modules)
+
+    times_by_name = {name: [] for name in names}
+    for _ in range(self.get_options().repeats):
+      if self.get_options().isolated:
+        times = [self._time_imports([module], paths)[0] for module in modules]
+      else:
+        times = self._time_imports(modules, paths)
+      for name, time in zip(names, times):
+        times_by_name[name].append(time)
+
+    total = 0
+    for name in names:
+      median = percentile(sorted(times_by_name[name]), 50)
+      total += median
+      yield '{:8.3f}s  {}'.format(median, name)
+    yield '{:8.3f}s  total'.format(total)
@@ -0,0 +1,115 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import re
+
+from pants.base.exceptions import TaskError
+from pants.stats.statsdb import StatsDB, StatsDBError, StatsDBFactory
+from pants.task.console_task import ConsoleTask
+
+
+def percentile(sorted_values, p):
+  """Returns the p'th percentile of a non-empty sorted list, interpolating between ranks."""
+  rank = (len(sorted_values) - 1) * p / 100
+  lower = int(rank)
+  upper = min(lower + 1, len(sorted_values) - 1)
+  return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def find_regression(values, threshold, min_delta=0, higher_is_better=False, min_baseline=3):
+  """Finds the first run of a regression that was sustained through the latest of the values.
+
+  A value has regressed if it is worse than the median of all of the values preceding the first
+  regressed value by more than `threshold` (a fraction of the median) and by more than `min_delta`.
+
+  :param list values: Values in chronological order.
+  :returns: The index of the first regressed value and the median it regressed from, or None.
+  """
+  def regressed(value, baseline):
+    delta = baseline - value if higher_is_better else value - baseline
+    return delta > min_delta and delta > threshold * abs(baseline)
+
+  for i in range(min_baseline, len(values)):
+    baseline = percentile(sorted(values[:i]), 50)
+    if all(regressed(value, baseline) for value in values[i:]):
+      return i, baseline
+  return None
+
+
+class StatsReport(ConsoleTask):
+  """Report percentiles of the stats recorded in the statsdb over recent runs, and regressions."""
+
+  # Series for which a decrease is a regression.
+  _HIGHER_IS_BETTER = frozenset(['artifact_cache_hit_rates'])
+
+  @classmethod
+  def subsystem_dependencies(cls):
+    return super(StatsReport, cls).subsystem_dependencies() + (StatsDBFactory,)
+
+  @classmethod
+  def register_options(cls, register):
+    super(StatsReport, cls).register_options(register)
+    register('--series', type=list, default=['cumulative_timings'],
+             help='Report these kinds of stats: any of {}.'.format(', '.join(StatsDB.SERIES)))
+    register('--num-runs', type=int, default=20,
+             help='Report on the stats of this many of the most recent matching runs.')
+    register('--cmd-line-like', default='%',
+             help='Only report on runs whose command lines are LIKE this (in the SQL sense), '
+                  'e.g. "% compile %".')
+    register('--labels', type=list, default=[],
+             help='Only report on labels matching one of these regexes, e.g. "compile.zinc".')
+    register('--threshold', type=float, default=0.2,
+             help='Flag a label as regressed once its values have been worse than the median of '
+                  'its preceding values by more than this fraction of it.')
+    register('--min-delta', type=float, default=0.5,
+             help='Ignore timing changes of fewer than this many seconds.')
+    register('--regressions-only', type=bool,
+             help='Only report on labels that have regressed.')
+
+  def console_output(self, targets):
+    options = self.get_options()
+    label_regexes = [re.compile(label) for label in options.labels]
+    statsdb = StatsDBFactory.global_instance().get_db()
+
+    runs = statsdb.get_recent_runs(options.cmd_line_like, options.num_runs)
+    revision_by_run = {run_id: revision for run_id, _, revision in runs}
+
+    for series in options.series:
+      try:
+        values_by_label = statsdb.get_series(series, options.cmd_line_like, options.num_runs)
+      except StatsDBError as e:
+        raise TaskError(e)
+      is_timing = series.endswith('_timings')
+      higher_is_better = series in self._HIGHER_IS_BETTER
+
+      lines = []
+      for label, value_by_run in sorted(values_by_label.items()):
+        if label_regexes and not any(r.search(label) for r in label_regexes):
+          continue
+        run_ids = [run_id for run_id, _, _ in runs if run_id in value_by_run]
+        values = [value_by_run[run_id] for run_id in run_ids]
+        regression = find_regression(values, options.threshold,
+                                     min_delta=options.min_delta if is_timing else 0,
+                                     higher_is_better=higher_is_better)
+        if options.regressions_only and not regression:
+          continue
+
+        sorted_values = sorted(values)
+        line = '  {}: {} runs, p50 {:.3f}, p90 {:.3f}, latest {:.3f}'.format(
+          label, len(values), percentile(sorted_values, 50), percentile(sorted_values, 90),
+          values[-1])
+        if regression:
+          index, baseline = regression
+          change = (values[-1] - baseline) / baseline if baseline else float('inf')
+          line += ', REGRESSED {:+.1%} from {:.3f} in run {} (revision {})'.format(
+            change, baseline, run_ids[index], revision_by_run[run_ids[index]] or 'unknown')
+        lines.append(line)
+
+      if lines:
+        yield '{}:'.format(series)
+        for line in lines:
+          yield line
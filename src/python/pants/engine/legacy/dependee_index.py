@@ -0,0 +1,233 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import itertools
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from hashlib import sha1
+
+from pants.base.specs import SiblingAddresses, Specs
+from pants.build_graph.address import Address
+from pants.build_graph.injectables_mixin import InjectablesMixin
+from pants.engine.fs import FilesContent, PathGlobs
+from pants.engine.legacy.graph import HydratedTargets
+from pants.util.dirutil import safe_concurrent_creation, safe_mkdir_for
+
+
+logger = logging.getLogger(__name__)
+
+
+def declared_dependencies(target_types, target_adaptor):
+  """Returns the addresses of the declared and implicit dependencies of a TargetAdaptor."""
+  target_cls = target_types[target_adaptor.type_alias]
+  implicit_deps = (Address.parse(s)
+                   for s in target_cls.compute_dependency_specs(kwargs=target_adaptor.kwargs()))
+  return itertools.chain(target_adaptor.dependencies, implicit_deps)
+
+
+class DependeeIndex(object):
+  """An index from the addresses of targets to the addresses of the targets that depend on them.
+
+  The dependencies of the targets declared in each directory are recorded along with a digest of
+  the BUILD files in that directory, and updating the index re-parses only the directories whose
+  BUILD files have changed since they were last indexed. The index is persisted to `path` (if
+  given) after each update, so that a repo-wide build of it is only ever needed once.
+
+  Implicit dependencies are recorded as well. Those that subsystems inject are determined by
+  option values rather than by BUILD files, so the injectable specs of the target types'
+  subsystems are part of the configuration that the persisted index is only valid for.
+  """
+
+  _VERSION = 1
+
+  def __init__(self, scheduler, target_types, build_patterns=None, build_ignore_patterns=None,
+               exclude_target_regexps=None, path=None):
+    """
+    :param scheduler: The `Scheduler` to read and parse BUILD files with.
+    :param dict target_types: A dict of target alias to Target type, used to determine the implicit
+      dependencies of targets.
+    :param list build_patterns: Patterns matching the names of BUILD files.
+    :param list build_ignore_patterns: Patterns of paths to ignore when searching for BUILD files.
+    :param list exclude_target_regexps: Regular expressions for targets excluded from the graph: as
+      with `build_ignore_patterns`, the index is discarded if these change.
+    :param str path: An optional file in which to persist the index between runs.
+    """
+    self._scheduler = scheduler
+    self._target_types = target_types
+    self._build_patterns = tuple(build_patterns or ('BUILD', 'BUILD.*'))
+    self._build_ignore_patterns = tuple(build_ignore_patterns or ())
+    self._path = path
+    self._static_config = self._config_fingerprint(target_types, self._build_patterns,
+                                                   self._build_ignore_patterns,
+                                                   exclude_target_regexps or ())
+    # The injectable specs depend on the options of the run, so they're fingerprinted on first use.
+    self._config = None
+    self._lock = threading.Lock()
+    # Directory -> (digest, tuple of (Address, tuple of dependency Addresses)), once loaded.
+    self._entries = None
+    self._dependees = defaultdict(set)
+    self._addresses = {}
+
+  @staticmethod
+  def _config_fingerprint(target_types, build_patterns, build_ignore_patterns,
+                          exclude_target_regexps):
+    hasher = sha1()
+    hasher.update(json.dumps([
+      DependeeIndex._VERSION,
+      sorted('{}={}.{}'.format(alias, target_type.__module__, target_type.__name__)
+             for alias, target_type in target_types.items()),
+      list(build_patterns),
+      list(build_ignore_patterns),
+      list(exclude_target_regexps),
+    ]))
+    return hasher.hexdigest()
+
+  @staticmethod
+  def _injectables_fingerprint(target_types):
+    hasher = sha1()
+    subsystem_types = set()
+    for target_type in target_types.values():
+      subsystem_types.update(target_type.subsystems())
+    for subsystem_type in sorted(subsystem_types, key=lambda t: t.options_scope):
+      if issubclass(subsystem_type, InjectablesMixin) and subsystem_type.is_initialized():
+        mapping = subsystem_type.global_instance().injectables_spec_mapping
+        hasher.update(json.dumps([subsystem_type.options_scope, mapping], sort_keys=True))
+    return hasher.hexdigest()
+
+  def _current_config(self):
+    if self._config is None:
+      self._config = '{}:{}'.format(self._static_config,
+                                    self._injectables_fingerprint(self._target_types))
+    return self._config
+
+  def update(self):
+    """Brings the index up to date with the BUILD files in the repo.
+
+    :returns: This index.
+    """
+    with self._lock:
+      digests = self._build_dir_digests()
+      entries = self._loaded_entries()
+
+      removed = [d for d in entries if d not in digests]
+      stale = sorted(d for d, digest in digests.items()
+                     if d not in entries or entries[d][0] != digest)
+      if not removed and not stale:
+        return self
+
+      logger.debug('re-indexing dependees declared in {} directories'.format(len(stale)))
+      for directory in removed:
+        self._unindex(directory)
+      for directory, targets in self._parse(stale).items():
+        self._unindex(directory)
+        self._index(directory, digests[directory], targets)
+      self._save()
+    return self
+
+  def dependees_of(self, address):
+    """Returns the addresses of the targets that directly depend on the given address.
+
+    :rtype: set of :class:`pants.build_graph.address.Address`
+    """
+    with self._lock:
+      self._loaded_entries()
+      return set(self._dependees.get(address, ()))
+
+  @property
+  def dependees_by_address(self):
+    """A dict of Address to the set of Addresses of its dependees: callers must not modify it."""
+    with self._lock:
+      self._loaded_entries()
+      return self._dependees
+
+  def _build_dir_digests(self):
+    include = [os.path.join('**', pattern) for pattern in self._build_patterns]
+    path_globs = PathGlobs.create('', include=include, exclude=self._build_ignore_patterns)
+    files_content, = self._scheduler.product_request(FilesContent, [path_globs])
+    hashers = defaultdict(sha1)
+    for file_content in sorted(files_content.dependencies, key=lambda fc: fc.path):
+      hasher = hashers[os.path.dirname(file_content.path)]
+      hasher.update(os.path.basename(file_content.path).encode('utf-8'))
+      hasher.update(b'\0')
+      hasher.update(sha1(file_content.content).hexdigest())
+    return {directory: hasher.hexdigest() for directory, hasher in hashers.items()}
+
+  def _parse(self, directories):
+    """Returns a dict of directory to the targets declared in it, and their dependencies."""
+    targets_by_dir = {directory: [] for directory in directories}
+    if not directories:
+      return targets_by_dir
+    specs = Specs(tuple(SiblingAddresses(directory) for directory in directories))
+    hydrated_targets, = self._scheduler.product_request(HydratedTargets, [specs])
+    for hydrated_target in hydrated_targets.dependencies:
+      adaptor = hydrated_target.adaptor
+      address = self._address(adaptor.address.spec)
+      dependencies = tuple(self._address(dependency.spec)
+                           for dependency in declared_dependencies(self._target_types, adaptor))
+      targets_by_dir[address.spec_path].append((address, dependencies))
+    return targets_by_dir
+
+  def _address(self, spec):
+    # Addresses are interned, since each is referenced by all of its dependees.
+    address = self._addresses.get(spec)
+    if address is None:
+      address = self._addresses[spec] = Address.parse(spec)
+    return address
+
+  def _index(self, directory, digest, targets):
+    self._entries[directory] = (digest, tuple(targets))
+    for address, dependencies in targets:
+      for dependency in dependencies:
+        self._dependees[dependency].add(address)
+
+  def _unindex(self, directory):
+    entry = self._entries.pop(directory, None)
+    if entry is None:
+      return
+    for address, dependencies in entry[1]:
+      for dependency in dependencies:
+        dependees = self._dependees.get(dependency)
+        if dependees is not None:
+          dependees.discard(address)
+          if not dependees:
+            del self._dependees[dependency]
+
+  def _loaded_entries(self):
+    if self._entries is None:
+      self._entries = {}
+      for directory, (digest, targets) in self._load().items():
+        self._index(directory, digest, targets)
+    return self._entries
+
+  def _load(self):
+    if not self._path or not os.path.isfile(self._path):
+      return {}
+    try:
+      with open(self._path, 'rb') as fp:
+        index = json.load(fp)
+      if index.get('config') != self._current_config():
+        return {}
+      return {directory: (digest, [(self._address(spec), tuple(self._address(d) for d in deps))
+                                   for spec, deps in targets])
+              for directory, (digest, targets) in index['dirs'].items()}
+    except (IOError, ValueError, KeyError, TypeError) as e:
+      logger.debug('Ignoring unreadable dependee index in {}: {}'.format(self._path, e))
+      return {}
+
+  def _save(self):
+    if not self._path:
+      return
+    dirs = {directory: [digest, [[address.spec, [d.spec for d in dependencies]]
+                                 for address, dependencies in targets]]
+            for directory, (digest, targets) in self._entries.items()}
+    safe_mkdir_for(self._path)
+    with safe_concurrent_creation(self._path) as tmp_path:
+      with open(tmp_path, 'wb') as fp:
+        json.dump({'config': self._current_config(), 'dirs': dirs}, fp)
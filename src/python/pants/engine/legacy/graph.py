@@ -50,6 +50,41 @@ class _DestWrapper(datatype(['target_types'])):
   """
 
 
+class TargetCache(object):
+  """A cache of instantiated Targets, keyed by the identity of the HydratedTarget they came from.
+
+  The engine memoizes HydratedTargets, and returns the same HydratedTarget object for an address
+  until the nodes it was computed from are invalidated. An identical HydratedTarget thus implies
+  that its Target would be instantiated identically, so a long-lived cache (e.g. in pantsd) lets
+  each new LegacyBuildGraph skip re-instantiating unchanged Targets.
+
+  Cached Targets are detached from any BuildGraph: each graph receives its own copy (see
+  `Target.copy_for_build_graph`), so graphs never observe one another's Targets.
+  """
+
+  def __init__(self):
+    # Address -> (HydratedTarget, detached Target).
+    self._entries = {}
+
+  def __len__(self):
+    return len(self._entries)
+
+  def get(self, hydrated_target, build_graph):
+    """Returns a copy of the Target cached for the given HydratedTarget, or None if there is none.
+
+    :param build_graph: The BuildGraph that the returned copy will live within.
+    """
+    entry = self._entries.get(hydrated_target.address)
+    if entry is None or entry[0] is not hydrated_target:
+      return None
+    return entry[1].copy_for_build_graph(build_graph)
+
+  def put(self, hydrated_target, target):
+    """Caches the Target instantiated from the given HydratedTarget."""
+    # Detach the cached copy, so that it doesn't retain the graph it was instantiated in.
+    self._entries[hydrated_target.address] = (hydrated_target, target.copy_for_build_graph(None))
+
+
 class LegacyBuildGraph(BuildGraph):
   """A directed acyclic graph of Targets and dependencies. Not necessarily connected.
 
@@ -57,24 +92,26 @@ class LegacyBuildGraph(BuildGraph):
   """
 
   @classmethod
-  def create(cls, scheduler, symbol_table):
+  def create(cls, scheduler, symbol_table, target_cache=None):
     """Construct a graph given a Scheduler, Engine, and a SymbolTable class."""
-    return cls(scheduler, target_types_from_symbol_table(symbol_table))
+    return cls(scheduler, target_types_from_symbol_table(symbol_table), target_cache=target_cache)
 
-  def __init__(self, scheduler, target_types):
+  def __init__(self, scheduler, target_types, target_cache=None):
     """Construct a graph given a Scheduler, Engine, and a SymbolTable class.
 
     :param scheduler: A Scheduler that is configured to be able to resolve TransitiveHydratedTargets.
     :param symbol_table: A SymbolTable instance used to instantiate Target objects. Must match
       the symbol table installed in the scheduler (TODO: see comment in `_instantiate_target`).
+    :param TargetCache target_cache: An optional cache of previously instantiated Targets.
     """
     self._scheduler = scheduler
     self._target_types = target_types
+    self._target_cache = target_cache
     super(LegacyBuildGraph, self).__init__()
 
   def clone_new(self):
     """Returns a new BuildGraph instance of the same type and with the same __init__ params."""
-    return LegacyBuildGraph(self._scheduler, self._target_types)
+    return LegacyBuildGraph(self._scheduler, self._target_types, target_cache=self._target_cache)
 
   def _index(self, hydrated_targets):
     """Index from the given roots into the storage provided by the base class.
@@ -90,7 +127,7 @@ class LegacyBuildGraph(BuildGraph):
       address = target_adaptor.address
       all_addresses.add(address)
       if address not in self._target_by_address:
-        new_targets.append(self._index_target(target_adaptor))
+        new_targets.append(self._index_target(hydrated_target))
 
     # Once the declared dependencies of all targets are indexed, inject their
     # additional "traversable_(dependency_)?specs".
@@ -119,11 +156,18 @@ class LegacyBuildGraph(BuildGraph):
 
     return all_addresses
 
-  def _index_target(self, target_adaptor):
-    """Instantiate the given TargetAdaptor, index it in the graph, and return a Target."""
-    # Instantiate the target.
+  def _index_target(self, hydrated_target):
+    """Instantiate the given HydratedTarget, index it in the graph, and return a Target."""
+    # Instantiate the target, or reuse a cached instantiation of it.
+    target_adaptor = hydrated_target.adaptor
     address = target_adaptor.address
-    target = self._instantiate_target(target_adaptor)
+    if self._target_cache is None:
+      target = self._instantiate_target(target_adaptor)
+    else:
+      target = self._target_cache.get(hydrated_target, self)
+      if target is None:
+        target = self._instantiate_target(target_adaptor)
+        self._target_cache.put(hydrated_target, target)
     self._target_by_address[address] = target
 
     for dependency in target_adaptor.dependencies:
@@ -136,6 +180,7 @@ class LegacyBuildGraph(BuildGraph):
       # Link its declared dependencies, which will be indexed independently.
       self._target_dependencies_by_address[address].add(dependency)
       self._target_dependees_by_address[dependency].add(address)
+    self._invalidate_closure_index()
     return target
 
   def _instantiate_target(self, target_adaptor):
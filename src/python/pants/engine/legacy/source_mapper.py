@@ -6,8 +6,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import os
-
-import six
+from collections import defaultdict
 
 from pants.base.specs import AscendantAddresses, SingleAddress, Specs
 from pants.build_graph.address import parse_spec
@@ -33,10 +32,26 @@ def resolve_and_parse_specs(*args, **kwargs):
 
 
 class EngineSourceMapper(SourceMapper):
-  """A v2 engine backed SourceMapper that supports pre-`BuildGraph` cache warming in the daemon."""
+  """A v2 engine backed SourceMapper that supports pre-`BuildGraph` cache warming in the daemon.
+
+  Each lookup still requests the `HydratedTarget`s declared in the ancestor directories of the
+  given sources, since that is how BUILD file edits are observed. But the mapper maintains a
+  reverse index from existing source paths to the addresses of the targets that own them, so that
+  only targets whose `HydratedTarget` has changed since they were indexed have their sources
+  expanded: the engine memoizes each `HydratedTarget` until a watchman invalidation dirties it. A
+  mapper that lives in the daemon (as the `EngineChangeCalculator`'s does) therefore keeps its
+  index warm across runs. Sources that the index does not cover (BUILD files, and deleted files,
+  which can only be matched against a target's filespec) are matched against the candidates.
+  """
 
   def __init__(self, scheduler):
     self._scheduler = scheduler
+    # Address -> (HydratedTarget, frozenset of owned paths) for each indexed target.
+    self._indexed_targets = {}
+    # Path -> set of addresses of the indexed targets that own it.
+    self._owners_by_path = defaultdict(set)
+    # Spec path -> set of addresses of the indexed targets declared in it.
+    self._addresses_by_spec_path = defaultdict(set)
 
   def _unique_dirs_for_sources(self, sources):
     """Given an iterable of sources, yield unique dirname'd paths."""
@@ -75,6 +90,58 @@ class EngineSourceMapper(SourceMapper):
 
     return False
 
+  def _owned_paths(self, legacy_target):
+    """Given a `HydratedTarget` instance, return the set of existing paths that it owns."""
+    target_kwargs = legacy_target.adaptor.kwargs()
+    owned_paths = set()
+
+    target_source = target_kwargs.get('source')
+    if target_source:
+      owned_paths.add(os.path.join(legacy_target.adaptor.address.spec_path, target_source))
+
+    target_sources = target_kwargs.get('sources')
+    if target_sources:
+      owned_paths.update(target_sources.paths_from_buildroot_iter())
+
+    return frozenset(owned_paths)
+
+  def _unindex(self, address):
+    _, owned_paths = self._indexed_targets.pop(address)
+    addresses = self._addresses_by_spec_path[address.spec_path]
+    addresses.discard(address)
+    if not addresses:
+      del self._addresses_by_spec_path[address.spec_path]
+    for path in owned_paths:
+      owners = self._owners_by_path[path]
+      owners.discard(address)
+      if not owners:
+        del self._owners_by_path[path]
+
+  def _index(self, hydrated_targets_by_address, spec_paths):
+    """Bring the index up to date with the given current `HydratedTarget`s.
+
+    :param dict hydrated_targets_by_address: The current targets declared in `spec_paths`.
+    :param set spec_paths: The directories that were searched for `hydrated_targets_by_address`:
+      previously indexed targets in these directories that are no longer declared are dropped.
+    """
+    for spec_path in spec_paths:
+      for address in list(self._addresses_by_spec_path.get(spec_path, ())):
+        if address not in hydrated_targets_by_address:
+          self._unindex(address)
+
+    for address, hydrated_target in hydrated_targets_by_address.items():
+      indexed = self._indexed_targets.get(address)
+      if indexed:
+        # The engine returns the same `HydratedTarget` until the target has been invalidated.
+        if indexed[0] is hydrated_target:
+          continue
+        self._unindex(address)
+      owned_paths = self._owned_paths(hydrated_target)
+      self._indexed_targets[address] = (hydrated_target, owned_paths)
+      self._addresses_by_spec_path[address.spec_path].add(address)
+      for path in owned_paths:
+        self._owners_by_path[path].add(address)
+
   def iter_target_addresses_for_sources(self, sources):
     """Bulk, iterable form of `target_addresses_for_source`."""
     # Walk up the buildroot looking for targets that would conceivably claim changed sources.
@@ -82,14 +149,34 @@ class EngineSourceMapper(SourceMapper):
     specs = tuple(AscendantAddresses(directory=d) for d in self._unique_dirs_for_sources(sources_set))
 
     # Uniqify all transitive hydrated targets.
-    hydrated_target_to_address = {}
+    hydrated_targets_by_address = {}
     hydrated_targets, = self._scheduler.product_request(HydratedTargets, [Specs(specs)])
     for hydrated_target in hydrated_targets.dependencies:
-      if hydrated_target not in hydrated_target_to_address:
-        hydrated_target_to_address[hydrated_target] = hydrated_target.adaptor.address
-
-    for hydrated_target, legacy_address in six.iteritems(hydrated_target_to_address):
-      # Handle BUILD files.
-      if (LegacyAddressMapper.any_is_declaring_file(legacy_address, sources_set) or
-          self._owns_any_source(sources_set, hydrated_target)):
+      hydrated_targets_by_address.setdefault(hydrated_target.adaptor.address, hydrated_target)
+
+    spec_paths = set(address.spec_path for address in hydrated_targets_by_address)
+    for spec in specs:
+      directory = spec.directory
+      while directory:
+        spec_paths.add(directory)
+        directory = os.path.dirname(directory)
+    spec_paths.add('')
+    self._index(hydrated_targets_by_address, spec_paths)
+
+    owners = set()
+    unowned_sources = set()
+    for source in sources_set:
+      indexed_owners = self._owners_by_path.get(source)
+      if indexed_owners:
+        owners.update(indexed_owners)
+      else:
+        unowned_sources.add(source)
+
+    for legacy_address, hydrated_target in hydrated_targets_by_address.items():
+      if legacy_address in owners:
+        yield legacy_address
+      # Handle BUILD files, and sources that are not indexed because they don't exist (deleted files
+      # are only matched by filespec).
+      elif (LegacyAddressMapper.any_is_declaring_file(legacy_address, sources_set) or
+            (unowned_sources and self._owns_any_source(unowned_sources, hydrated_target))):
         yield legacy_address
@@ -399,7 +399,8 @@ class LocalScheduler(object):
     filenames = set(direct_filenames)
     filenames.update(os.path.dirname(f) for f in direct_filenames)
     invalidated = self._scheduler.invalidate(filenames)
-    logger.info('invalidated %d nodes for: %s', invalidated, filenames)
+    logger.info('invalidated %d nodes for %d files', invalidated, len(filenames))
+    logger.debug('invalidated files: %s', filenames)
     return invalidated
 
   def node_count(self):
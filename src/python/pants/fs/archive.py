@@ -5,10 +5,14 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import multiprocessing
 import os
+import time
+import zlib
 from abc import abstractmethod
-from collections import OrderedDict
-from zipfile import ZIP_DEFLATED
+from collections import OrderedDict, deque
+from multiprocessing.pool import ThreadPool
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipInfo
 
 from pants.util.contextutil import open_tar, open_zip, temporary_dir
 from pants.util.dirutil import safe_concurrent_rename, safe_walk
@@ -107,13 +111,30 @@ class ZipArchiver(Archiver):
         if (not filter_func or filter_func(name)):
           archive_file.extract(name, outdir)
 
-  def __init__(self, compression, extension):
+  # Members with these extensions are almost always compressed already, and so gain next to nothing
+  # from being deflated again: they are stored as-is.
+  STORED_EXTENSIONS = frozenset([
+    '.bz2', '.ear', '.gif', '.gz', '.jar', '.jpeg', '.jpg', '.pex', '.png', '.tgz', '.war', '.whl',
+    '.xz', '.zip',
+  ])
+
+  # Members larger than this are deflated while being streamed into the archive by the writing
+  # thread, rather than being deflated in memory by a compression worker.
+  _MAX_BUFFERED_MEMBER_SIZE = 16 * 1024 * 1024
+
+  _READ_CHUNK_SIZE = 1024 * 1024
+
+  def __init__(self, compression, extension, compression_workers=1):
     """
     :API: public
+
+    :param int compression_workers: The number of threads to deflate members with. Regardless of
+      this, members are written to the archive in the order in which they are walked.
     """
     super(ZipArchiver, self).__init__(extension)
     self.compression = compression
     self.extension = extension
+    self.compression_workers = compression_workers
 
   def create(self, basedir, outdir, name, prefix=None):
     """
@@ -121,25 +142,110 @@ class ZipArchiver(Archiver):
     """
     zippath = os.path.join(outdir, '{}.{}'.format(name, self.extension))
     with open_zip(zippath, 'w', compression=self.compression) as zip:
-      # For symlinks, we want to archive the actual content of linked files but
-      # under the relpath derived from symlink.
-      for root, _, files in safe_walk(basedir, followlinks=True):
-        root = ensure_text(root)
-        for file in files:
-          file = ensure_text(file)
-          full_path = os.path.join(root, file)
-          relpath = os.path.relpath(full_path, basedir)
-          if prefix:
-            relpath = os.path.join(ensure_text(prefix), relpath)
-          zip.write(full_path, relpath)
+      members = self._walk(basedir, prefix)
+      if self.compression == ZIP_DEFLATED and self.compression_workers > 1:
+        self._write_concurrently(zip, members)
+      else:
+        for full_path, relpath in members:
+          zip.write(full_path, relpath, compress_type=self._compress_type(relpath))
     return zippath
 
+  def _walk(self, basedir, prefix):
+    # For symlinks, we want to archive the actual content of linked files but
+    # under the relpath derived from symlink.
+    for root, _, files in safe_walk(basedir, followlinks=True):
+      root = ensure_text(root)
+      for file in files:
+        file = ensure_text(file)
+        full_path = os.path.join(root, file)
+        relpath = os.path.relpath(full_path, basedir)
+        if prefix:
+          relpath = os.path.join(ensure_text(prefix), relpath)
+        yield full_path, relpath
+
+  def _compress_type(self, relpath):
+    if os.path.splitext(relpath)[1].lower() in self.STORED_EXTENSIONS:
+      return ZIP_STORED
+    return self.compression
+
+  def _write_concurrently(self, zip, members):
+    """Writes members to the zip in order, deflating those that fit in memory on a thread pool.
+
+    zlib releases the GIL while compressing, so the workers deflate in parallel while this thread
+    writes finished members (and streams stored or very large ones) to the archive. At most a few
+    members per worker are in flight, which bounds the memory held by deflated members.
+    """
+    max_pending = 2 * self.compression_workers
+    pending = deque()
+
+    def write_next():
+      full_path, relpath, compress_type, deflated = pending.popleft()
+      if deflated is None:
+        zip.write(full_path, relpath, compress_type=compress_type)
+      else:
+        self._write_deflated(zip, *deflated.get())
+
+    pool = ThreadPool(processes=self.compression_workers)
+    try:
+      for full_path, relpath in members:
+        compress_type = self._compress_type(relpath)
+        deflated = None
+        if (compress_type == ZIP_DEFLATED and
+            os.path.getsize(full_path) <= self._MAX_BUFFERED_MEMBER_SIZE):
+          deflated = pool.apply_async(self._deflate, (full_path, relpath))
+        pending.append((full_path, relpath, compress_type, deflated))
+        if len(pending) > max_pending:
+          write_next()
+      while pending:
+        write_next()
+    finally:
+      pool.terminate()
+      pool.join()
+
+  @classmethod
+  def _deflate(cls, full_path, relpath):
+    """Returns a ZipInfo for the given file and its deflated content, as `ZipFile.write` would."""
+    st = os.stat(full_path)
+    zinfo = ZipInfo(os.path.normpath(relpath).lstrip(os.sep), time.localtime(st.st_mtime)[0:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = ZIP_DEFLATED
+
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    chunks = []
+    crc = 0
+    file_size = 0
+    with open(full_path, 'rb') as fp:
+      for chunk in iter(lambda: fp.read(cls._READ_CHUNK_SIZE), b''):
+        file_size += len(chunk)
+        crc = zlib.crc32(chunk, crc)
+        chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+    data = b''.join(chunks)
+
+    zinfo.file_size = file_size
+    zinfo.CRC = crc & 0xffffffff
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+  @staticmethod
+  def _write_deflated(zip, zinfo, data):
+    # `ZipFile` has no public API to add a member that was compressed elsewhere: this mirrors what
+    # `ZipFile.write` does, for a member whose CRC and sizes are known before its header is written.
+    zinfo.header_offset = zip.fp.tell()
+    zip._writecheck(zinfo)
+    zip._didModify = True
+    zip.fp.write(zinfo.FileHeader())
+    zip.fp.write(data)
+    zip.filelist.append(zinfo)
+    zip.NameToInfo[zinfo.filename] = zinfo
+
 archive_extensions = dict(tar='tar', tgz='tar.gz', tbz2='tar.bz2', zip='zip')
 
 TAR = TarArchiver('w:', archive_extensions['tar'])
 TGZ = TarArchiver('w:gz', archive_extensions['tgz'])
 TBZ2 = TarArchiver('w:bz2', archive_extensions['tbz2'])
-ZIP = ZipArchiver(ZIP_DEFLATED, archive_extensions['zip'])
+ZIP = ZipArchiver(ZIP_DEFLATED, archive_extensions['zip'],
+                  compression_workers=multiprocessing.cpu_count())
 
 _ARCHIVER_BY_TYPE = OrderedDict(tar=TAR, tgz=TGZ, tbz2=TBZ2, zip=ZIP)
 
@@ -159,7 +265,8 @@ def archiver(typename):
   'tar'   Returns a tar archiver that applies no compression and emits .tar files.
   'tgz'   Returns a tar archiver that applies gzip compression and emits .tar.gz files.
   'tbz2'  Returns a tar archiver that applies bzip2 compression and emits .tar.bz2 files.
-  'zip'   Returns a zip archiver that applies standard compression and emits .zip files.
+  'zip'   Returns a zip archiver that applies standard compression and emits .zip files. Members
+    that are already compressed (see `ZipArchiver.STORED_EXTENSIONS`) are stored as-is.
   'jar'   Returns a jar archiver that applies no compression and emits .jar files.
     Note this is provided as a light way of zipping input files into a jar, without the
     need to prepare Manifest etc. For more advanced usages, please refer to :class:
@@ -18,9 +18,11 @@ from pants.base.workunit import WorkUnitLabel
 from pants.build_graph.target import Target
 from pants.goal.products import Products
 from pants.goal.workspace import ScmWorkspace
+from pants.option.options_fingerprinter import OptionsFingerprinter
 from pants.process.lock import OwnerPrintingInterProcessFileLock
 from pants.reporting.report import Report
 from pants.source.source_root import SourceRootConfig
+from pants.util.memo import memoized_property
 
 
 class Context(object):
@@ -61,7 +63,7 @@ class Context(object):
   def __init__(self, options, run_tracker, target_roots,
                requested_goals=None, target_base=None, build_graph=None,
                build_file_parser=None, address_mapper=None, console_outstream=None, scm=None,
-               workspace=None, invalidation_report=None, scheduler=None):
+               workspace=None, invalidation_report=None, scheduler=None, dependee_index=None):
     self._options = options
     self.build_graph = build_graph
     self.build_file_parser = build_file_parser
@@ -81,6 +83,7 @@ class Context(object):
     self._replace_targets(target_roots)
     self._invalidation_report = invalidation_report
     self._scheduler = scheduler
+    self._dependee_index = dependee_index
 
   @property
   def options(self):
@@ -151,6 +154,25 @@ class Context(object):
   def invalidation_report(self):
     return self._invalidation_report
 
+  @memoized_property
+  def options_fingerprinter(self):
+    """Returns the fingerprinter for options in this run.
+
+    It memoizes the fingerprints of file and dir options, so that their contents are read at most
+    once per run no matter how many tasks fingerprint them.
+
+    :rtype: :class:`pants.option.options_fingerprinter.OptionsFingerprinter`
+    """
+    return OptionsFingerprinter(self.build_graph)
+
+  @property
+  def dependee_index(self):
+    """Returns the index of the dependees of targets in the repo, if any.
+
+    :rtype: :class:`pants.engine.legacy.dependee_index.DependeeIndex`
+    """
+    return self._dependee_index
+
   def __str__(self):
     ident = Target.identify(self.targets())
     return 'Context(id:{}, targets:{})'.format(ident, self.targets())
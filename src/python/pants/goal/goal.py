@@ -41,6 +41,8 @@ class Goal(object):
   :API: public
   """
   _goal_by_name = dict()
+  # A function to call with each task type that is loaded from now on, if any.
+  _load_callback = None
 
   def __new__(cls, *args, **kwargs):
     raise TypeError('Do not instantiate {0}. Call by_name() instead.'.format(cls))
@@ -92,6 +94,19 @@ class Goal(object):
     :API: public
     """
     cls._goal_by_name.clear()
+    cls._load_callback = None
+
+  @classmethod
+  def set_load_callback(cls, callback):
+    """Sets a function to call with each task type that is loaded from now on.
+
+    The task types of tasks that were installed by name are loaded lazily: only when they are first
+    needed. This allows the options of tasks that are loaded after options were registered to be
+    registered in turn.
+
+    :param callback: A function of a task type, or `None` to unset the current callback.
+    """
+    cls._load_callback = callback
 
   @staticmethod
   def scope(goal_name, task_name):
@@ -111,12 +126,26 @@ class Goal(object):
 
   @classmethod
   def get_optionables(cls):
+    """Returns the goal options registrars, and the task types that have been loaded so far."""
     for goal in cls.all():
       if goal._options_registrar_cls:
         yield goal._options_registrar_cls
-      for task_type in goal.task_types():
+      for task_type in goal.loaded_task_types():
         yield task_type
 
+  @classmethod
+  def unloaded_task_scopes(cls):
+    """Returns the options scopes of the tasks whose task types have not been loaded yet."""
+    for goal in cls.all():
+      for scope in goal.unloaded_task_scopes():
+        yield scope
+
+  @classmethod
+  def load_all(cls):
+    """Loads the task types of all tasks."""
+    for goal in cls.all():
+      goal.task_types()
+
   @classmethod
   def subsystems(cls):
     """Returns all subsystem types used by all tasks, in no particular order.
@@ -140,7 +169,8 @@ class _Goal(object):
     self._description = ''
     self._options_registrar_cls = None
     self.serialize = False
-    self._task_type_by_name = {}  # name -> Task subclass.
+    self._task_registrar_by_name = {}  # name -> TaskRegistrar.
+    self._task_type_by_name = {}  # name -> Task subclass, for the tasks loaded so far.
     self._ordered_task_names = []  # The task names, in the order imposed by registration.
 
   @property
@@ -149,7 +179,8 @@ class _Goal(object):
       return self._description
     # Return the docstring for the Task registered under the same name as this goal, if any.
     # This is a very common case, and therefore a useful idiom.
-    namesake_task = self._task_type_by_name.get(self.name)
+    namesake_task = (self.task_type_by_name(self.name)
+                     if self.name in self._task_registrar_by_name else None)
     if namesake_task and namesake_task.__doc__:
       # First line of docstring.
       # TODO: This is repetitive of Optionable.get_description(). We should probably just
@@ -179,21 +210,19 @@ class _Goal(object):
 
     otn = self._ordered_task_names
     if replace:
-      for tt in self.task_types():
+      for tt in self.loaded_task_types():
         tt.options_scope = None
       del otn[:]
+      self._task_registrar_by_name = {}
       self._task_type_by_name = {}
 
     task_name = task_registrar.name
-    if task_name in self._task_type_by_name:
+    if task_name in self._task_registrar_by_name:
       raise GoalError(
         'Can only specify a task name once per goal, saw multiple values for {} in goal {}'.format(
           task_name,
           self.name))
     Optionable.validate_scope_name_component(task_name)
-    options_scope = Goal.scope(self.name, task_name)
-
-    task_type = _create_stable_task_type(task_registrar.task_type, options_scope)
 
     if first:
       otn.insert(0, task_name)
@@ -204,7 +233,9 @@ class _Goal(object):
     else:
       otn.append(task_name)
 
-    self._task_type_by_name[task_name] = task_type
+    self._task_registrar_by_name[task_name] = task_registrar
+    if task_registrar.loaded:
+      self._load(task_name)
 
     if task_registrar.serialize:
       self.serialize = True
@@ -221,9 +252,10 @@ class _Goal(object):
 
     :API: public
     """
-    if name in self._task_type_by_name:
-      self._task_type_by_name[name].options_scope = None
-      del self._task_type_by_name[name]
+    if name in self._task_registrar_by_name:
+      if name in self._task_type_by_name:
+        self._task_type_by_name.pop(name).options_scope = None
+      del self._task_registrar_by_name[name]
       self._ordered_task_names = [x for x in self._ordered_task_names if x != name]
     else:
       raise GoalError('Cannot uninstall unknown task: {0}'.format(name))
@@ -240,16 +272,37 @@ class _Goal(object):
     return self._ordered_task_names
 
   def task_type_by_name(self, name):
-    """The task type registered under the given name."""
-    return self._task_type_by_name[name]
+    """The task type registered under the given name, loading it if need be."""
+    return self._task_type_by_name.get(name) or self._load(name)
 
   def task_types(self):
-    """Returns the task types in this goal, unordered."""
+    """Returns the task types in this goal, unordered, loading them if need be."""
+    return [self.task_type_by_name(name) for name in self._task_registrar_by_name]
+
+  def loaded_task_types(self):
+    """Returns the task types in this goal that have been loaded so far, unordered."""
     return self._task_type_by_name.values()
 
+  def unloaded_task_scopes(self):
+    """Returns the options scopes of the tasks in this goal that have not been loaded yet."""
+    return [Goal.scope(self.name, name) for name in self._task_registrar_by_name
+            if name not in self._task_type_by_name]
+
   def task_items(self):
-    for name, task_type in self._task_type_by_name.items():
-      yield name, task_type
+    for name in self._task_registrar_by_name:
+      yield name, self.task_type_by_name(name)
+
+  def _load(self, name):
+    if name != self.name and self.name in self._task_registrar_by_name:
+      # The scope of the namesake task encloses the scopes of the goal's other tasks: load it first,
+      # so that options can be registered on the enclosing scope before the enclosed ones.
+      self.task_type_by_name(self.name)
+    task_registrar = self._task_registrar_by_name[name]
+    task_type = _create_stable_task_type(task_registrar.task_type, Goal.scope(self.name, name))
+    self._task_type_by_name[name] = task_type
+    if Goal._load_callback:
+      Goal._load_callback(task_type)
+    return task_type
 
   def has_task_of_type(self, typ):
     """Returns True if this goal has a task of the given type (or a subtype of it)."""
@@ -266,7 +319,7 @@ class _Goal(object):
     providing tasks that implement the goal being installed. If no such plugins are installed, the
     goal may be inactive in the repo.
     """
-    return len(self._task_type_by_name) > 0
+    return len(self._task_registrar_by_name) > 0
 
   def __repr__(self):
     return self.name
@@ -15,6 +15,10 @@ class PantsDaemonStats(object):
     self.affected_targets_size = 0
     self.affected_targets_file_count = 0
     self.resulting_graph_size = None
+    self.invalidation_count = 0
+    self.invalidated_file_count = 0
+    self.invalidated_node_count = 0
+    self.invalidation_latency = 0.0
 
   def set_preceding_graph_size(self, size):
     self.preceding_graph_size = size
@@ -31,6 +35,14 @@ class PantsDaemonStats(object):
   def set_resulting_graph_size(self, size):
     self.resulting_graph_size = size
 
+  def set_invalidation_stats(self, invalidation_count, invalidated_file_count,
+                             invalidated_node_count, invalidation_latency):
+    """Records the daemon's filesystem event invalidations since the previous run."""
+    self.invalidation_count = invalidation_count
+    self.invalidated_file_count = invalidated_file_count
+    self.invalidated_node_count = invalidated_node_count
+    self.invalidation_latency = invalidation_latency
+
   def get_all(self):
     return {
       'preceding_graph_size': self.preceding_graph_size,
@@ -38,4 +50,8 @@ class PantsDaemonStats(object):
       'affected_targets_size': self.affected_targets_size,
       'affected_targets_file_count': self.affected_targets_file_count,
       'resulting_graph_size': self.resulting_graph_size,
+      'invalidation_count': self.invalidation_count,
+      'invalidated_file_count': self.invalidated_file_count,
+      'invalidated_node_count': self.invalidated_node_count,
+      'invalidation_latency': self.invalidation_latency,
     }
@@ -35,6 +35,8 @@ class UnionProducts(object):
     """
     # A map of target to OrderedSet of product members.
     self._products_by_target = products_by_target or defaultdict(OrderedSet)
+    # Targets whose OrderedSet is shared with a copy, and so must be copied before it is mutated.
+    self._shared_targets = set()
 
   def copy(self):
     """Returns a copy of this UnionProducts.
@@ -43,21 +45,32 @@ class UnionProducts(object):
     The copy is shallow though, so edits to the copy's product values will mutate the original's
     product values.
 
+    The copy is copy-on-write: the products for a target are only copied when either this
+    UnionProducts or the copy first edits them.
+
     :API: public
 
     :rtype: :class:`UnionProducts`
     """
-    products_by_target = defaultdict(OrderedSet)
-    for key, value in self._products_by_target.items():
-      products_by_target[key] = OrderedSet(value)
-    return UnionProducts(products_by_target=products_by_target)
+    products_by_target = defaultdict(OrderedSet, self._products_by_target)
+    union_products = UnionProducts(products_by_target=products_by_target)
+    self._shared_targets.update(products_by_target)
+    union_products._shared_targets.update(products_by_target)
+    return union_products
+
+  def _products_for_update(self, target):
+    products = self._products_by_target[target]
+    if target in self._shared_targets:
+      self._shared_targets.discard(target)
+      products = self._products_by_target[target] = OrderedSet(products)
+    return products
 
   def add_for_target(self, target, products):
     """Updates the products for a particular target, adding to existing entries.
 
     :API: public
     """
-    self._products_by_target[target].update(products)
+    self._products_for_update(target).update(products)
 
   def add_for_targets(self, targets, products):
     """Updates the products for the given targets, adding to existing entries.
@@ -73,8 +86,9 @@ class UnionProducts(object):
 
     :API: public
     """
+    target_products = self._products_for_update(target)
     for product in products:
-      self._products_by_target[target].discard(product)
+      target_products.discard(product)
 
   def get_for_target(self, target):
     """Gets the products for the given target.
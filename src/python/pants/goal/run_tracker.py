@@ -6,6 +6,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import ast
+import cProfile
 import json
 import multiprocessing
 import os
@@ -27,7 +28,7 @@ from pants.goal.pantsd_stats import PantsDaemonStats
 from pants.reporting.report import Report
 from pants.stats.statsdb import StatsDBFactory
 from pants.subsystem.subsystem import Subsystem
-from pants.util.dirutil import relative_symlink, safe_file_dump
+from pants.util.dirutil import relative_symlink, safe_file_dump, safe_mkdir_for
 
 
 class RunTracker(Subsystem):
@@ -76,6 +77,14 @@ class RunTracker(Subsystem):
              help='Number of threads for background work.')
     register('--stats-local-json-file', advanced=True, default=None,
              help='Write stats to this local json file on run completion.')
+    register('--profile-workunits', advanced=True, type=list, default=[],
+             help='Profile the Python code run in the workunits with these names (e.g. '
+                  '"compile" or "zinc"), writing a cProfile .prof file per workunit under the '
+                  'profiles dir of the run info dir, linked from the HTML report. Only the thread '
+                  'that runs the workunit is profiled, but its timings are of the CPU time of the '
+                  'whole process. A profiled workunit nested in another profiled workunit is '
+                  'covered by the outer profile, and workunits are not profiled while another '
+                  'profiler (e.g. PANTS_PROFILE) is active.')
 
   def __init__(self, *args, **kwargs):
     """
@@ -111,6 +120,9 @@ class RunTracker(Subsystem):
     # Number of threads for background work.
     self._num_background_workers = self.get_options().num_background_workers
 
+    # Names of workunits to profile.
+    self._profiled_workunit_names = frozenset(self.get_options().profile_workunits)
+
     # self._threadlocal.current_workunit contains the current workunit for the calling thread.
     # Note that multiple threads may share a name (e.g., all the threads in a pool).
     self._threadlocal = threading.local()
@@ -284,7 +296,8 @@ class RunTracker(Subsystem):
     outcome = WorkUnit.FAILURE  # Default to failure we will override if we get success/abort.
     try:
       self.report.start_workunit(workunit)
-      yield workunit
+      with self._maybe_profiled(workunit):
+        yield workunit
     except KeyboardInterrupt:
       outcome = WorkUnit.ABORTED
       self._aborted = True
@@ -295,6 +308,40 @@ class RunTracker(Subsystem):
       workunit.set_outcome(outcome)
       self.end_workunit(workunit)
 
+  # cProfile times wall time by default: profile the CPU time of the process instead.
+  _profile_timer = time.process_time if hasattr(time, 'process_time') else time.clock
+
+  @contextmanager
+  def _maybe_profiled(self, workunit):
+    """Profiles the calling thread for the duration of the workunit, if it is to be profiled.
+
+    A thread can only have a single active profiler, so a workunit is not profiled if the calling
+    thread is already profiling an enclosing workunit, or is being profiled by anything else.
+    """
+    if (workunit.name not in self._profiled_workunit_names or
+        getattr(self._threadlocal, 'profiling', False)):
+      yield
+      return
+    if sys.getprofile() is not None:
+      self.log(Report.WARN, 'Not profiling workunit {}: another profiler is already active.'
+                            .format(workunit.name))
+      yield
+      return
+
+    profiler = cProfile.Profile(self._profile_timer)
+    self._threadlocal.profiling = True
+    try:
+      profiler.enable()
+      yield
+    finally:
+      profiler.disable()
+      self._threadlocal.profiling = False
+      profile_path = os.path.join(self.run_info_dir, 'profiles',
+                                  '{}-{}.prof'.format(workunit.name, workunit.id))
+      safe_mkdir_for(profile_path)
+      profiler.dump_stats(profile_path)
+      workunit.profile_path = profile_path
+
   def log(self, level, *msg_elements):
     """Log a message against the current workunit."""
     self.report.log(self._threadlocal.current_workunit, level, *msg_elements)
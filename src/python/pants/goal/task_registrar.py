@@ -5,10 +5,14 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import importlib
 import sys
 import traceback
 from textwrap import dedent
 
+from six import string_types
+
+from pants.goal.error import GoalError
 from pants.goal.goal import Goal
 
 
@@ -20,7 +24,9 @@ class TaskRegistrar(object):
   def __init__(self, name, action, dependencies=None, serialize=True):
     """
     :param name: the name of the task.
-    :param action: the Task action object to invoke this task.
+    :param action: the Task action object to invoke this task, or the name of its class in the form
+      `module.path:ClassName`. A named class is only imported when the task is first needed: e.g.
+      when its goal is scheduled.
     :param dependencies: DEPRECATED
       the names of other goals which must be achieved before invoking this task's goal.
     :param serialize: a flag indicating whether or not the action to achieve this goal requires
@@ -54,8 +60,29 @@ class TaskRegistrar(object):
     """
     :API: public
     """
+    if not self.loaded:
+      self._task = self._load(self._task)
     return self._task
 
+  @property
+  def loaded(self):
+    """Return `True` if the task type of this task has been imported.
+
+    :rtype: bool
+    """
+    return not isinstance(self._task, string_types)
+
+  def _load(self, action):
+    module_path, _, class_name = action.partition(':')
+    if not module_path or not class_name:
+      raise GoalError('The action of task {} must be named as `module.path:ClassName`, given: {}'
+                      .format(self.name, action))
+    try:
+      return getattr(importlib.import_module(module_path), class_name)
+    except (ImportError, AttributeError) as e:
+      raise GoalError('Failed to load the action of task {} from {}: {}'
+                      .format(self.name, action, e))
+
   def install(self, goal=None, first=False, replace=False, before=None, after=None):
     """Install the task in the specified goal (or a new goal with the same name as the task).
 
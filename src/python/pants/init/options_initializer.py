@@ -5,8 +5,10 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import functools
 import logging
 import sys
+from collections import OrderedDict
 
 import pkg_resources
 
@@ -16,7 +18,11 @@ from pants.goal.goal import Goal
 from pants.init.extension_loader import load_backends_and_plugins
 from pants.init.plugin_resolver import PluginResolver
 from pants.logging.setup import setup_logging
+from pants.option.arg_splitter import ArgSplitter
+from pants.option.errors import ParseError
 from pants.option.global_options import GlobalOptionsRegistrar
+from pants.option.options import Options
+from pants.option.scope import ScopeInfo
 from pants.subsystem.subsystem import Subsystem
 
 
@@ -29,10 +35,23 @@ class OptionsInitializer(object):
   This class uses a class-level cache for the internally generated `BuildConfiguration` object,
   which permits multiple invocations in the same runtime context without re-incurring backend &
   plugin loading, which can be expensive and cause issues (double task registration, etc).
+
+  Registered options are cached at class-level too, so that invocations that differ only in their
+  cmd-line flags (e.g. consecutive runs in pantsd) don't re-register every option.
+
+  Backends may install tasks by the names of their classes, to defer importing them. Only the tasks
+  of the goals that an invocation mentions are loaded up front, unless it asks for help; tasks that
+  are loaded later on have their options registered as they load.
   """
 
   # Class-level cache for the `BuildConfiguration` object.
   _build_configuration = None
+  # The bootstrap option values that the cached `BuildConfiguration` was loaded for.
+  _build_configuration_key = None
+  # Class-level LRU cache of registered `Options` objects, keyed by their inputs other than flags.
+  _registered_options = OrderedDict()
+  # The maximum number of registered `Options` objects to cache.
+  _MAX_REGISTERED_OPTIONS = 4
 
   def __init__(self, options_bootstrapper, working_set=None, exiter=sys.exit):
     """
@@ -54,8 +73,10 @@ class OptionsInitializer(object):
     return cls._build_configuration
 
   @classmethod
-  def _set_build_configuration(cls, build_configuration):
+  def _set_build_configuration(cls, build_configuration, key=None):
     cls._build_configuration = build_configuration
+    cls._build_configuration_key = key
+    cls._registered_options = OrderedDict()
 
   @classmethod
   def reset(cls):
@@ -90,31 +111,121 @@ class OptionsInitializer(object):
     # `GoalRunner`->`EngineInitializer`->`OptionsInitializer`->`GoalRunner`.
     from pants.bin.goal_runner import GoalRunner
 
-    # Now that plugins and backends are loaded, we can gather the known scopes.
+    # Any task types that load from here on belong to this invocation.
+    Goal.set_load_callback(None)
+
+    # Task types are only loaded when needed, so first load those of the goals that the cmd-line
+    # mentions, then register options for everything loaded so far.
+    split_args = self._split_args(options_bootstrapper.args, build_configuration, GoalRunner)
+    if split_args is None:
+      Goal.load_all()
+    else:
+      self.load_tasks_for_scopes(split_args.scope_to_flags.keys())
+    options = self._register_options(options_bootstrapper, build_configuration, GoalRunner)
+
+    # Flags for the subsystems of tasks that were not loaded fail to parse: retry with all tasks.
+    try:
+      for scope in options.scope_to_flags:
+        options.for_scope(scope)
+    except ParseError:
+      if not any(Goal.unloaded_task_scopes()):
+        raise
+      Goal.load_all()
+      options = self._register_options(options_bootstrapper, build_configuration, GoalRunner)
+
+    Goal.set_load_callback(functools.partial(self._register_loaded_task_type, options))
 
+    # Make the options values available to all subsystems.
+    Subsystem.set_options(options)
+
+    return options
+
+  @classmethod
+  def _known_scope_infos(cls, build_configuration, goal_runner_cls):
     # Gather the optionables that are not scoped to any other.  All known scopes are reachable
     # via these optionables' known_scope_infos() methods.
     top_level_optionables = ({GlobalOptionsRegistrar} |
-                             GoalRunner.subsystems() |
+                             goal_runner_cls.subsystems() |
                              build_configuration.subsystems() |
                              set(Goal.get_optionables()))
 
-    known_scope_infos = sorted({
+    known_scope_infos = {
       si for optionable in top_level_optionables for si in optionable.known_scope_infos()
-    })
+    }
+    # The scopes of the tasks that have not been loaded yet are known by name alone, so that the
+    # cmd-line can be split among them. No options are registered on them until they are loaded.
+    known_scope_infos.update(ScopeInfo(scope, ScopeInfo.TASK) for scope in
+                             Goal.unloaded_task_scopes())
+    return sorted(known_scope_infos)
+
+  @classmethod
+  def _split_args(cls, args, build_configuration, goal_runner_cls):
+    """Splits the cmd-line among the known scopes.
+
+    :returns: The split args, or `None` if the cmd-line requests help, which needs every task.
+    """
+    known_scope_infos = Options.complete_scopes(cls._known_scope_infos(build_configuration,
+                                                                       goal_runner_cls))
+    splitter = ArgSplitter(known_scope_infos)
+    split_args = splitter.split_args(args)
+    return None if splitter.help_request else split_args
+
+  @staticmethod
+  def load_tasks_for_scopes(scopes, is_known_scope=None):
+    """Loads the task types of the goals that the given options scopes belong to.
+
+    :param scopes: The options scopes to load tasks for, e.g. the scopes of cmd-line flags or of
+      config sections.
+    :param is_known_scope: An optional function that returns `False` for a scope that may belong to
+      a subsystem of a task that was not loaded yet, in which case every task type is loaded.
+    """
+    if is_known_scope and not all(is_known_scope(scope) for scope in scopes):
+      Goal.load_all()
+      return
+    goal_names = {scope.partition('.')[0] for scope in scopes}
+    for goal in Goal.all():
+      if goal.name in goal_names:
+        goal.task_types()
+
+  def _register_options(self, options_bootstrapper, build_configuration, goal_runner_cls):
+    known_scope_infos = self._known_scope_infos(build_configuration, goal_runner_cls)
+
+    # Now that we have the known scopes we can get the full options, re-using the registered
+    # options of a previous invocation that differed only in its cmd-line flags, if any.
+    key = (options_bootstrapper.get_full_options_fingerprint(), tuple(known_scope_infos))
+    registered_options = self._registered_options.pop(key, None)
+    if registered_options:
+      # Re-insert the options, to evict the least recently used options first.
+      self._registered_options[key] = registered_options
+      bootstrap_option_values = options_bootstrapper.get_bootstrap_options().for_global_scope()
+      return registered_options.for_args(options_bootstrapper.args, bootstrap_option_values)
 
-    # Now that we have the known scopes we can get the full options.
     options = options_bootstrapper.get_full_options(known_scope_infos)
+    self._register_optionables(options, known_scope_infos)
+    if len(self._registered_options) >= self._MAX_REGISTERED_OPTIONS:
+      self._registered_options.popitem(last=False)
+    self._registered_options[key] = options
+    return options
 
-    distinct_optionable_classes = sorted({si.optionable_cls for si in known_scope_infos},
+  @staticmethod
+  def _register_optionables(options, scope_infos):
+    distinct_optionable_classes = sorted({si.optionable_cls for si in scope_infos
+                                          if si.optionable_cls},
                                          key=lambda o: o.options_scope)
     for optionable_cls in distinct_optionable_classes:
       optionable_cls.register_options_on_scope(options)
 
-    # Make the options values available to all subsystems.
-    Subsystem.set_options(options)
-
-    return options
+  @classmethod
+  def _register_loaded_task_type(cls, options, task_type):
+    # Register the options of a task type that was loaded after options were registered, and of any
+    # of its subsystems that were not known yet. Options are only registered on the scope of each
+    # optionable: scoped subsystem instances inherit them, as they did for eagerly loaded tasks.
+    scope_infos = [si for si in task_type.known_scope_infos()
+                   if options.known_scope_to_info.get(si.scope) != si]
+    if scope_infos:
+      options.add_scopes(scope_infos)
+      cls._register_optionables(options, [si for si in scope_infos
+                                          if si.scope == si.optionable_cls.options_scope])
 
   def setup(self, init_logging=True):
     """Initializes logging, loads backends/plugins and parses options.
@@ -137,12 +248,20 @@ class OptionsInitializer(object):
                           global_bootstrap_options.logdir)
 
     # Conditionally load backends/plugins and materialize a `BuildConfiguration` object.
-    if not self._has_build_configuration():
+    build_configuration_key = (tuple(global_bootstrap_options.pythonpath),
+                               tuple(global_bootstrap_options.plugins),
+                               tuple(global_bootstrap_options.backend_packages))
+    if (not self._has_build_configuration() or
+        self._build_configuration_key != build_configuration_key):
+      if self._has_build_configuration():
+        # The cached backends/plugins were loaded for different bootstrap options (e.g. by an
+        # earlier run in pantsd): unregister their goals before reloading.
+        Goal.clear()
       build_configuration = self._load_plugins(self._working_set,
                                                global_bootstrap_options.pythonpath,
                                                global_bootstrap_options.plugins,
                                                global_bootstrap_options.backend_packages)
-      self._set_build_configuration(build_configuration)
+      self._set_build_configuration(build_configuration, build_configuration_key)
     else:
       build_configuration = self._get_build_configuration()
 
@@ -10,17 +10,22 @@ from pants.init.options_initializer import OptionsInitializer
 from pants.subsystem.subsystem import Subsystem
 
 
-def clean_global_runtime_state(reset_subsystem=False):
+def clean_global_runtime_state(reset_subsystem=False, reset_backends=True):
   """Resets the global runtime state of a pants runtime for cleaner forking.
 
   :param bool reset_subsystem: Whether or not to clean Subsystem global state.
+  :param bool reset_backends: Whether or not to clean loaded backends/plugins, along with their
+                              Goals, Tasks and registered options. If retained, `OptionsInitializer`
+                              still reloads them for runs whose bootstrap options call for
+                              different backends/plugins.
   """
   if reset_subsystem:
     # Reset subsystem state.
     Subsystem.reset()
 
-  # Reset Goals and Tasks.
-  Goal.clear()
+  if reset_backends:
+    # Reset Goals and Tasks.
+    Goal.clear()
 
-  # Reset backend/plugins state.
-  OptionsInitializer.reset()
+    # Reset backend/plugins state.
+    OptionsInitializer.reset()
@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import errno
 import hashlib
+import io
 import os
 from abc import abstractmethod
 from collections import namedtuple
@@ -15,7 +16,7 @@ from pants.base.hash_utils import hash_all
 from pants.build_graph.target import Target
 from pants.fs.fs import safe_filename
 from pants.subsystem.subsystem import Subsystem
-from pants.util.dirutil import safe_mkdir
+from pants.util.dirutil import safe_delete, safe_mkdir
 from pants.util.meta import AbstractClass
 
 
@@ -95,11 +96,10 @@ class CacheKeyGenerator(CacheKeyGeneratorInterface):
     hasher.update(GLOBAL_CACHE_KEY_GEN_VERSION)
     for base_fingerprint_input in base_fingerprint_inputs:
       hasher.update(base_fingerprint_input)
-    self._base_hasher = hasher
+    self._key_suffix = hasher.hexdigest()[:12]
 
   def key_for_target(self, target, transitive=False, fingerprint_strategy=None):
-    hasher = self._base_hasher.copy()
-    key_suffix = hasher.hexdigest()[:12]
+    key_suffix = self._key_suffix
     if transitive:
       target_key = target.transitive_invalidation_hash(fingerprint_strategy)
     else:
@@ -127,6 +127,15 @@ class BuildInvalidator(object):
   class Factory(Subsystem):
     options_scope = 'build-invalidator'
 
+    @classmethod
+    def register_options(cls, register):
+      super(BuildInvalidator.Factory, cls).register_options(register)
+      register('--store', advanced=True, choices=['files', 'log'], default='files',
+               help='How to store target fingerprints. files: one small file per target per '
+                    'task, so checking N previously built targets opens N files. log: one '
+                    'append-only log per task, read in bulk once per run and compacted as it '
+                    'grows.')
+
     @classmethod
     def create(cls, build_task=None):
       """Creates a build invalidator optionally scoped to a task.
@@ -135,7 +144,10 @@ class BuildInvalidator(object):
                              supplied the build invalidator will act globally across all build
                              tasks.
       """
-      root = os.path.join(cls.global_instance().get_options().pants_workdir, 'build_invalidator')
+      options = cls.global_instance().get_options()
+      root = os.path.join(options.pants_workdir, 'build_invalidator')
+      if options.store == 'log':
+        return LogBuildInvalidator(root, scope=build_task)
       return BuildInvalidator(root, scope=build_task)
 
   @staticmethod
@@ -174,6 +186,24 @@ class BuildInvalidator(object):
       return None
     return CacheKey(cache_key.id, previous_hash)
 
+  def previous_keys(self, cache_keys):
+    """Bulk form of `previous_key`, which looks up the previous hashes of all of the keys at once.
+
+    Only a `LogBuildInvalidator` reads all of them with a single read: this (file per target)
+    invalidator still reads one file per previously built key, but skips the keys that have never
+    been built with a single listing of its root.
+
+    :param list cache_keys: A list of CacheKey objects.
+    :returns: A list of the previous cache_key (or None) for each of the given keys, in order.
+    """
+    cacheable_ids = [cache_key.id for cache_key in cache_keys if self.cacheable(cache_key)]
+    previous_hashes = self._read_shas_by_id(cacheable_ids)
+    previous_keys = []
+    for cache_key in cache_keys:
+      previous_hash = previous_hashes.get(cache_key.id) if self.cacheable(cache_key) else None
+      previous_keys.append(CacheKey(cache_key.id, previous_hash) if previous_hash else None)
+    return previous_keys
+
   def needs_update(self, cache_key):
     """Check if the given cached item is invalid.
 
@@ -194,18 +224,19 @@ class BuildInvalidator(object):
     if self.cacheable(cache_key):
       self._write_sha(cache_key)
 
+  # Incremented whenever any invalidator clears its root, which may contain the roots of other
+  # (scoped) invalidators in this process.
+  _generation = 0
+
   def force_invalidate_all(self):
     """Force-invalidates all cached items."""
     safe_mkdir(self._root, clean=True)
+    BuildInvalidator._generation += 1
 
   def force_invalidate(self, cache_key):
     """Force-invalidate the cached item."""
-    try:
-      if self.cacheable(cache_key):
-        os.unlink(self._sha_file(cache_key))
-    except OSError as e:
-      if e.errno != errno.ENOENT:
-        raise
+    if self.cacheable(cache_key):
+      self._delete_sha(cache_key)
 
   def _sha_file(self, cache_key):
     return self._sha_file_by_id(cache_key.id)
@@ -217,6 +248,9 @@ class BuildInvalidator(object):
     with open(self._sha_file(cache_key), 'w') as fd:
       fd.write(cache_key.hash)
 
+  def _delete_sha(self, cache_key):
+    safe_delete(self._sha_file(cache_key))
+
   def _read_sha(self, cache_key):
     return self._read_sha_by_id(cache_key.id)
 
@@ -228,3 +262,125 @@ class BuildInvalidator(object):
       if e.errno != errno.ENOENT:
         raise
       return None  # File doesn't exist.
+
+  def _read_shas_by_id(self, ids):
+    """Returns a dict of id to sha for those of the given ids that have a sha.
+
+    NB: This still opens one file per id that has a sha; see `LogBuildInvalidator` for a truly bulk
+    read.
+    """
+    # A single listing of the root avoids a failed open() per id that has never been built.
+    try:
+      existing = frozenset(os.listdir(self._root))
+    except OSError as e:
+      if e.errno != errno.ENOENT:
+        raise
+      return {}
+    shas = {}
+    for id in ids:
+      sha_file = self._sha_file_by_id(id)
+      if os.path.basename(sha_file) in existing:
+        sha = self._read_sha_by_id(id)
+        if sha:
+          shas[id] = sha
+    return shas
+
+
+class LogBuildInvalidator(BuildInvalidator):
+  """A BuildInvalidator that stores all fingerprints for its scope in a single append-only log.
+
+  The log is read in bulk the first time a fingerprint is needed, so checking many targets costs
+  one read rather than one `open()` per target. Each update or invalidation appends one line,
+  written with a single `write()` so that it lands atomically. The log is compacted (atomically
+  rewritten with only its live entries) when it is loaded and has accumulated many more records
+  than live entries.
+  """
+
+  _LOG_NAME = 'fingerprints.log'
+
+  # Compact once the log holds this many times more records than live entries (and at least
+  # _COMPACTION_MIN_RECORDS records).
+  _COMPACTION_RATIO = 4
+  _COMPACTION_MIN_RECORDS = 1000
+
+  def __init__(self, root, scope=None):
+    super(LogBuildInvalidator, self).__init__(root, scope=scope)
+    self._log_path = os.path.join(self._root, self._LOG_NAME)
+    self._shas = None
+    self._log = None
+    self._loaded_generation = None
+
+  def _read_sha_by_id(self, id):
+    return self._loaded_shas().get(id)
+
+  def _read_shas_by_id(self, ids):
+    shas = self._loaded_shas()
+    return {id: shas[id] for id in ids if id in shas}
+
+  def _write_sha(self, cache_key):
+    self._loaded_shas()[cache_key.id] = cache_key.hash
+    self._append(cache_key.id, cache_key.hash)
+
+  def _delete_sha(self, cache_key):
+    if self._loaded_shas().pop(cache_key.id, None) is not None:
+      self._append(cache_key.id, '')
+
+  def force_invalidate_all(self):
+    self._close_log()
+    super(LogBuildInvalidator, self).force_invalidate_all()
+    self._shas = {}
+    self._loaded_generation = BuildInvalidator._generation
+
+  def _loaded_shas(self):
+    if self._shas is None or self._loaded_generation != BuildInvalidator._generation:
+      # Either this is the first read, or some invalidator has cleared our root since we loaded.
+      self._close_log()
+      self._loaded_generation = BuildInvalidator._generation
+      self._shas = self._load()
+    return self._shas
+
+  def _load(self):
+    shas = {}
+    records = 0
+    try:
+      with io.open(self._log_path, 'r', encoding='utf-8') as fd:
+        for line in fd:
+          id, sep, sha = line.rstrip('\n').partition('\t')
+          if not sep:
+            # A torn write: ignore it.
+            continue
+          records += 1
+          if sha:
+            shas[id] = sha
+          else:
+            shas.pop(id, None)
+    except IOError as e:
+      if e.errno != errno.ENOENT:
+        raise
+    if records >= max(self._COMPACTION_MIN_RECORDS, self._COMPACTION_RATIO * len(shas)):
+      self._compact(shas)
+    return shas
+
+  def _compact(self, shas):
+    safe_mkdir(self._root)
+    tmp_path = '{}.compact.{}'.format(self._log_path, os.getpid())
+    with io.open(tmp_path, 'w', encoding='utf-8') as fd:
+      for id, sha in sorted(shas.items()):
+        fd.write(self._record(id, sha))
+    os.rename(tmp_path, self._log_path)
+
+  @staticmethod
+  def _record(id, sha):
+    return '{}\t{}\n'.format(id, sha)
+
+  def _append(self, id, sha):
+    if self._log is None:
+      safe_mkdir(self._root)
+      # Unbuffered, so that each record is written with a single write() to the end of the log.
+      self._log = io.open(self._log_path, 'ab', buffering=0)
+    self._log.write(self._record(id, sha).encode('utf-8'))
+
+  def _close_log(self):
+    if self._log is not None:
+      self._log.close()
+      self._log = None
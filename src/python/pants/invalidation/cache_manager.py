@@ -17,6 +17,10 @@ from pants.util.dirutil import relative_symlink, safe_delete, safe_mkdir, safe_r
 from pants.util.memo import memoized_method
 
 
+# Indicates that the previous cache key of a VersionedTargetSet should be read from its cache manager.
+_READ_PREVIOUS_KEY = object()
+
+
 class VersionedTargetSet(object):
   """Represents a list of targets, a corresponding CacheKey, and a flag determining whether the
   list of targets is currently valid.
@@ -48,7 +52,7 @@ class VersionedTargetSet(object):
                                                                  versioned_target._cache_manager))
     return VersionedTargetSet(cache_manager, versioned_targets)
 
-  def __init__(self, cache_manager, versioned_targets):
+  def __init__(self, cache_manager, versioned_targets, previous_cache_key=_READ_PREVIOUS_KEY):
     self._cache_manager = cache_manager
     self.versioned_targets = versioned_targets
     self.targets = [vt.target for vt in versioned_targets]
@@ -56,7 +60,9 @@ class VersionedTargetSet(object):
     # The following line is a no-op if cache_key was set in the VersionedTarget __init__ method.
     self.cache_key = CacheKey.combine_cache_keys([vt.cache_key for vt in versioned_targets])
     # NB: previous_cache_key may be None on the first build of a target.
-    self.previous_cache_key = cache_manager.previous_key(self.cache_key)
+    if previous_cache_key is _READ_PREVIOUS_KEY:
+      previous_cache_key = cache_manager.previous_key(self.cache_key)
+    self.previous_cache_key = previous_cache_key
     self.valid = self.previous_cache_key == self.cache_key
 
     if cache_manager.invalidation_report:
@@ -172,9 +178,12 @@ class VersionedTarget(VersionedTargetSet):
   :API: public
   """
 
-  def __init__(self, cache_manager, target, cache_key):
+  def __init__(self, cache_manager, target, cache_key, previous_cache_key=_READ_PREVIOUS_KEY):
     """
     :API: public
+
+    :param previous_cache_key: The previous cache key of the target, if already known (it may be
+      None on the first build of the target). If omitted, it is read from the cache manager.
     """
     if not isinstance(target, Target):
       raise ValueError("The target {} must be an instance of Target but is not.".format(target.id))
@@ -182,7 +191,8 @@ class VersionedTarget(VersionedTargetSet):
     self.target = target
     self.cache_key = cache_key
     # Must come after the assignments above, as they are used in the parent's __init__.
-    super(VersionedTarget, self).__init__(cache_manager, [self])
+    super(VersionedTarget, self).__init__(cache_manager, [self],
+                                          previous_cache_key=previous_cache_key)
     self.id = target.id
 
   @property
@@ -358,17 +368,23 @@ class InvalidationCacheManager(object):
 
     Returns a list of VersionedTargets, each representing one input target.
     """
-    def vt_iter():
-      if topological_order:
-        target_set = set(targets)
-        sorted_targets = [t for t in reversed(sort_targets(targets)) if t in target_set]
-      else:
-        sorted_targets = sorted(targets)
-      for target in sorted_targets:
-        target_key = self._key_for(target)
-        if target_key is not None:
-          yield VersionedTarget(self, target, target_key)
-    return list(vt_iter())
+    if topological_order:
+      target_set = set(targets)
+      sorted_targets = [t for t in reversed(sort_targets(targets)) if t in target_set]
+    else:
+      sorted_targets = sorted(targets)
+
+    # All keys are computed before any previous key is read, so that the previous keys can be looked
+    # up in bulk: with `--build-invalidator-store=log` that is a single read rather than one per
+    # target.
+    keyed_targets = []
+    for target in sorted_targets:
+      target_key = self._key_for(target)
+      if target_key is not None:
+        keyed_targets.append((target, target_key))
+    previous_keys = self._invalidator.previous_keys([key for _, key in keyed_targets])
+    return [VersionedTarget(self, target, target_key, previous_cache_key=previous_key)
+            for (target, target_key), previous_key in zip(keyed_targets, previous_keys)]
 
   def cacheable(self, cache_key):
     """Indicates whether artifacts associated with the given `cache_key` should be cached.
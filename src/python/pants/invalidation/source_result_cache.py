@@ -0,0 +1,96 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import json
+import logging
+import os
+import threading
+
+from pants.base.build_environment import get_buildroot
+from pants.base.file_digest_cache import FileDigestCache
+from pants.util.dirutil import safe_concurrent_creation, safe_mkdir_for
+
+
+logger = logging.getLogger(__name__)
+
+
+class SourceResultCache(object):
+  """Records the sources that a tool checked cleanly, by the digests of their contents.
+
+  Unlike target invalidation, which re-checks every source of a target when any of them changes,
+  this allows a tool to skip the sources of an invalid target that it already checked cleanly. The
+  records are only valid for a single configuration of the tool, identified by a fingerprint: they
+  are discarded when it changes.
+  """
+
+  def __init__(self, path, config_fingerprint, digest_cache=None):
+    """
+    :param str path: The file in which records are persisted between runs.
+    :param str config_fingerprint: A fingerprint of the configuration of the checking tool.
+    :param digest_cache: The `FileDigestCache` to digest sources with; the global one by default.
+    """
+    self._path = path
+    self._config_fingerprint = config_fingerprint
+    self._digest_cache = digest_cache or FileDigestCache.global_instance()
+    self._buildroot = get_buildroot()
+    self._clean = None
+    self._lock = threading.Lock()
+
+  def _digest(self, source):
+    try:
+      return self._digest_cache.digest(os.path.join(self._buildroot, source))
+    except (IOError, OSError):
+      return None
+
+  def unchecked(self, sources):
+    """Returns those of the given sources that were not checked cleanly in their current state.
+
+    :param list sources: Paths of sources, either absolute or relative to the buildroot.
+    :rtype: list
+    """
+    with self._lock:
+      clean = self._loaded_clean()
+    return [source for source in sources
+            if clean.get(source) is None or clean[source] != self._digest(source)]
+
+  def record_clean(self, sources):
+    """Records that the given sources were checked cleanly. Safe to call from worker threads."""
+    digests = {source: self._digest(source) for source in sources}
+    with self._lock:
+      clean = self._loaded_clean()
+      for source, digest in digests.items():
+        if digest:
+          clean[source] = digest
+
+  def save(self):
+    """Persists the records."""
+    with self._lock:
+      if self._clean is None:
+        return
+      contents = {'config': self._config_fingerprint, 'clean': self._clean}
+    safe_mkdir_for(self._path)
+    with safe_concurrent_creation(self._path) as tmp_path:
+      with open(tmp_path, 'wb') as fp:
+        json.dump(contents, fp)
+
+  def _loaded_clean(self):
+    if self._clean is None:
+      self._clean = self._load()
+    return self._clean
+
+  def _load(self):
+    if not os.path.isfile(self._path):
+      return {}
+    try:
+      with open(self._path, 'rb') as fp:
+        contents = json.load(fp)
+      if contents.get('config') != self._config_fingerprint:
+        return {}
+      return dict(contents['clean'])
+    except (IOError, ValueError, KeyError, TypeError, AttributeError) as e:
+      logger.debug('Ignoring unreadable source results in {}: {}'.format(self._path, e))
+      return {}
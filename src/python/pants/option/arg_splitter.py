@@ -89,8 +89,8 @@ class ArgSplitter(object):
   _HELP_BASIC_ARGS = ('-h', '--help', 'help')
   _HELP_ADVANCED_ARGS = ('--help-advanced', 'help-advanced')
   _HELP_ALL_SCOPES_ARGS = ('--help-all', 'help-all')
-  _HELP_VERSION_ARGS = ('-v', '-V', '--version')
-  _HELP_ARGS = _HELP_BASIC_ARGS + _HELP_ADVANCED_ARGS + _HELP_ALL_SCOPES_ARGS + _HELP_VERSION_ARGS
+  HELP_VERSION_ARGS = ('-v', '-V', '--version')
+  _HELP_ARGS = _HELP_BASIC_ARGS + _HELP_ADVANCED_ARGS + _HELP_ALL_SCOPES_ARGS + HELP_VERSION_ARGS
 
   def __init__(self, known_scope_infos):
     self._known_scope_infos = known_scope_infos
@@ -121,7 +121,7 @@ class ArgSplitter(object):
   def _check_for_help_request(self, arg):
     if not arg in self._HELP_ARGS:
       return False
-    if arg in self._HELP_VERSION_ARGS:
+    if arg in self.HELP_VERSION_ARGS:
       self._help_request = VersionHelp()
     else:
       # First ensure that we have a basic OptionsHelp.
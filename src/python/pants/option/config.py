@@ -8,12 +8,14 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 import getpass
 import itertools
 import os
+from collections import OrderedDict
 
 import six
 from six.moves import configparser
 from twitter.common.collections import OrderedSet
 
 from pants.base.build_environment import get_buildroot, get_pants_cachedir, get_pants_configdir
+from pants.base.file_digest_cache import FileDigestCache
 from pants.util.eval import parse_expression
 from pants.util.meta import AbstractClass
 
@@ -32,6 +34,13 @@ class Config(AbstractClass):
   class ConfigValidationError(ConfigError):
     pass
 
+  # An LRU cache of parsed single file configs, keyed by their path, the digest of their contents
+  # and their seed values. This allows a long-lived process (notably pantsd) to avoid re-parsing
+  # unchanged config files for every run.
+  _single_file_configs = OrderedDict()
+  # The maximum number of parsed single file configs to cache.
+  _MAX_SINGLE_FILE_CONFIGS = 16
+
   @classmethod
   def load(cls, configpaths, seed_values=None):
     """Loads config from the given paths.
@@ -51,9 +60,19 @@ class Config(AbstractClass):
     single_file_configs = []
     for configpath in configpaths:
       parser = cls._create_parser(seed_values)
-      with open(configpath, 'r') as ini:
-        parser.readfp(ini)
-      single_file_configs.append(_SingleFileConfig(configpath, parser))
+      key = (configpath,
+             FileDigestCache.global_instance().digest(os.path.abspath(configpath)),
+             frozenset(parser.defaults().items()))
+      single_file_config = cls._single_file_configs.pop(key, None)
+      if single_file_config is None:
+        with open(configpath, 'r') as ini:
+          parser.readfp(ini)
+        single_file_config = _SingleFileConfig(configpath, parser)
+        if len(cls._single_file_configs) >= cls._MAX_SINGLE_FILE_CONFIGS:
+          cls._single_file_configs.popitem(last=False)
+      # Re-insert the config, to evict the least recently used configs first.
+      cls._single_file_configs[key] = single_file_config
+      single_file_configs.append(single_file_config)
     return _ChainedConfig(single_file_configs)
 
   @classmethod
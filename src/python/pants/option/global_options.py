@@ -174,6 +174,10 @@ class GlobalOptionsRegistrar(SubsystemClientMixin, Optionable):
              help='The directory to log pantsd output to.')
     register('--pantsd-fs-event-workers', advanced=True, type=int, default=4,
              help='The number of workers to use for the filesystem event service executor pool.')
+    register('--pantsd-fs-event-debounce', advanced=True, type=float, default=0.1,
+             help='The number of seconds to wait for further filesystem events after one '
+                  'arrives, so that a burst of events (e.g. from a branch switch) results in a '
+                  'single invalidation of the product graph.')
     register('--pantsd-invalidation-globs', advanced=True, type=list, fromfile=True, default=[],
              help='Filesystem events matching any of these globs will trigger a daemon restart.')
 
@@ -196,6 +200,14 @@ class GlobalOptionsRegistrar(SubsystemClientMixin, Optionable):
     register('--build-file-imports', choices=['allow', 'warn', 'error'], default='warn',
       help='Whether to allow import statements in BUILD files')
 
+    # This option determines how the (possibly daemon-held) graph helper is constructed, and so is a
+    # bootstrap option.
+    register('--dependee-index', advanced=True, type=bool, default=True,
+             help='Find the dependees of targets (for the dependees goal and '
+                  '--changed-include-dependees) with an index of declared dependencies that is '
+                  'persisted in the workdir and only re-parses changed BUILD files. If unset, the '
+                  'whole build graph is constructed (and so validated) to find dependees.')
+
   @classmethod
   def register_options(cls, register):
     """Register options not tied to any particular task or subsystem."""
@@ -226,6 +238,12 @@ class GlobalOptionsRegistrar(SubsystemClientMixin, Optionable):
     register('--workdir-max-build-entries', advanced=True, type=int, default=8,
              help='Maximum number of previous builds to keep per task target pair in workdir. '
              'If set, minimum 2 will always be kept to support incremental compilation.')
+    register('--persist-file-digests', advanced=True, type=bool, default=True,
+             help='Persist the digests of source files between runs, keyed by their stat '
+                  'metadata, so that fingerprinting only re-reads files that have changed.')
+    register('--build-graph-closure-index', advanced=True, type=bool, default=False,
+             help='Memoize the transitive closures walked in the build graph, so that tasks that '
+                  'repeatedly walk the closures of the same targets only traverse them once.')
     register('--max-subprocess-args', advanced=True, type=int, default=100, recursive=True,
              help='Used to limit the number of arguments passed to some subprocesses by breaking '
              'the command up into multiple invocations.')
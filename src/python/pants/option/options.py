@@ -108,13 +108,21 @@ class Options(object):
     # We need parsers for all the intermediate scopes, so inherited option values
     # can propagate through them.
     complete_known_scope_infos = cls.complete_scopes(known_scope_infos)
-    splitter = ArgSplitter(complete_known_scope_infos)
-    args = sys.argv if args is None else args
-    goals, scope_to_flags, target_specs, passthru, passthru_owner = splitter.split_args(args)
-
     if not option_tracker:
       raise cls.OptionTrackerRequiredError()
 
+    parser_hierarchy = ParserHierarchy(env, config, complete_known_scope_infos, option_tracker)
+    known_scope_to_info = {s.scope: s for s in complete_known_scope_infos}
+    return cls._create_for_args(args, parser_hierarchy, bootstrap_option_values,
+                                known_scope_to_info, option_tracker)
+
+  @classmethod
+  def _create_for_args(cls, args, parser_hierarchy, bootstrap_option_values, known_scope_to_info,
+                       option_tracker):
+    splitter = ArgSplitter(known_scope_to_info.values())
+    args = sys.argv if args is None else args
+    goals, scope_to_flags, target_specs, passthru, passthru_owner = splitter.split_args(args)
+
     if bootstrap_option_values:
       target_spec_files = bootstrap_option_values.target_spec_files
       if target_spec_files:
@@ -124,10 +132,7 @@ class Options(object):
 
     help_request = splitter.help_request
 
-    parser_hierarchy = ParserHierarchy(env, config, complete_known_scope_infos, option_tracker)
     values_by_scope = {}  # Arg values, parsed per-scope on demand.
-    bootstrap_option_values = bootstrap_option_values
-    known_scope_to_info = {s.scope: s for s in complete_known_scope_infos}
     return cls(goals, scope_to_flags, target_specs, passthru, passthru_owner, help_request,
                parser_hierarchy, values_by_scope, bootstrap_option_values, known_scope_to_info,
                option_tracker)
@@ -208,6 +213,38 @@ class Options(object):
                    self._known_scope_to_info,
                    self._option_tracker)
 
+  def for_args(self, args, bootstrap_option_values=None):
+    """Returns a copy of these options that takes flag values from the given cmd-line args.
+
+    The copy shares the registered options of this instance, as well as its env and config, so it
+    can be used to avoid re-registering all options when only the cmd-line args have changed. Any
+    option values recorded by the option tracker are discarded.
+
+    :param args: a list of cmd-line args.
+    :param bootstrap_option_values: An optional namespace containing the values of bootstrap
+           options for these args.
+    """
+    self._option_tracker.option_history_by_scope.clear()
+    return self._create_for_args(args, self._parser_hierarchy, bootstrap_option_values,
+                                 self._known_scope_to_info, self._option_tracker)
+
+  def add_scopes(self, scope_infos):
+    """Adds the given scopes, and their enclosing scopes, to the scopes known by these options.
+
+    Options may be registered on the added scopes until values are first computed for them. The
+    scope infos of scopes that are already known are replaced by the given ones, if any.
+
+    This allows options to be registered for optionables that are only loaded once options are in
+    use, provided that no cmd-line flags were given for their scopes.
+
+    :param scope_infos: ScopeInfos for the scopes to add.
+    """
+    complete_scope_infos = self.complete_scopes(scope_infos)
+    self._parser_hierarchy.add_scopes(complete_scope_infos)
+    for si in complete_scope_infos:
+      if si.scope not in self._known_scope_to_info or si.category != ScopeInfo.INTERMEDIATE:
+        self._known_scope_to_info[si.scope] = si
+
   def is_known_scope(self, scope):
     """Whether the given scope is known by this instance.
 
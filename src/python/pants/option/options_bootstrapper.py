@@ -11,6 +11,8 @@ import os
 import sys
 
 from pants.base.build_environment import get_default_pants_config_file
+from pants.base.file_digest_cache import FileDigestCache
+from pants.base.hash_utils import stable_json_hash
 from pants.option.arg_splitter import GLOBAL_SCOPE, GLOBAL_SCOPE_CONFIG_SECTION
 from pants.option.config import Config
 from pants.option.custom_types import ListValueComponent
@@ -66,6 +68,11 @@ class OptionsBootstrapper(object):
     self._full_options = {}  # We memoize the full options here.
     self._option_tracker = OptionTracker()
 
+  @property
+  def args(self):
+    """The cmd-line args that options are bootstrapped from."""
+    return self._args
+
   def get_bootstrap_options(self):
     """:returns: an Options instance that only knows about the bootstrap options.
     :rtype: :class:`Options`
@@ -151,6 +158,41 @@ class OptionsBootstrapper(object):
                                                option_tracker=self._option_tracker)
     return self._full_options[key]
 
+  def get_full_options_fingerprint(self):
+    """Returns a fingerprint of the inputs of full options other than the cmd-line flags.
+
+    Full options created by bootstrappers with equal fingerprints, for the same known scopes,
+    register the same options and differ only in the values of their flags. They may therefore be
+    created once and reused for each set of args via `Options.for_args`.
+
+    :rtype: string
+    """
+    bootstrap_option_values = self.get_bootstrap_options().for_global_scope()
+    digest_cache = FileDigestCache.global_instance()
+    return stable_json_hash({
+      'bootstrap_options': {key: bootstrap_option_values[key] for key in bootstrap_option_values},
+      'configs': [(config.configpath,
+                   digest_cache.digest(os.path.abspath(config.configpath)),
+                   config.configparser.defaults())
+                  for config in self._post_bootstrap_config.configs()],
+      # Options are read from env vars named PANTS_<SCOPE>_<OPTION>, or PANTS_<OPTION> for global
+      # options.
+      'env': {key: value for key, value in self._env.items() if key.startswith('PANTS_')},
+    })
+
+  def get_config_scopes(self):
+    """Returns the options scopes of the sections of all loaded configs.
+
+    :rtype: set of string
+    """
+    return {self._scope_for_section(section)
+            for config in self._post_bootstrap_config.configs()
+            for section in config.sections()}
+
+  @staticmethod
+  def _scope_for_section(section):
+    return GLOBAL_SCOPE if section == GLOBAL_SCOPE_CONFIG_SECTION else section
+
   def verify_configs_against_options(self, options):
     """Verify all loaded configs have correct scopes and options.
 
@@ -160,10 +202,7 @@ class OptionsBootstrapper(object):
     error_log = []
     for config in self._post_bootstrap_config.configs():
       for section in config.sections():
-        if section == GLOBAL_SCOPE_CONFIG_SECTION:
-          scope = GLOBAL_SCOPE
-        else:
-          scope = section
+        scope = self._scope_for_section(section)
         try:
           valid_options_under_scope = set(options.for_scope(scope))
         # Only catch ConfigValidationError. Other exceptions will be raised directly.
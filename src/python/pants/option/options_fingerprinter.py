@@ -13,6 +13,7 @@ from hashlib import sha1
 import six
 
 from pants.base.build_environment import get_buildroot
+from pants.base.file_digest_cache import FileDigestCache
 from pants.base.hash_utils import stable_json_hash
 from pants.option.custom_types import (UnsetBool, dict_with_files_option, dir_option, file_option,
                                        target_option)
@@ -31,24 +32,30 @@ stable_json_sha1 = functools.partial(stable_json_hash, encoder=Encoder)
 class OptionsFingerprinter(object):
   """Handles fingerprinting options under a given build_graph.
 
+  The contents of files are fingerprinted via the global `FileDigestCache`, and the fingerprints of
+  file and dir options are memoized for the lifetime of the fingerprinter: a fingerprinter that is
+  shared for a run (see `Context.options_fingerprinter`) reads each of them at most once.
+
   :API: public
   """
 
   @classmethod
   def combined_options_fingerprint_for_scope(cls, scope, options,
-                                             build_graph=None, **kwargs):
+                                             build_graph=None, fingerprinter=None, **kwargs):
     """Given options and a scope, compute a combined fingerprint for the scope.
 
     :param string scope: The scope to fingerprint.
     :param Options options: The `Options` object to fingerprint.
     :param BuildGraph build_graph: A `BuildGraph` instance, only needed if fingerprinting
                                    target options.
+    :param OptionsFingerprinter fingerprinter: An optional fingerprinter to reuse, in place of a
+                                               new one for the given `build_graph`.
     :param dict **kwargs: Keyword parameters passed on to
                           `Options#get_fingerprintable_for_scope`.
     :return: Hexadecimal string representing the fingerprint for all `options`
              values in `scope`.
     """
-    fingerprinter = cls(build_graph)
+    fingerprinter = fingerprinter or cls(build_graph)
     hasher = sha1()
     pairs = options.get_fingerprintable_for_scope(scope, **kwargs)
     for (option_type, option_value) in pairs:
@@ -63,6 +70,7 @@ class OptionsFingerprinter(object):
 
   def __init__(self, build_graph=None):
     self._build_graph = build_graph
+    self._fingerprints_by_paths = {}
 
   def fingerprint(self, option_type, option_val):
     """Returns a hash of the given option_val based on the option_type.
@@ -124,36 +132,41 @@ class OptionsFingerprinter(object):
                          .format(filepath=filepath, buildroot=root))
       return filepath
 
-  def _fingerprint_dirs(self, dirpaths, topdown=True, onerror=None, followlinks=False):
-    """Returns a fingerprint of the given file directories and all their sub contents.
+  def _memoized_by_paths(self, kind, paths, fingerprint_func):
+    key = (kind, tuple(paths))
+    fingerprint = self._fingerprints_by_paths.get(key)
+    if fingerprint is None:
+      fingerprint = fingerprint_func(paths)
+      self._fingerprints_by_paths[key] = fingerprint
+    return fingerprint
 
-    This assumes that the file directories are of reasonable size
-    to cause memory or performance issues.
-    """
-    # Note that we don't sort the dirpaths, as their order may have meaning.
-    filepaths = []
-    for dirpath in dirpaths:
-      dirs = os.walk(dirpath, topdown=topdown, onerror=onerror,
-                     followlinks=followlinks)
-      sorted_dirs = sorted(dirs, key=lambda d: d[0])
-      filepaths.extend([os.path.join(dirpath, filename)
-                   for dirpath, dirnames, filenames in sorted_dirs
-                   for filename in sorted(filenames)])
-    return self._fingerprint_files(filepaths)
+  def _fingerprint_dirs(self, dirpaths, topdown=True, onerror=None, followlinks=False):
+    """Returns a fingerprint of the given file directories and all their sub contents."""
+    def fingerprint_dirs(dirpaths):
+      # Note that we don't sort the dirpaths, as their order may have meaning.
+      filepaths = []
+      for dirpath in dirpaths:
+        dirs = os.walk(dirpath, topdown=topdown, onerror=onerror,
+                       followlinks=followlinks)
+        sorted_dirs = sorted(dirs, key=lambda d: d[0])
+        filepaths.extend([os.path.join(dirpath, filename)
+                     for dirpath, dirnames, filenames in sorted_dirs
+                     for filename in sorted(filenames)])
+      return self._fingerprint_files(filepaths)
+    return self._memoized_by_paths('dirs', dirpaths, fingerprint_dirs)
 
   def _fingerprint_files(self, filepaths):
-    """Returns a fingerprint of the given filepaths and their contents.
-
-    This assumes the files are small enough to be read into memory.
-    """
-    hasher = sha1()
-    # Note that we don't sort the filepaths, as their order may have meaning.
-    for filepath in filepaths:
-      filepath = self._assert_in_buildroot(filepath)
-      hasher.update(os.path.relpath(filepath, get_buildroot()))
-      with open(filepath, 'rb') as f:
-        hasher.update(f.read())
-    return hasher.hexdigest()
+    """Returns a fingerprint of the given filepaths and their contents."""
+    def fingerprint_files(filepaths):
+      hasher = sha1()
+      digest_cache = FileDigestCache.global_instance()
+      # Note that we don't sort the filepaths, as their order may have meaning.
+      for filepath in filepaths:
+        filepath = self._assert_in_buildroot(filepath)
+        hasher.update(os.path.relpath(filepath, get_buildroot()))
+        hasher.update(digest_cache.digest(filepath))
+      return hasher.hexdigest()
+    return self._memoized_by_paths('files', filepaths, fingerprint_files)
 
   def _fingerprint_primitives(self, val):
     return stable_json_sha1(val)
@@ -163,16 +176,13 @@ class OptionsFingerprinter(object):
 
     Any value which is a file path which exists on disk will be fingerprinted by that file's
     contents rather than by its path.
-
-    This assumes the files are small enough to be read into memory.
     """
     # Dicts are wrapped in singleton lists. See the "For simplicity..." comment in `fingerprint()`.
     option_val = option_val[0]
     return stable_json_sha1({k: self._expand_possible_file_value(v) for k, v in option_val.items()})
 
   def _expand_possible_file_value(self, value):
-    """If the value is a file, returns its contents. Otherwise return the original value."""
+    """If the value is a file, returns the digest of its contents. Otherwise returns the value."""
     if value and os.path.isfile(str(value)):
-      with open(value, 'r') as f:
-        return f.read()
+      return FileDigestCache.global_instance().digest(os.path.abspath(value))
     return value
@@ -149,6 +149,8 @@ class PantsDaemon(FingerprintedProcessManager):
         build_ignore_patterns=bootstrap_options.build_ignore,
         exclude_target_regexps=bootstrap_options.exclude_target_regexp,
         subproject_roots=bootstrap_options.subproject_roots,
+        cache_targets=True,
+        use_dependee_index=bootstrap_options.dependee_index,
       )
 
     @staticmethod
@@ -167,7 +169,8 @@ class PantsDaemon(FingerprintedProcessManager):
         fs_event_service,
         legacy_graph_helper,
         build_root,
-        bootstrap_options.pantsd_invalidation_globs
+        bootstrap_options.pantsd_invalidation_globs,
+        bootstrap_options.pantsd_fs_event_debounce
       )
 
       pailgun_service = PailgunService(
@@ -61,9 +61,11 @@ class PailgunService(PantsService):
       # Capture the size of the graph prior to any warming, for stats.
       preceding_graph_size = self._scheduler_service.product_graph_len()
       self._logger.debug('resident graph size: %s', preceding_graph_size)
+      invalidation_stats = self._scheduler_service.consume_invalidation_stats()
 
       self._logger.debug('execution commandline: %s', arguments)
-      options, _ = OptionsInitializer(OptionsBootstrapper(args=arguments)).setup(init_logging=False)
+      options_bootstrapper = OptionsBootstrapper(env=environment, args=arguments)
+      options, _ = OptionsInitializer(options_bootstrapper).setup(init_logging=False)
       target_roots = self._target_roots_calculator.create(
         options,
         change_calculator=self._scheduler_service.change_calculator
@@ -90,7 +92,8 @@ class PailgunService(PantsService):
         graph_helper,
         self.fork_lock,
         preceding_graph_size,
-        deferred_exc
+        deferred_exc,
+        invalidation_stats=invalidation_stats
       )
 
     # Plumb the daemon's lifecycle lock to the `PailgunServer` to safeguard teardown.
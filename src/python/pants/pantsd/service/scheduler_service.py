@@ -8,6 +8,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 import logging
 import Queue
 import threading
+import time
 
 from twitter.common.dirutil import Fileset
 
@@ -20,11 +21,16 @@ class SchedulerService(PantsService):
   This service holds an online Scheduler instance that is primed via watchman filesystem events.
   This provides for a quick fork of pants runs (via the pailgun) with a fully primed ProductGraph
   in memory.
+
+  Filesystem events are coalesced: events arriving within `debounce_secs` of one another are merged
+  into a single invalidation of the product graph, so that a burst of events (e.g. from a `git
+  checkout`) only contends for the fork lock once.
   """
 
   QUEUE_SIZE = 64
 
-  def __init__(self, fs_event_service, legacy_graph_helper, build_root, invalidation_globs):
+  def __init__(self, fs_event_service, legacy_graph_helper, build_root, invalidation_globs,
+               debounce_secs=0):
     """
     :param FSEventService fs_event_service: An unstarted FSEventService instance for setting up
                                             filesystem event handlers.
@@ -33,18 +39,23 @@ class SchedulerService(PantsService):
     :param str build_root: The current build root.
     :param list invalidation_globs: A list of `globs` that when encountered in filesystem event
                                     subscriptions will tear down the daemon.
+    :param float debounce_secs: How long to wait for further filesystem events after one arrives
+                                before invalidating the files they cover.
     """
     super(SchedulerService, self).__init__()
     self._fs_event_service = fs_event_service
     self._graph_helper = legacy_graph_helper
     self._invalidation_globs = invalidation_globs
     self._build_root = build_root
+    self._debounce_secs = debounce_secs
 
     self._scheduler = legacy_graph_helper.scheduler
     self._logger = logging.getLogger(__name__)
     self._event_queue = Queue.Queue(maxsize=self.QUEUE_SIZE)
     self._watchman_is_running = threading.Event()
     self._invalidating_files = set()
+    self._invalidation_stats_lock = threading.Lock()
+    self._invalidation_stats = self._empty_invalidation_stats()
 
   @property
   def change_calculator(self):
@@ -74,7 +85,7 @@ class SchedulerService(PantsService):
     """Watchman filesystem event handler for BUILD/requirements.txt updates. Called via a thread."""
     self._logger.info('enqueuing {} changes for subscription {}'
                       .format(len(event['files']), event['subscription']))
-    self._event_queue.put(event)
+    self._event_queue.put((time.time(), event))
 
   def _maybe_invalidate_scheduler(self, files):
     invalidating_files = self._invalidating_files
@@ -83,40 +94,96 @@ class SchedulerService(PantsService):
       self.terminate()
 
   def _handle_batch_event(self, files):
-    self._logger.debug('handling change event for: %s', files)
+    self._logger.debug('handling change event for %d files', len(files))
 
     with self.lifecycle_lock:
       self._maybe_invalidate_scheduler(files)
 
     with self.fork_lock:
-      self._scheduler.invalidate_files(files)
+      return self._scheduler.invalidate_files(files)
+
+  @staticmethod
+  def _empty_invalidation_stats():
+    return {
+      'invalidation_count': 0,
+      'invalidated_file_count': 0,
+      'invalidated_node_count': 0,
+      'invalidation_latency': 0.0,
+    }
+
+  def _record_invalidation(self, file_count, node_count, latency):
+    with self._invalidation_stats_lock:
+      stats = self._invalidation_stats
+      stats['invalidation_count'] += 1
+      stats['invalidated_file_count'] += file_count
+      stats['invalidated_node_count'] += node_count
+      stats['invalidation_latency'] += latency
+
+  def consume_invalidation_stats(self):
+    """Returns stats for the invalidations performed since the previous call, and resets them.
+
+    :returns: A dict with the number of invalidations, the number of files and product graph nodes
+              they invalidated, and the total seconds between the arrival of their filesystem
+              events and the completion of their invalidation.
+    """
+    with self._invalidation_stats_lock:
+      stats, self._invalidation_stats = self._invalidation_stats, self._empty_invalidation_stats()
+    return stats
+
+  def _drain_event_queue(self, first_event):
+    """Returns the given queued event along with any that follow it within the debounce window."""
+    events = [first_event]
+    deadline = time.time() + self._debounce_secs
+    # Bound the batch, so that a steady stream of events can't defer invalidation indefinitely.
+    while len(events) < self.QUEUE_SIZE:
+      remaining = deadline - time.time()
+      try:
+        if remaining > 0:
+          events.append(self._event_queue.get(timeout=remaining))
+        else:
+          events.append(self._event_queue.get_nowait())
+      except Queue.Empty:
+        break
+    return events
 
   def _process_event_queue(self):
     """File event notification queue processor."""
     try:
-      event = self._event_queue.get(timeout=1)
+      queued_event = self._event_queue.get(timeout=1)
     except Queue.Empty:
       return
 
-    try:
-      subscription, is_initial_event, files = (event['subscription'],
-                                               event['is_fresh_instance'],
-                                               [f.decode('utf-8') for f in event['files']])
-    except (KeyError, UnicodeDecodeError) as e:
-      self._logger.warn('%r raised by invalid watchman event: %s', e, event)
-      return
-
-    self._logger.debug('processing {} files for subscription {} (first_event={})'
-                       .format(len(files), subscription, is_initial_event))
-
-    # The first watchman event is a listing of all files - ignore it.
-    if not is_initial_event:
-      self._handle_batch_event(files)
-
-    if not self._watchman_is_running.is_set():
+    queued_events = self._drain_event_queue(queued_event)
+    first_enqueued_at = min(enqueued_at for enqueued_at, _ in queued_events)
+
+    files = set()
+    saw_event = False
+    for _, event in queued_events:
+      try:
+        subscription, is_initial_event, event_files = (event['subscription'],
+                                                       event['is_fresh_instance'],
+                                                       [f.decode('utf-8') for f in event['files']])
+      except (KeyError, UnicodeDecodeError) as e:
+        self._logger.warn('%r raised by invalid watchman event: %s', e, event)
+        continue
+      saw_event = True
+
+      self._logger.debug('processing {} files for subscription {} (first_event={})'
+                         .format(len(event_files), subscription, is_initial_event))
+
+      # The first watchman event is a listing of all files - ignore it.
+      if not is_initial_event:
+        files.update(event_files)
+
+    if files:
+      invalidated = self._handle_batch_event(files)
+      self._record_invalidation(len(files), invalidated, time.time() - first_enqueued_at)
+
+    if saw_event and not self._watchman_is_running.is_set():
       self._watchman_is_running.set()
 
-    self._event_queue.task_done()
+    for _ in queued_events:
+      self._event_queue.task_done()
 
   def product_graph_len(self):
     """Provides the size of the captive product graph.
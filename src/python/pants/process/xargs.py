@@ -16,6 +16,10 @@ class Xargs(object):
   Specifically allows encapsulated commands to be passed very large argument lists by chunking up
   the argument lists into a minimal set and then invoking the encapsulated command against each
   chunk in turn.
+
+  The argument list may also be split up front into a number of balanced shards, which are executed
+  via a `map`-like function: a concurrent one, like that of a thread pool, executes them
+  concurrently.
   """
 
   @classmethod
@@ -27,13 +31,35 @@ class Xargs(object):
       return subprocess.call(cmd + args, **kwargs)
     return cls(call)
 
-  def __init__(self, cmd):
+  def __init__(self, cmd, shards=1, map_func=map):
     """Creates an xargs engine that calls cmd with argument chunks.
 
     :param cmd: A function that can execute a command line in the form of a list of strings
       passed as its sole argument.
+    :param int shards: The number of shards to split the argument list into.
+    :param map_func: A function with the signature of the builtin `map`, used to execute the shards.
     """
     self._cmd = cmd
+    self._shards = shards
+    self._map_func = map_func
+
+  @staticmethod
+  def shard(args, num_shards):
+    """Splits args into at most `num_shards` contiguous shards, whose sizes differ by at most one.
+
+    :param list args: The arguments to split.
+    :param int num_shards: The maximum number of shards.
+    :rtype: list of lists
+    """
+    num_shards = max(1, min(num_shards, len(args)))
+    size, remainder = divmod(len(args), num_shards)
+    shards = []
+    start = 0
+    for i in range(num_shards):
+      end = start + size + (1 if i < remainder else 0)
+      shards.append(args[start:end])
+      start = end
+    return shards
 
   def _split_args(self, args):
     half = len(args) // 2
@@ -43,16 +69,24 @@ class Xargs(object):
     """Executes the configured cmd passing args in one or more rounds xargs style.
 
     :param list args: Extra arguments to pass to cmd.
+    :returns: The first non-zero result of the shards, in argument order, or else 0.
     """
     all_args = list(args)
+    shards = self.shard(all_args, self._shards)
+    if len(shards) <= 1:
+      return self._execute(all_args)
+    results = self._map_func(self._execute, shards)
+    return next((result for result in results if result != 0), 0)
+
+  def _execute(self, args):
     try:
-      return self._cmd(all_args)
+      return self._cmd(args)
     except OSError as e:
       if errno.E2BIG == e.errno:
-        args1, args2 = self._split_args(all_args)
-        result = self.execute(args1)
+        args1, args2 = self._split_args(args)
+        result = self._execute(args1)
         if result != 0:
           return result
-        return self.execute(args2)
+        return self._execute(args2)
       else:
         raise e
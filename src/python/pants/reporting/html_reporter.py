@@ -248,6 +248,11 @@ class HtmlReporter(Reporter):
       aborted='true' if workunit.outcome() == WorkUnit.ABORTED else 'false'
     ))
 
+    if workunit.profile_path:
+      # The path is linkified, so that the profile can be downloaded from the reporting server.
+      self.do_handle_log(workunit, Report.INFO,
+                         'Python CPU profile: {}'.format(workunit.profile_path))
+
     # If we're a root workunit, force an overwrite, as we may be the last ever write in this run.
     force_overwrite = workunit.parent is None
 
@@ -12,7 +12,7 @@ from collections import defaultdict
 
 from pants.base.build_environment import get_scm
 from pants.base.specs import DescendantAddresses, Specs
-from pants.build_graph.address import Address
+from pants.engine.legacy.dependee_index import declared_dependencies
 from pants.engine.legacy.graph import TransitiveHydratedTargets, target_types_from_symbol_table
 from pants.engine.legacy.source_mapper import EngineSourceMapper
 from pants.goal.workspace import ScmWorkspace
@@ -48,26 +48,27 @@ class _DependentGraph(object):
       inst.inject_target(target_adaptor)
     return inst
 
-  def __init__(self, target_types):
+  @classmethod
+  def from_dependee_index(cls, target_types, dependee_index):
+    """Create a new DependentGraph backed by an up to date DependeeIndex."""
+    return cls(target_types, dependee_index.update().dependees_by_address)
+
+  def __init__(self, target_types, dependent_address_map=None):
     self._dependent_address_map = defaultdict(set)
+    if dependent_address_map is not None:
+      self._dependent_address_map = dependent_address_map
     self._target_types = target_types
 
   def inject_target(self, target_adaptor):
     """Inject a target, respecting all sources of dependencies."""
-    target_cls = self._target_types[target_adaptor.type_alias]
-
-    declared_deps = target_adaptor.dependencies
-    implicit_deps = (Address.parse(s)
-                     for s in target_cls.compute_dependency_specs(kwargs=target_adaptor.kwargs()))
-
-    for dep in itertools.chain(declared_deps, implicit_deps):
+    for dep in declared_dependencies(self._target_types, target_adaptor):
       self._dependent_address_map[dep].add(target_adaptor.address)
 
   def dependents_of_addresses(self, addresses):
     """Given an iterable of addresses, yield all of those addresses dependents."""
     seen = set(addresses)
     for address in addresses:
-      for dependent_address in self._dependent_address_map[address]:
+      for dependent_address in self._dependent_address_map.get(address, ()):
         if dependent_address not in seen:
           seen.add(dependent_address)
           yield dependent_address
@@ -84,7 +85,7 @@ class _DependentGraph(object):
       addresses_to_visit.update(dependents)
 
     transitive_set = itertools.chain(
-      *(self._dependent_address_map[address] for address in addresses_to_visit)
+      *(self._dependent_address_map.get(address, ()) for address in addresses_to_visit)
     )
     for dep in transitive_set:
       yield dep
@@ -116,15 +117,18 @@ class ChangeCalculator(AbstractClass):
 class EngineChangeCalculator(ChangeCalculator):
   """A ChangeCalculator variant that uses the v2 engine for source mapping."""
 
-  def __init__(self, scheduler, symbol_table, scm):
+  def __init__(self, scheduler, symbol_table, scm, dependee_index=None):
     """
     :param scheduler: The `Scheduler` instance to use for computing file to target mappings.
     :param symbol_table: The symbol table.
     :param scm: The `Scm` instance to use for change determination.
+    :param DependeeIndex dependee_index: An optional index to find dependees with, rather than
+      hydrating every target in the repo.
     """
     super(EngineChangeCalculator, self).__init__(scm or get_scm())
     self._scheduler = scheduler
     self._symbol_table = symbol_table
+    self._dependee_index = dependee_index
     self._mapper = EngineSourceMapper(self._scheduler)
 
   def iter_changed_target_addresses(self, changed_request):
@@ -143,17 +147,21 @@ class EngineChangeCalculator(ChangeCalculator):
     if changed_request.include_dependees not in ('direct', 'transitive'):
       return
 
-    # TODO: For dependee finding, we technically only need to parse all build files to collect target
-    # dependencies. But in order to fully validate the graph and account for the fact that deleted
-    # targets do not show up as changed roots, we use the `TransitiveHydratedTargets` product.
-    #   see https://github.com/pantsbuild/pants/issues/382
-    specs = (DescendantAddresses(''),)
-    adaptor_iter = (t.adaptor
-                    for targets in self._scheduler.product_request(TransitiveHydratedTargets,
-                                                                   [Specs(specs)])
-                    for t in targets.roots)
-    graph = _DependentGraph.from_iterable(target_types_from_symbol_table(self._symbol_table),
-                                          adaptor_iter)
+    target_types = target_types_from_symbol_table(self._symbol_table)
+    if self._dependee_index is not None:
+      graph = _DependentGraph.from_dependee_index(target_types, self._dependee_index)
+    else:
+      # TODO: For dependee finding, we technically only need to parse all build files to collect
+      # target dependencies. But in order to fully validate the graph and account for the fact that
+      # deleted targets do not show up as changed roots, we use the `TransitiveHydratedTargets`
+      # product.
+      #   see https://github.com/pantsbuild/pants/issues/382
+      specs = (DescendantAddresses(''),)
+      adaptor_iter = (t.adaptor
+                      for targets in self._scheduler.product_request(TransitiveHydratedTargets,
+                                                                     [Specs(specs)])
+                      for t in targets.roots)
+      graph = _DependentGraph.from_iterable(target_types, adaptor_iter)
 
     if changed_request.include_dependees == 'direct':
       for address in graph.dependents_of_addresses(changed_addresses):
@@ -7,6 +7,8 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import re
 
+from pants.util.memo import memoized
+
 
 def glob_to_regex(pattern):
   """Given a glob pattern, return an equivalent regex expression.
@@ -30,7 +32,7 @@ def glob_to_regex(pattern):
         raise ValueError('Invalid usage of "**", use "*" instead.')
 
       if not doublestar:
-        out.append('(([^/]+/)*)')
+        out.append('(?:[^/]+/)*')
         doublestar = True
     else:
       out.append(component.replace('*', '[^/]*'))
@@ -44,17 +46,26 @@ def glob_to_regex(pattern):
   return ''.join(out)
 
 
+@memoized
+def globs_regex(patterns):
+  """Return a single compiled regex that matches any of the given glob patterns.
+
+  :param tuple patterns: The glob patterns to match.
+  :returns: A compiled regex, or None if there are no patterns.
+  """
+  if not patterns:
+    return None
+  return re.compile('|'.join('(?:{})'.format(glob_to_regex(pattern)) for pattern in patterns))
+
+
 def globs_matches(paths, patterns, exclude_patterns):
-  def excluded(path):
-    if excluded.regexes is None:
-      excluded.regexes = [re.compile(glob_to_regex(ex)) for ex in exclude_patterns]
-    return any(ex.match(path) for ex in excluded.regexes)
-  excluded.regexes = None
-  for pattern in patterns:
-    regex = re.compile(glob_to_regex(pattern))
-    for path in paths:
-      if regex.match(path) and not excluded(path):
-        return True
+  regex = globs_regex(tuple(patterns))
+  if regex is None:
+    return False
+  exclude_regex = globs_regex(tuple(exclude_patterns))
+  for path in paths:
+    if regex.match(path) and not (exclude_regex and exclude_regex.match(path)):
+      return True
   return False
 
 
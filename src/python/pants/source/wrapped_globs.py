@@ -13,6 +13,7 @@ from six import string_types
 from twitter.common.dirutil.fileset import Fileset
 
 from pants.base.build_environment import get_buildroot
+from pants.base.file_digest_cache import FileDigestCache
 from pants.util.dirutil import fast_relpath, fast_relpath_optional
 from pants.util.memo import memoized_property
 from pants.util.meta import AbstractClass
@@ -103,9 +104,13 @@ class EagerFilesetWithSpec(FilesetWithSpec):
   def __repr__(self):
     return 'EagerFilesetWithSpec(rel_root={!r}, files={!r})'.format(self.rel_root, self.files)
 
+  @memoized_property
+  def _file_set(self):
+    return frozenset(self._files)
+
   def matches(self, path_from_buildroot):
     path_relative_to_rel_root = fast_relpath_optional(path_from_buildroot, self.rel_root)
-    return path_relative_to_rel_root is not None and path_relative_to_rel_root in self._files
+    return path_relative_to_rel_root is not None and path_relative_to_rel_root in self._file_set
 
 
 class LazyFilesetWithSpec(FilesetWithSpec):
@@ -127,14 +132,18 @@ class LazyFilesetWithSpec(FilesetWithSpec):
   @property
   def files_hash(self):
     h = sha1()
+    digest_cache = FileDigestCache.global_instance()
     for path in sorted(self.files):
       h.update(path)
-      with open(os.path.join(get_buildroot(), self.rel_root, path), 'rb') as f:
-        h.update(f.read())
+      h.update(digest_cache.digest(os.path.join(get_buildroot(), self.rel_root, path)))
     return h.digest()
 
+  @memoized_property
+  def _paths_from_buildroot(self):
+    return frozenset(self.paths_from_buildroot_iter())
+
   def matches(self, path_from_buildroot):
-    return any(path_from_buildroot == path_in_spec for path_in_spec in self.paths_from_buildroot_iter())
+    return path_from_buildroot in self._paths_from_buildroot
 
 
 class FilesetRelPathWrapper(AbstractClass):
@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 import sqlite3
+from collections import defaultdict
 from contextlib import contextmanager
 
 from pants.subsystem.subsystem import Subsystem
@@ -34,6 +35,38 @@ class StatsDBFactory(Subsystem):
 
 
 class StatsDB(object):
+  # Queries for the time series of each kind of stat, each selecting (run_info_id, label, value)
+  # rows for the runs selected by the `{runs}` subquery. Timings are in seconds.
+  _SERIES_QUERIES = {
+    'cumulative_timings': """
+      SELECT run_info_id, label, timing / 1000.0 FROM cumulative_timings
+      WHERE run_info_id IN ({runs})
+    """,
+    'self_timings': """
+      SELECT run_info_id, label, timing / 1000.0 FROM self_timings
+      WHERE run_info_id IN ({runs})
+    """,
+    'critical_path_timings': """
+      SELECT run_info_id, label, timing / 1000.0 FROM critical_path_timings
+      WHERE run_info_id IN ({runs})
+    """,
+    'target_timings': """
+      SELECT run_info_id, scope || ' ' || target, timing / 1000.0 FROM target_timings
+      WHERE run_info_id IN ({runs})
+    """,
+    'artifact_cache_hit_rates': """
+      SELECT run_info_id, cache_name, CAST(num_hits AS REAL) / (num_hits + num_misses)
+      FROM artifact_cache_stats
+      WHERE run_info_id IN ({runs}) AND num_hits + num_misses > 0
+    """,
+    'pantsd_stats': """
+      SELECT run_info_id, stat, value FROM pantsd_stats
+      WHERE run_info_id IN ({runs}) AND value IS NOT NULL
+    """,
+  }
+
+  SERIES = tuple(sorted(_SERIES_QUERIES))
+
   def __init__(self, path):
     super(StatsDB, self).__init__()
     self._path = path
@@ -56,7 +89,11 @@ class StatsDB(object):
           cmd_line TEXT
         )
       """)
+      # Added after the table was first created, so may need to be added to an existing table.
+      if 'revision' not in [row[1] for row in c.execute("""PRAGMA table_info(run_info)""")]:
+        c.execute("""ALTER TABLE run_info ADD COLUMN revision TEXT""")
       create_index('run_info', 'cmd_line')
+      create_index('run_info', 'timestamp')
 
       def create_timings_table(tab):
         c.execute("""
@@ -71,15 +108,52 @@ class StatsDB(object):
 
       create_timings_table('cumulative_timings')
       create_timings_table('self_timings')
+      create_timings_table('critical_path_timings')
+
+      c.execute("""
+        CREATE TABLE IF NOT EXISTS target_timings (
+          run_info_id TEXT,
+          target TEXT,
+          scope TEXT,
+          timing INTEGER,  -- Milliseconds
+          FOREIGN KEY (run_info_id) REFERENCES run_info(id)
+        )
+      """)
+      create_index('target_timings', 'run_info_id')
+
+      c.execute("""
+        CREATE TABLE IF NOT EXISTS artifact_cache_stats (
+          run_info_id TEXT,
+          cache_name TEXT,
+          num_hits INTEGER,
+          num_misses INTEGER,
+          FOREIGN KEY (run_info_id) REFERENCES run_info(id)
+        )
+      """)
+      create_index('artifact_cache_stats', 'run_info_id')
+
+      c.execute("""
+        CREATE TABLE IF NOT EXISTS pantsd_stats (
+          run_info_id TEXT,
+          stat TEXT,
+          value REAL,
+          FOREIGN KEY (run_info_id) REFERENCES run_info(id)
+        )
+      """)
+      create_index('pantsd_stats', 'run_info_id')
 
   def insert_stats(self, stats):
     try:
       with self._cursor() as c:
         ri = stats['run_info']
         try:
-          c.execute("""INSERT INTO run_info VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    [ri['id'], int(float(ri['timestamp'])), ri['machine'], ri['user'],
-                     ri['version'], ri['buildroot'], ri['outcome'], ri['cmd_line']])
+          c.execute("""
+            INSERT INTO run_info
+              (id, timestamp, machine, user, version, buildroot, outcome, cmd_line, revision)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+          """, [ri['id'], int(float(ri['timestamp'])), ri['machine'], ri['user'],
+                ri['version'], ri['buildroot'], ri['outcome'], ri['cmd_line'],
+                ri.get('revision')])
         except KeyError as e:
           raise StatsDBError('Failed to insert stats. Key {} not found in RunInfo: {}'.format(
             e.args[0], str(ri)))
@@ -95,6 +169,23 @@ class StatsDB(object):
               raise StatsDBError('Failed to insert stats. Key {} not found in timing: {}'.format(
                 e.args[0], str(timing)))
 
+        # The remaining stats were added to the stats object over time, so are optional.
+        for timing in stats.get('critical_path_timings', []):
+          c.execute("""INSERT INTO critical_path_timings VALUES (?, ?, ?)""",
+                    [rid, timing['label'], self._to_ms(timing['timing'])])
+
+        for target, scope, timing in self._target_compile_timings(ri.get('target_data')):
+          c.execute("""INSERT INTO target_timings VALUES (?, ?, ?, ?)""",
+                    [rid, target, scope, self._to_ms(timing)])
+
+        for cache_stats in stats.get('artifact_cache_stats', []):
+          c.execute("""INSERT INTO artifact_cache_stats VALUES (?, ?, ?, ?)""",
+                    [rid, cache_stats['cache_name'], cache_stats['num_hits'],
+                     cache_stats['num_misses']])
+
+        for stat, value in sorted(stats.get('pantsd_stats', {}).items()):
+          c.execute("""INSERT INTO pantsd_stats VALUES (?, ?, ?)""", [rid, stat, value])
+
     except KeyError as e:
       raise StatsDBError('Failed to insert stats. Key {} not found in stats object.'.format(
         e.args[0]))
@@ -129,6 +220,52 @@ class StatsDB(object):
         """.format(timing_table), [cmd_line_like]):
         yield row
 
+  def get_recent_runs(self, cmd_line_like, num_runs):
+    """Returns the most recent runs with a given cmd line, oldest first.
+
+    :param cmd_line_like: Look at all cmd lines that are LIKE this string, in the sql sense.
+    :param int num_runs: The maximum number of runs to return.
+    :returns: A list of (id, timestamp, revision) tuples.
+    """
+    with self._cursor() as c:
+      rows = c.execute("""
+        SELECT id, timestamp, revision FROM run_info
+        WHERE cmd_line LIKE ?
+        ORDER BY timestamp DESC, rowid DESC
+        LIMIT ?
+      """, [cmd_line_like, num_runs]).fetchall()
+    return list(reversed(rows))
+
+  def get_series(self, series, cmd_line_like, num_runs):
+    """Returns the values of a kind of stat in the most recent runs with a given cmd line.
+
+    :param series: One of `StatsDB.SERIES`.
+    :param cmd_line_like: Look at all cmd lines that are LIKE this string, in the sql sense.
+    :param int num_runs: The maximum number of runs to look at.
+    :returns: A dict of label to a dict of run id to value, for the labels recorded in those runs.
+    """
+    if series not in self._SERIES_QUERIES:
+      raise StatsDBError('Unknown stats series {}: must be one of {}.'.format(
+        series, ', '.join(self.SERIES)))
+    runs = """
+      SELECT id FROM run_info WHERE cmd_line LIKE ? ORDER BY timestamp DESC, rowid DESC LIMIT ?
+    """
+    values_by_label = defaultdict(dict)
+    with self._cursor() as c:
+      for run_info_id, label, value in c.execute(self._SERIES_QUERIES[series].format(runs=runs),
+                                                 [cmd_line_like, num_runs]):
+        values_by_label[label][run_info_id] = value
+    return dict(values_by_label)
+
+  @staticmethod
+  def _target_compile_timings(target_data):
+    """Yields (target, scope, seconds) for the compile times recorded in a run's target_data."""
+    for target, data_by_scope in sorted((target_data or {}).items()):
+      for scope, data in sorted(data_by_scope.items()):
+        compile_data = data.get('compile') if isinstance(data, dict) else None
+        if isinstance(compile_data, dict) and compile_data.get('time') is not None:
+          yield target, scope, compile_data['time']
+
   @staticmethod
   def _to_ms(timing_secs):
     """Convert a string representing a float of seconds to an int representing milliseconds."""
@@ -0,0 +1,101 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+
+from pants.base.worker_pool import Work, WorkerPool
+from pants.invalidation.source_result_cache import SourceResultCache
+from pants.process.xargs import Xargs
+
+
+class ShardedSourceCheckMixin(object):
+  """A mixin for tasks that check sources by passing them to a tool on its command line.
+
+  Sources are checked in up to `--shards` concurrent invocations of the tool, via `Xargs`. The
+  sources that were checked cleanly are recorded by digest, so that an invalid target only has its
+  changed sources re-checked, until the task's configuration changes.
+  """
+
+  @classmethod
+  def register_options(cls, register):
+    super(ShardedSourceCheckMixin, cls).register_options(register)
+    register('--shards', type=int, default=1, advanced=True,
+             help='Check sources in up to this many concurrent invocations of the tool.')
+    register('--cache-source-results', type=bool, default=True, advanced=True,
+             help='Skip sources that were already checked cleanly with the current configuration, '
+                  'even when the targets that own them are invalid.')
+
+  @property
+  def sharded(self):
+    """Return `True` if sources may be checked by concurrent invocations of the tool.
+
+    :rtype: bool
+    """
+    return self.get_options().shards > 1
+
+  @property
+  def cache_source_results(self):
+    """Return `True` if sources that were checked cleanly may be skipped by later checks.
+
+    Tasks whose results depend on more than the task's configuration and the content of the checked
+    sources (e.g. on a classpath) should override this to return `False`.
+
+    :rtype: bool
+    """
+    return self.get_options().cache_source_results
+
+  def check_sources(self, call, sources, source_path=None, workunit_name='shards'):
+    """Calls `call` with shards of the given sources, xargs style, skipping clean sources.
+
+    :param call: A function that checks the list of sources passed as its sole argument, and returns
+      a non-zero result if any of them failed the check. It may be called concurrently.
+    :param list sources: The sources to check.
+    :param source_path: A function from an item of `sources` to the path of its source; by default
+      the items are taken to be paths themselves.
+    :returns: The first non-zero result of `call`, or else 0.
+    """
+    source_path = source_path or (lambda source: source)
+    cache = None
+    if self.cache_source_results:
+      cache = SourceResultCache(os.path.join(self.workdir, 'source_results.json'), self.fingerprint)
+      unchecked_paths = set(cache.unchecked([source_path(source) for source in sources]))
+      unchecked = [source for source in sources if source_path(source) in unchecked_paths]
+      if len(unchecked) < len(sources):
+        self.context.log.debug('Skipping {} sources that were already checked cleanly.'
+                               .format(len(sources) - len(unchecked)))
+      sources = unchecked
+    if not sources:
+      return 0
+
+    def check_and_record(shard):
+      result = call(shard)
+      if result == 0 and cache:
+        cache.record_clean([source_path(source) for source in shard])
+      return result
+
+    num_shards = min(self.get_options().shards, len(sources))
+    try:
+      if num_shards <= 1:
+        return Xargs(check_and_record).execute(sources)
+
+      with self.context.new_workunit(name=workunit_name) as workunit:
+        worker_pool = WorkerPool(workunit, self.context.run_tracker, num_shards)
+
+        def map_func(func, shards):
+          return worker_pool.submit_work_and_wait(Work(func, [(shard,) for shard in shards]),
+                                                  workunit_parent=workunit)
+        try:
+          result = Xargs(check_and_record, shards=num_shards, map_func=map_func).execute(sources)
+        except BaseException:
+          worker_pool.abort()
+          raise
+        else:
+          worker_pool.shutdown()
+        return result
+    finally:
+      if cache:
+        cache.save()
@@ -252,6 +252,7 @@ class TaskBase(SubsystemClientMixin, Optionable, AbstractClass):
       scope,
       self.context.options,
       build_graph=self.context.build_graph,
+      fingerprinter=self.context.options_fingerprinter,
       include_passthru=self.supports_passthru_args(),
     )
     options_hasher.update(options_fp)
@@ -540,9 +541,13 @@ class TaskBase(SubsystemClientMixin, Optionable, AbstractClass):
       return [], [], []
 
     read_cache = self._cache_factory.get_read_cache()
+    # Check for all artifacts up front, so that misses (the majority on a cold cache) don't each
+    # cost a subprocess dispatch and a serialized round trip to a remote cache.
+    present = read_cache.has_all([vt.cache_key for vt in vts])
     items = [(read_cache, vt.cache_key, vt.current_results_dir if self.cache_target_dirs else None)
-             for vt in vts]
-    res = self.context.subproc_map(call_use_cached_files, items)
+             for vt, is_present in zip(vts, present) if is_present]
+    fetched = iter(self.context.subproc_map(call_use_cached_files, items) if items else ())
+    res = [next(fetched) if is_present else False for is_present in present]
 
     cached_vts = []
     uncached_vts = []
@@ -7,11 +7,14 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 import re
+import threading
 import xml.etree.ElementTree as ET
 from abc import abstractmethod
+from contextlib import contextmanager
 from threading import Timer
 
 from pants.base.exceptions import ErrorWhileTesting, TaskError
+from pants.base.worker_pool import Work, WorkerPool
 from pants.build_graph.files import Files
 from pants.invalidation.cache_manager import VersionedTargetSet
 from pants.task.task import Task
@@ -251,6 +254,14 @@ class TestRunnerTaskMixin(object):
     """
     return self._get_test_targets()
 
+  @contextmanager
+  def _released_partition_lock(self):
+    """Lets other partitions run while the calling one waits, when partitions run concurrently.
+
+    See `PartitionedTestRunnerTaskMixin`.
+    """
+    yield
+
   def _spawn_and_wait(self, *args, **kwargs):
     """Spawn the actual test runner process, and wait for it to complete."""
 
@@ -277,7 +288,8 @@ class TestRunnerTaskMixin(object):
         timer.start()
 
     try:
-      return process_handler.wait(timeout=timeout)
+      with self._released_partition_lock():
+        return process_handler.wait(timeout=timeout)
     except subprocess.TimeoutExpired as e:
       # Since we no longer surface the actual underlying exception, we log.error here
       # to ensure the output indicates why the test has suddenly failed.
@@ -397,8 +409,17 @@ class PartitionedTestRunnerTaskMixin(TestRunnerTaskMixin, Task):
 
   It's expected that mixees implement proper chrooting (see `run_tests_in_chroot`) to support
   correct successful test result caching.
+
+  Mixees may also run partitions concurrently by returning more than 1 from
+  `partition_parallelism`. Only one partition runs task code at a time, but a partition releases
+  that lock while it waits for its test process in `_spawn_and_wait`, so up to
+  `partition_parallelism` test processes run at once. Mixees that do so must not change process
+  wide state, like the working directory, across that wait.
   """
 
+  # Held by the partition running task code, when partitions run concurrently.
+  _partition_lock = None
+
   @classmethod
   def register_options(cls, register):
     super(PartitionedTestRunnerTaskMixin, cls).register_options(register)
@@ -447,19 +468,16 @@ class PartitionedTestRunnerTaskMixin(TestRunnerTaskMixin, Task):
     fail_fast = self.get_options().fail_fast
 
     results = {}
-    failure = False
     with self.partitions(per_target, all_targets, test_targets) as partitions:
-      for (partition, args) in partitions():
-        try:
-          rv = self._run_partition(fail_fast, partition, *args)
-        except ErrorWhileTesting as e:
-          rv = self.result_class.from_error(e)
-
-        results[partition] = rv
-        if not rv.success:
-          failure = True
-          if fail_fast:
+      parallelism = self.partition_parallelism
+      if parallelism > 1:
+        self._run_partitions_concurrently(fail_fast, list(partitions()), parallelism, results)
+      else:
+        for (partition, args) in partitions():
+          results[partition] = self._run_partition_result(fail_fast, partition, args)
+          if not results[partition].success and fail_fast:
             break
+      failure = any(not rv.success for rv in results.values())
 
       for partition in sorted(results):
         rv = results[partition]
@@ -483,6 +501,85 @@ class PartitionedTestRunnerTaskMixin(TestRunnerTaskMixin, Task):
         # A low-level test execution failure occurred before tests were run.
         raise TaskError()
 
+  @property
+  def partition_parallelism(self):
+    """Return the maximum number of partitions to run concurrently.
+
+    :rtype: int
+    """
+    return 1
+
+  def _run_partition_result(self, fail_fast, partition, args):
+    try:
+      return self._run_partition(fail_fast, partition, *args)
+    except ErrorWhileTesting as e:
+      return self.result_class.from_error(e)
+
+  def _run_partitions_concurrently(self, fail_fast, partitions, parallelism, results):
+    """Runs the given partitions in a pool of `parallelism` threads, recording their results.
+
+    With `fail_fast`, no further partitions are started once one fails, but those already running
+    are allowed to finish.
+    """
+    def run_partition(partition, args):
+      rv = self._run_partition_result(fail_fast, partition, args)
+      results[partition] = rv
+      return rv.success
+
+    self._run_concurrently('partitions', run_partition, partitions, parallelism, fail_fast)
+
+  def _run_concurrently(self, workunit_name, func, args_tuples, parallelism, fail_fast):
+    """Calls `func` with each of the given args tuples in a pool of `parallelism` threads.
+
+    Calls run like concurrent partitions: only one runs task code at a time, and each releases that
+    lock while it waits for its test process in `_spawn_and_wait`. So this must not be nested in
+    concurrently run partitions.
+
+    :param func: A function that returns True if the call succeeded. With `fail_fast`, no further
+      calls are started once one fails, but those already running are allowed to finish.
+    """
+    if self._partition_lock is not None:
+      raise AssertionError('Cannot run {} concurrently within concurrently run partitions.'
+                           .format(workunit_name))
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def run(*args):
+      with lock:
+        if failed.is_set():
+          return
+        if not func(*args) and fail_fast:
+          failed.set()
+
+    with self.context.new_workunit(name=workunit_name) as workunit:
+      worker_pool = WorkerPool(workunit, self.context.run_tracker, parallelism)
+      self._partition_lock = lock
+      try:
+        res = worker_pool.submit_async_work(Work(run, args_tuples))
+        # Wait with a timeout, since a wait without one can miss SIGINT.
+        while not res.ready():
+          res.wait(60)
+        res.get()
+      except BaseException:
+        worker_pool.abort()
+        raise
+      else:
+        worker_pool.shutdown()
+      finally:
+        self._partition_lock = None
+
+  @contextmanager
+  def _released_partition_lock(self):
+    lock = self._partition_lock
+    if lock is None:
+      yield
+      return
+    lock.release()
+    try:
+      yield
+    finally:
+      lock.acquire()
+
   # Some notes on invalidation vs caching as used in `run_partition` below. Here invalidation
   # refers to executing task work in `Task.invalidated` blocks against invalid targets. Caching
   # refers to storing the results of that work in the artifact cache using
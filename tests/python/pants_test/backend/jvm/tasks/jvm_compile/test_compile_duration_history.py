@@ -0,0 +1,61 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import unittest
+
+from pants.backend.jvm.tasks.jvm_compile.compile_duration_history import CompileDurationHistory
+from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_file_dump
+
+
+class CompileDurationHistoryTest(unittest.TestCase):
+
+  def test_no_history(self):
+    with temporary_dir() as tmpdir:
+      history = CompileDurationHistory(os.path.join(tmpdir, 'durations.json'))
+      self.assertEqual({'a': 10, 'b': 20}, history.estimate_sizes({'a': 10, 'b': 20}))
+
+  def test_recorded_durations_replace_estimates(self):
+    with temporary_dir() as tmpdir:
+      history = CompileDurationHistory(os.path.join(tmpdir, 'durations.json'))
+      history.record('java', 2.0)
+      history.record('scala', 30.0)
+      # Unseen targets are scaled by the ratio of durations to estimates for seen targets.
+      self.assertEqual({'java': 2.0, 'scala': 30.0, 'unseen': 32.0},
+                       history.estimate_sizes({'java': 1000, 'scala': 24, 'unseen': 1024}))
+
+  def test_zero_estimates(self):
+    with temporary_dir() as tmpdir:
+      history = CompileDurationHistory(os.path.join(tmpdir, 'durations.json'))
+      history.record('a', 2.0)
+      history.record('b', 4.0)
+      self.assertEqual({'a': 2.0, 'b': 4.0, 'c': 3.0},
+                       history.estimate_sizes({'a': 0, 'b': 0, 'c': 0}))
+
+  def test_save_and_load(self):
+    with temporary_dir() as tmpdir:
+      path = os.path.join(tmpdir, 'durations.json')
+      history = CompileDurationHistory(path)
+      history.record('a', 2.0)
+      history.save()
+
+      # A concurrent run records a different target.
+      other = CompileDurationHistory(path)
+      other.record('b', 3.0)
+      other.save()
+
+      history.record('a', 5.0)
+      history.save()
+      self.assertEqual({'a': 5.0, 'b': 3.0},
+                       CompileDurationHistory(path).estimate_sizes({'a': 1, 'b': 1}))
+
+  def test_unreadable_history(self):
+    with temporary_dir() as tmpdir:
+      path = os.path.join(tmpdir, 'durations.json')
+      safe_file_dump(path, 'not json')
+      self.assertEqual({'a': 1}, CompileDurationHistory(path).estimate_sizes({'a': 1}))
@@ -7,12 +7,16 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 
+import mock
+
 from pants.backend.jvm.targets.jar_library import JarLibrary
 from pants.backend.jvm.targets.jvm_binary import JvmBinary
-from pants.backend.jvm.tasks.binary_create import BinaryCreate
+from pants.backend.jvm.tasks.binary_create import BinaryCreate, RuntimeClasspathFingerprintStrategy
+from pants.base.file_digest_cache import FileDigestCache
 from pants.java.jar.exclude import Exclude
 from pants.java.jar.jar_dependency import JarDependency
 from pants.util.contextutil import open_zip
+from pants.util.dirutil import safe_file_dump
 from pants_test.backend.jvm.tasks.jvm_binary_task_test_base import JvmBinaryTaskTestBase
 
 
@@ -97,3 +101,68 @@ class TestBinaryCreate(JvmBinaryTaskTestBase):
                                'Bar.class',
                                'bar.txt']),
                        sorted(jar.namelist()))
+
+  def _prepare_binary(self):
+    binary_target = self.make_target(spec='//bar:bar-binary',
+                                     target_type=JvmBinary,
+                                     source='Bar.java')
+    context = self.context(target_roots=[binary_target])
+    classpath_products = self.ensure_classpath_products(context)
+
+    jar_artifact = self.create_artifact(org='org.example', name='foo', rev='1.0.0')
+    with open_zip(jar_artifact.pants_path, 'w') as jar:
+      jar.writestr('foo/Foo.class', '')
+    classpath_products.add_jars_for_targets(targets=[binary_target],
+                                            conf='default',
+                                            resolved_jars=[jar_artifact])
+
+    self.add_to_runtime_classpath(context, binary_target, {'Bar.class': '', 'bar.txt': ''})
+    return binary_target, context
+
+  def test_jvm_binaries_reused_when_valid(self):
+    binary_target, context = self._prepare_binary()
+    self.execute(context)
+
+    dist_jar = os.path.join(self.build_root, 'dist', 'bar-binary.jar')
+    os.unlink(dist_jar)
+    with mock.patch.object(BinaryCreate, 'monolithic_jar') as monolithic_jar:
+      self.execute(context)
+      self.assertFalse(monolithic_jar.called)
+    self.assertTrue(os.path.isfile(dist_jar))
+
+  def test_external_jars_jar_reused(self):
+    binary_target, context = self._prepare_binary()
+    task = self.create_task(context)
+    dependencies = task.list_external_jar_dependencies(binary_target)
+
+    merged_jar = task._external_jars_jar(binary_target, dependencies)
+    with open_zip(merged_jar) as jar:
+      self.assertIn('foo/Foo.class', jar.namelist())
+
+    with mock.patch.object(BinaryCreate, 'open_jar') as open_jar:
+      self.assertEqual(merged_jar, task._external_jars_jar(binary_target, dependencies))
+      self.assertFalse(open_jar.called)
+
+  def test_runtime_classpath_fingerprinted_by_content(self):
+    self.create_file('bar/Bar.java')
+    binary_target, context = self._prepare_binary()
+    classpath = self.get_runtime_classpath(context)
+
+    def fingerprint():
+      strategy = RuntimeClasspathFingerprintStrategy(classpath, digest_cache=FileDigestCache())
+      return strategy.compute_fingerprint(binary_target)
+
+    original = fingerprint()
+    self.assertEqual(original, fingerprint())
+
+    classes_dir = [path for _, path in classpath.get_for_target(binary_target)
+                   if os.path.isdir(path)][0]
+    safe_file_dump(os.path.join(classes_dir, 'Bar.class'), 'recompiled')
+    recompiled = fingerprint()
+    self.assertNotEqual(original, recompiled)
+
+    jar_path = [path for _, path in classpath.get_for_target(binary_target)
+                if path.endswith('.jar')][0]
+    with open_zip(jar_path, 'w') as jar:
+      jar.writestr('foo/Foo.class', 'a new snapshot')
+    self.assertNotEqual(recompiled, fingerprint())
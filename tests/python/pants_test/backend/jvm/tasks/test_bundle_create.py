@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 
+from pants.backend.jvm.subsystems.shader import Shading
 from pants.backend.jvm.targets.jar_library import JarLibrary
 from pants.backend.jvm.targets.java_library import JavaLibrary
 from pants.backend.jvm.targets.jvm_app import JvmApp
@@ -176,6 +177,59 @@ class TestBundleCreate(JvmBinaryTaskTestBase):
     self.execute(self.task_context)
     self._check_archive_products('foo.foo-app', 'tar', check_copy=True)
 
+  def test_concurrent_bundles(self):
+    self.set_options(worker_count=2, archive='zip')
+    self.app_target = self._create_target()
+    other_app_target = self.make_target(spec='//foo:foo-other-app',
+                                        target_type=JvmApp,
+                                        basename='FooOtherApp',
+                                        dependencies=[self.binary_target])
+    self.task_context = self.context(target_roots=[self.app_target, other_app_target])
+    self._setup_classpath(self.task_context)
+    self.execute(self.task_context)
+    self._check_bundle_products('foo.foo-app', check_symlink=True)
+    self._check_archive_products('foo.foo-app', 'zip', check_copy=True)
+
+    self.app_target = other_app_target
+    self._check_bundle_products('foo.foo-other-app', check_symlink=True)
+    self._check_archive_products('foo.foo-other-app', 'zip', check_copy=True)
+
+    # Concurrent bundles must not share a nailgun server.
+    self.assertFalse(self.create_task(self.task_context).use_nailgun)
+
+  def test_concurrent_deployjar_bundles(self):
+    self.set_options(worker_count=2, deployjar=True)
+    plain_binary_target = self.make_target(spec='//foo:foo-plain-binary',
+                                           target_type=JvmBinary,
+                                           dependencies=[self.java_lib_target])
+    shaded_binary_target = self.make_target(spec='//foo:foo-shaded-binary',
+                                            target_type=JvmBinary,
+                                            dependencies=[self.java_lib_target],
+                                            shading_rules=[Shading.create_relocate_package('foo')])
+    app_targets = [self.make_target(spec='//foo:{}-app'.format(binary_target.name),
+                                    target_type=JvmApp,
+                                    dependencies=[binary_target])
+                   for binary_target in (plain_binary_target, shaded_binary_target)]
+    self.task_context = self.context(target_roots=app_targets)
+
+    # Deploy jars are built from the runtime classpath of the binaries' internal dependencies.
+    classes_dir = os.path.join(self.test_workdir, 'classes')
+    safe_file_dump(os.path.join(classes_dir, 'foo', 'foo.txt'), '// dummy content')
+    runtime_classpath = self.ensure_classpath_products(self.task_context)
+    runtime_classpath.add_for_target(self.java_lib_target, [('default', classes_dir)])
+    self.ensure_consolidated_classpath_products(self.task_context)
+
+    self.execute(self.task_context)
+
+    bundles = self.task_context.products.get('jvm_bundles')
+    for app_target, binary_target in zip(app_targets, (plain_binary_target, shaded_binary_target)):
+      (bundle_basedir, bundle_names), = bundles.get(app_target).items()
+      bundle_root = os.path.join(bundle_basedir, bundle_names[0])
+      deployjar = '{}.jar'.format(binary_target.basename)
+      self.assertEqual([deployjar], list(self.iter_files(bundle_root)))
+      with open_zip(os.path.join(bundle_root, deployjar)) as jar:
+        self.assertTrue(any(name.endswith('foo.txt') for name in jar.namelist()))
+
   def _check_products(self, products, product_fullname):
     self.assertIsNotNone(products)
     product_data = products.get(self.app_target)
@@ -144,3 +144,15 @@ class CheckstyleTest(NailgunTaskTestBase):
 
     self.populate_runtime_classpath(context=context)
     self.execute(context)
+
+  def test_sharded_checks_do_not_share_nailgun(self):
+    self.set_options(shards=2, include_user_classpath=True)
+    task = self.create_task(self._create_context())
+    self.assertFalse(task.use_nailgun)
+    # Results checked against the user classpath can't be cached by source alone.
+    self.assertFalse(task.cache_source_results)
+
+    self.set_options(shards=1, include_user_classpath=False)
+    task = self.create_task(self._create_context())
+    self.assertTrue(task.use_nailgun)
+    self.assertTrue(task.cache_source_results)
@@ -76,6 +76,46 @@ class ClasspathProductsTest(BaseTest):
     self.assertEqual([('default', self.path('a/path')), ('default', self.path('b/path'))],
                      copied.get_for_targets(a_closure))
 
+  def test_elements_are_interned(self):
+    a = self.make_target('a', JvmTarget)
+    b = self.make_target('b', JvmTarget)
+
+    classpath_product = ClasspathProducts(self.pants_workdir)
+    classpath_product.add_for_target(a, [('default', self.path('shared/path'))])
+    classpath_product.add_for_target(b, [('default', self.path('shared/path'))])
+
+    (_, a_entry), = classpath_product.get_classpath_entries_for_targets([a])
+    (_, b_entry), = classpath_product.get_classpath_entries_for_targets([b])
+    self.assertIs(a_entry, b_entry)
+
+  def test_memoized_queries_are_invalidated(self):
+    b = self.make_target('b', JvmTarget, excludes=[Exclude('com.example', 'lib')])
+    a = self.make_target('a', JvmTarget, dependencies=[b])
+    a_closure = a.closure(bfs=True)
+
+    classpath_product = ClasspathProducts(self.pants_workdir)
+    resolved_jar = self.add_jar_classpath_element_for_path(classpath_product,
+                                                           a,
+                                                           self._example_jar_path())
+    self.assertEqual([('default', resolved_jar.pants_path)],
+                     classpath_product.get_for_targets(a_closure))
+
+    # Mutating a returned result does not affect later queries.
+    classpath_product.get_for_targets(a_closure).append(('default', self.path('bogus')))
+    self.assertEqual([('default', resolved_jar.pants_path)],
+                     classpath_product.get_for_targets(a_closure))
+
+    classpath_product.add_for_target(b, [('default', self.path('b/path'))])
+    self.assertEqual([('default', resolved_jar.pants_path), ('default', self.path('b/path'))],
+                     classpath_product.get_for_targets(a_closure))
+
+    self.add_excludes_for_targets(classpath_product, b, a)
+    self.assertEqual([('default', self.path('b/path'))],
+                     classpath_product.get_for_targets(a_closure))
+
+    classpath_product.remove_for_target(b, [('default', self.path('b/path'))])
+    self.assertEqual([], classpath_product.get_for_targets(a_closure))
+
   def test_fails_if_paths_outside_buildroot(self):
     a = self.make_target('a', JvmTarget)
 
@@ -323,6 +323,86 @@ class JUnitRunnerTest(JvmToolTaskTestBase):
         }
       """))], target_name='tests/java/org/pantsbuild/foo:bar_test', create_some_resources=False)
 
+  @ensure_cached(JUnitRun, expected_num_artifacts=0)
+  def test_junit_runner_parallel_jvms(self):
+    self.set_options(batch_size=1, parallel_jvms=2)
+    self.make_target(
+      spec='tests/java/org/pantsbuild/foo:foo_test',
+      target_type=JUnitTests,
+      sources=['BarTest.java', 'FooTest.java'],
+    )
+
+    with self.assertRaises(TaskError) as cm:
+      self._execute_junit_runner([
+        ('BarTest.java', dedent("""
+          package org.pantsbuild.foo;
+          import org.junit.Test;
+          import static org.junit.Assert.assertTrue;
+          public class BarTest {
+            @Test
+            public void testBar() {
+              assertTrue(5 < 3);
+            }
+          }
+        """)),
+        ('FooTest.java', dedent("""
+          package org.pantsbuild.foo;
+          import org.junit.Test;
+          import static org.junit.Assert.assertTrue;
+          public class FooTest {
+            @Test
+            public void testFoo() {
+              assertTrue(5 > 3);
+            }
+          }
+        """)),
+      ], target_name='tests/java/org/pantsbuild/foo:foo_test')
+
+    # The failure in one of the concurrently run batches is attributed to its target.
+    self.assertEqual([t.name for t in cm.exception.failed_targets], ['foo_test'])
+    self.assertIn('org.pantsbuild.foo.BarTest#testBar', str(cm.exception))
+
+  def test_junit_runner_parallel_jvms_ignores_stale_batches(self):
+    self.set_options(batch_size=1, parallel_jvms=2)
+    self.make_target(
+      spec='tests/java/org/pantsbuild/foo:foo_test',
+      target_type=JUnitTests,
+      sources=['BarTest.java', 'FooTest.java'],
+    )
+    sources = [
+      ('BarTest.java', dedent("""
+        package org.pantsbuild.foo;
+        import org.junit.Test;
+        import static org.junit.Assert.assertTrue;
+        public class BarTest {
+          @Test
+          public void testBar() {
+            assertTrue(5 < 3);
+          }
+        }
+      """)),
+      ('FooTest.java', dedent("""
+        package org.pantsbuild.foo;
+        import org.junit.Test;
+        import static org.junit.Assert.assertTrue;
+        public class FooTest {
+          @Test
+          public void testFoo() {
+            assertTrue(5 > 3);
+          }
+        }
+      """)),
+    ]
+
+    with self.assertRaises(TaskError):
+      self._execute_junit_runner(sources, target_name='tests/java/org/pantsbuild/foo:foo_test',
+                                 create_some_resources=False)
+
+    # The results of the failed batch of the first run are not reported by a run in fewer batches.
+    self.set_options(test=['org.pantsbuild.foo.FooTest'])
+    self._execute_junit_runner(sources, target_name='tests/java/org/pantsbuild/foo:foo_test',
+                               create_some_resources=False)
+
   @ensure_cached(JUnitRun, expected_num_artifacts=1)
   def test_junit_runner_extra_env_vars_none(self):
     with environment_as(THIS_VARIABLE="12", THAT_VARIABLE="This is a variable."):
@@ -9,6 +9,8 @@ import os
 import StringIO
 import unittest
 
+import mock
+
 from pants.backend.jvm.tasks.jvm_compile.analysis_tools import AnalysisTools
 from pants.backend.jvm.zinc.zinc_analysis_element import ZincAnalysisElement
 from pants.backend.jvm.zinc.zinc_analysis_parser import ZincAnalysisParser
@@ -53,6 +55,11 @@ class ZincAnalysisTestSimple(unittest.TestCase):
           'org/pantsbuild/example/hello/welcome/WelcomeEverybody$.class',
         ])
 
+  def test_simple_in_small_chunks(self):
+    # Rebasing streams sections in chunks: chunk boundaries must not affect the result.
+    with mock.patch.object(ZincAnalysisParser, '_REBASE_CHUNK_SIZE', 2):
+      self.test_simple()
+
 
 class ZincAnalysisTestSorting(unittest.TestCase):
   class FakeElement(ZincAnalysisElement):
@@ -6,11 +6,13 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import functools
+import glob
 import os
 from contextlib import contextmanager
 from textwrap import dedent
 
 import coverage
+import mock
 from six.moves import configparser
 
 from pants.backend.python.targets.python_library import PythonLibrary
@@ -23,7 +25,7 @@ from pants.backend.python.tasks.select_interpreter import SelectInterpreter
 from pants.base.exceptions import ErrorWhileTesting, TaskError
 from pants.build_graph.target import Target
 from pants.source.source_root import SourceRootConfig
-from pants.util.contextutil import pushd, temporary_dir, temporary_file
+from pants.util.contextutil import environment_as, pushd, temporary_dir, temporary_file
 from pants.util.dirutil import safe_mkdtemp, safe_rmtree
 from pants_test.backend.python.tasks.python_task_test_base import PythonTaskTestBase
 from pants_test.subsystem.subsystem_util import init_subsystem
@@ -436,7 +438,10 @@ class PytestTest(PytestTestBase):
       self.assert_test_info(junit_xml_dir, ('test_one', 'success'), ('test_two', 'failure'))
 
   def coverage_data_file(self):
-    return os.path.join(self.build_root, '.coverage')
+    # Each partition records its coverage data in its own workdir.
+    data_files = glob.glob(os.path.join(self.test_workdir, '*', 'coverage', '.coverage'))
+    self.assertLessEqual(len(data_files), 1)
+    return data_files[0] if data_files else None
 
   def load_coverage_data(self, context, expect_coverage=True):
     path = os.path.join(self.build_root, 'lib', 'core.py')
@@ -444,7 +449,7 @@ class PytestTest(PytestTestBase):
 
   def load_coverage_data_for(self, context, covered_path, expect_coverage=True):
     data_file = self.coverage_data_file()
-    self.assertEqual(expect_coverage, os.path.isfile(data_file))
+    self.assertEqual(expect_coverage, data_file is not None)
     if expect_coverage:
       python_sources = context.products.get_data(GatherSources.PYTHON_SOURCES)
       covered_relpath = os.path.relpath(covered_path, self.build_root)
@@ -481,7 +486,7 @@ class PytestTest(PytestTestBase):
                         failed_targets=None,
                         expect_coverage=True,
                         covered_path=None):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
     simple_coverage_kwargs = {'coverage': 'auto'}
     if failed_targets:
       context = self.run_failing_tests(targets=targets,
@@ -604,7 +609,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=0)
   def test_coverage_modules_dne_option(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     # Explicit modules should trump .coverage.
     context = self.run_failing_tests(targets=[self.green, self.red], failed_targets=[self.red],
@@ -615,7 +620,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=0)
   def test_coverage_modules_option(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     context = self.run_failing_tests(targets=[self.all], failed_targets=[self.all], coverage='core')
     all_statements, not_run_statements = self.load_coverage_data(context)
@@ -624,7 +629,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=0)
   def test_coverage_paths_option(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     context = self.run_failing_tests(targets=[self.all], failed_targets=[self.all], coverage='lib/')
     all_statements, not_run_statements = self.load_coverage_data(context)
@@ -633,7 +638,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=1)
   def test_coverage_issue_5314_primary_source_root(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     context = self.run_tests(targets=[self.app], coverage='app')
 
@@ -644,7 +649,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=1)
   def test_coverage_issue_5314_secondary_source_root(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     context = self.run_tests(targets=[self.app], coverage='core')
 
@@ -655,7 +660,7 @@ class PytestTest(PytestTestBase):
 
   @ensure_cached(PytestRun, expected_num_artifacts=1)
   def test_coverage_issue_5314_all_source_roots(self):
-    self.assertFalse(os.path.isfile(self.coverage_data_file()))
+    self.assertIsNone(self.coverage_data_file())
 
     context = self.run_tests(targets=[self.app], coverage='app,core')
 
@@ -669,6 +674,26 @@ class PytestTest(PytestTestBase):
     self.assertEqual([1, 2, 5, 6], all_statements)
     self.assertEqual([2], not_run_statements)
 
+  @ensure_cached(PytestRun, expected_num_artifacts=1)
+  def test_coverage_env_vars_scrubbed(self):
+    with environment_as(COVERAGE_FILE='/dev/null/.coverage', COV_CORE_SOURCE='/dev/null'):
+      all_statements, not_run_statements = self.run_coverage_auto(targets=[self.green])
+      # Only the test process' environment is scrubbed.
+      self.assertEqual('/dev/null/.coverage', os.environ['COVERAGE_FILE'])
+    self.assertEqual([1, 2, 5, 6], all_statements)
+    self.assertEqual([6], not_run_statements)
+
+  @ensure_cached(PytestRun, expected_num_artifacts=1)
+  def test_coverage_merge_failure_does_not_mask_test_failures(self):
+    with mock.patch.object(PytestRun, '_merge_coverage',
+                           side_effect=Exception('Failed to merge!')) as merge_coverage:
+      self.run_failing_tests(targets=[self.green, self.red],
+                             failed_targets=[self.red],
+                             coverage='auto',
+                             fast=False,
+                             parallelism=2)
+    self.assertEqual(1, merge_coverage.call_count)
+
   @ensure_cached(PytestRun, expected_num_artifacts=1)
   def test_sharding(self):
     shard0_failed_targets = self.try_run_tests(targets=[self.red, self.green], test_shard='0/2')
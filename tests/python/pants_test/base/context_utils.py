@@ -56,6 +56,8 @@ class TestContext(Context):
 
     def report_target_info(self, scope, target, keys, val): pass
 
+    def register_thread(self, parent_workunit): pass
+
 
   class TestLogger(logging.getLoggerClass()):
     """A logger that converts our structured records into flat ones.
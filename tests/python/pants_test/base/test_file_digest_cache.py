@@ -0,0 +1,73 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import unittest
+
+from pants.base.file_digest_cache import FileDigestCache
+from pants.base.hash_utils import hash_file
+from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_file_dump
+
+
+class FileDigestCacheTest(unittest.TestCase):
+
+  def _make_file(self, root, name, content, age_secs=60):
+    path = os.path.join(root, name)
+    safe_file_dump(path, content)
+    mtime = os.stat(path).st_mtime - age_secs
+    os.utime(path, (mtime, mtime))
+    return path
+
+  def test_digest(self):
+    with temporary_dir() as root:
+      path = self._make_file(root, 'a.txt', 'jake')
+      digest_cache = FileDigestCache()
+      self.assertEqual(hash_file(path), digest_cache.digest(path))
+      self.assertEqual(hash_file(path), digest_cache.digest(path))
+
+  def test_rehash_on_stat_change(self):
+    with temporary_dir() as root:
+      path = self._make_file(root, 'a.txt', 'jake')
+      digest_cache = FileDigestCache()
+      digest_cache.digest(path)
+      self._make_file(root, 'a.txt', 'jake jones', age_secs=30)
+      self.assertEqual(hash_file(path), digest_cache.digest(path))
+
+  def test_persistence(self):
+    with temporary_dir() as root:
+      log = os.path.join(root, 'digests')
+      path = self._make_file(root, 'a.txt', 'jake')
+      expected = FileDigestCache(log).digest(path)
+
+      # A stale digest with unchanged stat metadata is trusted, which shows it was not re-read.
+      reloaded = FileDigestCache(log)
+      reloaded._loaded_entries()[path] = (reloaded._loaded_entries()[path][0], 'stale')
+      self.assertEqual('stale', reloaded.digest(path))
+
+      self.assertEqual(expected, FileDigestCache(log).digest(path))
+
+  def test_recently_modified_not_persisted(self):
+    with temporary_dir() as root:
+      log = os.path.join(root, 'digests')
+      path = self._make_file(root, 'a.txt', 'jake', age_secs=0)
+      FileDigestCache(log).digest(path)
+      self.assertEqual({}, FileDigestCache(log)._loaded_entries())
+
+  def test_compaction(self):
+    with temporary_dir() as root:
+      log = os.path.join(root, 'digests')
+      path = self._make_file(root, 'a.txt', 'jake')
+      digest_cache = FileDigestCache(log)
+      for i in range(FileDigestCache._COMPACTION_MIN_RECORDS):
+        mtime = os.stat(path).st_mtime - 1
+        os.utime(path, (mtime, mtime))
+        digest_cache.digest(path)
+
+      self.assertEqual(hash_file(path), FileDigestCache(log).digest(path))
+      with open(log, 'rb') as fp:
+        self.assertEqual(1, len(fp.readlines()))
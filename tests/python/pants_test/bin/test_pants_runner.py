@@ -0,0 +1,27 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import unittest
+
+import mock
+
+from pants.base.build_environment import pants_version
+from pants.bin.pants_runner import PantsRunner
+from pants.util.contextutil import stdio_as, temporary_file
+
+
+class PantsRunnerTest(unittest.TestCase):
+  def test_version_skips_bootstrap(self):
+    exiter = mock.Mock()
+    with mock.patch('pants.bin.pants_runner.OptionsBootstrapper') as options_bootstrapper:
+      with temporary_file() as stdout:
+        with stdio_as(stdout_fd=stdout.fileno(), stderr_fd=-1, stdin_fd=-1):
+          PantsRunner(exiter, args=['./pants', '-V']).run()
+        stdout.seek(0)
+        self.assertEqual(pants_version(), stdout.read().strip())
+    exiter.exit.assert_called_once_with(0)
+    self.assertFalse(options_bootstrapper.called)
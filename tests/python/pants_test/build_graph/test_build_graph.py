@@ -13,6 +13,7 @@ from pants.backend.jvm.targets.jar_library import JarLibrary
 from pants.build_graph.address import Address, parse_spec
 from pants.build_graph.address_lookup_error import AddressLookupError
 from pants.build_graph.build_graph import BuildGraph
+from pants.build_graph.closure_index import ClosureIndex
 from pants.build_graph.target import Target
 from pants.java.jar.jar_dependency import JarDependency
 from pants_test.base_test import BaseTest
@@ -146,6 +147,69 @@ class BuildGraphTest(BaseTest):
     assertDependencyWalk(a, [a, b, c, d, e])
     assertDependencyWalk(a, [c, d, b, e, a], postorder=True)
 
+  def test_closure_index(self):
+    def walks():
+      roots = [[a.address], [e.address], [b.address, f.address], [f.address, b.address, c.address]]
+      results = []
+      for addresses in roots:
+        for postorder in (False, True):
+          for walk in (self.build_graph.walk_transitive_dependency_graph,
+                       self.build_graph.walk_transitive_dependee_graph):
+            targets = []
+            walk(addresses, targets.append, postorder=postorder)
+            results.append(targets)
+      return results
+
+    a = self.make_target('a')
+    b = self.make_target('b', dependencies=[a])
+    c = self.make_target('c', dependencies=[a])
+    d = self.make_target('d', dependencies=[b, c])
+    e = self.make_target('e', dependencies=[d, a])
+    f = self.make_target('f', dependencies=[c])
+
+    expected = walks()
+    self.build_graph.enable_closure_index()
+    self.assertEquals(expected, walks())
+    # Memoized walks are reused.
+    self.assertEquals(expected, walks())
+    self.assertEquals([e, d, b, a, c], e.closure())
+    self.assertEquals([a, b, c, d, e], e.closure(postorder=True))
+
+    # Mutations invalidate the index.
+    self.build_graph.inject_dependency(f.address, e.address)
+    self.assertEquals([f, c, a, e, d, b], f.closure())
+    g = self.make_target('g', dependencies=[f])
+    self.assertEquals([g, f, c, a, e, d, b], g.closure())
+    self.assertEquals({a, b, c, d, e, f, g},
+                      set(self.build_graph.transitive_dependees_of_addresses([a.address])))
+
+  def test_closure_index_many_roots(self):
+    targets = [self.make_target('chain{}'.format(i)) for i in range(20)]
+    for dependee, dependency in zip(targets, targets[1:]):
+      self.build_graph.inject_dependency(dependee.address, dependency.address)
+    self.build_graph.enable_closure_index()
+    closure_index = self.build_graph._closure_index()
+
+    roots = [t.address for t in reversed(targets)]
+    self.assertEquals(list(reversed(targets)),
+                      list(closure_index.walk(roots, postorder=True)))
+    self.assertEquals(targets, list(closure_index.walk(roots[::-1])))
+    # Only the first root of each walk needed a walk of its own, and covered roots weren't walked.
+    self.assertEquals(2, len(closure_index._walks))
+
+  def test_closure_index_bounded(self):
+    a = self.make_target('a')
+    b = self.make_target('b', dependencies=[a])
+    c = self.make_target('c', dependencies=[b])
+    closure_index = ClosureIndex(self.build_graph._target_by_address,
+                                 self.build_graph._target_dependencies_by_address,
+                                 max_memoized_targets=3)
+    self.assertEquals([c, b, a], list(closure_index.walk([c.address])))
+    self.assertEquals([b, a], list(closure_index.walk([b.address])))
+    # The walk of `c` was the least recently used, so it was discarded to make room for `b`'s.
+    self.assertEquals([(b.address, False)], list(closure_index._walks))
+    self.assertEquals([a, b, c], list(closure_index.walk([c.address], postorder=True)))
+
   def test_target_closure(self):
     a = self.make_target('a')
     self.assertEquals([a], a.closure())
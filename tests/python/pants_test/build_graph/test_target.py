@@ -109,6 +109,21 @@ class TargetTest(BaseTest):
     target = self.make_target('foo:bar', Target, foobar='barfoo')
     self.assertFalse(hasattr(target, 'foobar'))
 
+  def test_copy_for_build_graph(self):
+    target = self.make_target(':foo', Target, tags=['a'])
+    target.invalidation_hash()
+    build_graph = self.build_graph.clone_new()
+
+    copy = target.copy_for_build_graph(build_graph)
+    self.assertIsNot(target, copy)
+    self.assertEqual(target.address, copy.address)
+    self.assertIs(target.payload, copy.payload)
+    self.assertIs(build_graph, copy._build_graph)
+    self.assertEqual({}, copy._cached_fingerprint_map)
+
+    copy.tags.add('b')
+    self.assertEqual({'a'}, target.tags)
+
   def test_target_id_long(self):
     long_path = 'dummy'
     for i in range(1,30):
@@ -6,17 +6,21 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import os
+import stat
 import unittest
 from contextlib import contextmanager
 
-from pants.cache.artifact_cache import (NonfatalArtifactCacheError, call_insert,
-                                        call_use_cached_files)
+import mock
+
+from pants.cache.artifact_cache import (NonfatalArtifactCacheError, UnreadableArtifact,
+                                        call_insert, call_use_cached_files)
+from pants.cache.content_addressed_artifact_cache import ContentAddressedLocalArtifactCache
 from pants.cache.local_artifact_cache import LocalArtifactCache, TempLocalArtifactCache
 from pants.cache.pinger import BestUrlSelector, InvalidRESTfulCacheProtoError
 from pants.cache.restful_artifact_cache import RESTfulArtifactCache
 from pants.invalidation.build_invalidator import CacheKey
 from pants.util.contextutil import temporary_dir, temporary_file, temporary_file_path
-from pants.util.dirutil import safe_mkdir
+from pants.util.dirutil import safe_delete, safe_mkdir, safe_rmtree
 from pants_test.cache.cache_server import cache_server
 
 
@@ -31,6 +35,16 @@ class TestArtifactCache(unittest.TestCase):
       with temporary_dir() as cache_root:
         yield LocalArtifactCache(artifact_root, cache_root, compression=1)
 
+  @contextmanager
+  def setup_content_addressed_cache(self, hardlink=False):
+    with temporary_dir() as artifact_root:
+      with temporary_dir() as cache_root:
+        yield ContentAddressedLocalArtifactCache(artifact_root,
+                                                 os.path.join(cache_root, 'task'),
+                                                 os.path.join(cache_root, 'blobs'),
+                                                 compression=1,
+                                                 hardlink=hardlink)
+
   @contextmanager
   def setup_server(self, return_failed=False, cache_root=None):
     with cache_server(return_failed=return_failed, cache_root=cache_root) as server:
@@ -56,6 +70,121 @@ class TestArtifactCache(unittest.TestCase):
     with self.setup_local_cache() as artifact_cache:
       self.do_test_artifact_cache(artifact_cache)
 
+  def test_content_addressed_cache(self):
+    with self.setup_content_addressed_cache() as artifact_cache:
+      self.do_test_artifact_cache(artifact_cache)
+
+    with self.setup_content_addressed_cache(hardlink=True) as artifact_cache:
+      self.do_test_artifact_cache(artifact_cache)
+
+  def test_content_addressed_cache_deduplicates(self):
+    with self.setup_content_addressed_cache(hardlink=True) as artifact_cache:
+      root = artifact_cache.artifact_root
+      key1 = CacheKey('muppet_key', 'fake_hash')
+      key2 = CacheKey('kermit_key', 'fake_hash')
+      for name in ('a', 'b'):
+        safe_mkdir(os.path.join(root, name, 'empty'))
+        with open(os.path.join(root, name, 'same.class'), 'wb') as fp:
+          fp.write(TEST_CONTENT1)
+      artifact_cache.insert(key1, [os.path.join(root, 'a')])
+      artifact_cache.insert(key2, [os.path.join(root, 'b')])
+
+      blobs = [os.path.join(dirpath, f)
+               for dirpath, _, files in os.walk(artifact_cache._blob_root) for f in files]
+      self.assertEquals(1, len(blobs))
+
+      safe_rmtree(os.path.join(root, 'a'))
+      safe_rmtree(os.path.join(root, 'b'))
+      self.assertTrue(artifact_cache.use_cached_files(key1))
+      self.assertTrue(artifact_cache.use_cached_files(key2))
+
+      # Empty dirs are restored, and both files are hardlinks to the single blob.
+      self.assertTrue(os.path.isdir(os.path.join(root, 'a', 'empty')))
+      for name in ('a', 'b'):
+        self.assertTrue(os.path.samefile(blobs[0], os.path.join(root, name, 'same.class')))
+
+      # Hardlinked files are read-only, since modifying them would corrupt the shared blob.
+      self.assertFalse(os.stat(blobs[0]).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+  def test_content_addressed_cache_copies_writable_files(self):
+    key = CacheKey('muppet_key', 'fake_hash')
+    with self.setup_content_addressed_cache() as artifact_cache:
+      with self.setup_test_file(artifact_cache.artifact_root) as path:
+        artifact_cache.insert(key, [path])
+        safe_delete(path)
+        self.assertTrue(artifact_cache.use_cached_files(key))
+
+        with open(path, 'wb') as fp:
+          fp.write(TEST_CONTENT2)
+        self.assertTrue(artifact_cache.use_cached_files(key))
+        with open(path, 'rb') as fp:
+          self.assertEquals(TEST_CONTENT1, fp.read())
+
+  def test_content_addressed_cache_collects_unreferenced_blobs(self):
+    with self.setup_content_addressed_cache() as artifact_cache:
+      artifact_cache._max_entries_per_target = 1
+      path = os.path.join(artifact_cache.artifact_root, 'muppet.class')
+
+      def insert(content, key):
+        with open(path, 'wb') as fp:
+          fp.write(content)
+        artifact_cache.insert(key, [path])
+
+      def blobs():
+        return sorted(f for _, _, files in os.walk(artifact_cache._blob_root) for f in files
+                      if f != artifact_cache._BLOB_GC_MARKER)
+
+      insert(TEST_CONTENT1, CacheKey('muppet_key', 'fake_hash1'))
+      insert(TEST_CONTENT1, CacheKey('kermit_key', 'fake_hash1'))
+      self.assertEquals(1, len(blobs()))
+
+      # The first collection ran on the first insert: later ones wait for the interval to pass.
+      insert(TEST_CONTENT2, CacheKey('muppet_key', 'fake_hash2'))
+      self.assertEquals(2, len(blobs()))
+
+      with mock.patch.object(ContentAddressedLocalArtifactCache, '_BLOB_GC_INTERVAL_SECS', 0):
+        # The blob of muppet's first manifest is still referenced by kermit's manifest.
+        insert(TEST_CONTENT2, CacheKey('muppet_key', 'fake_hash3'))
+        self.assertEquals(2, len(blobs()))
+
+        artifact_cache.delete(CacheKey('kermit_key', 'fake_hash1'))
+        insert(TEST_CONTENT2, CacheKey('muppet_key', 'fake_hash4'))
+        self.assertEquals(1, len(blobs()))
+        self.assertTrue(artifact_cache.use_cached_files(CacheKey('muppet_key', 'fake_hash4')))
+
+  def test_content_addressed_cache_missing_blob(self):
+    key = CacheKey('muppet_key', 'fake_hash')
+    with self.setup_content_addressed_cache() as artifact_cache:
+      with self.setup_test_file(artifact_cache.artifact_root) as path:
+        artifact_cache.insert(key, [path])
+        safe_rmtree(artifact_cache._blob_root)
+
+        result = artifact_cache.use_cached_files(key)
+        self.assertIsInstance(result, UnreadableArtifact)
+        self.assertFalse(artifact_cache.has(key))
+
+  def test_content_addressed_backed_remote_cache(self):
+    with self.setup_server() as server:
+      with self.setup_content_addressed_cache() as local:
+        tmp = TempLocalArtifactCache(local.artifact_root, 0)
+        remote = RESTfulArtifactCache(local.artifact_root, BestUrlSelector([server.url]), tmp)
+        combined = RESTfulArtifactCache(local.artifact_root, BestUrlSelector([server.url]), local)
+
+        key = CacheKey('muppet_key', 'fake_hash')
+        with self.setup_test_file(local.artifact_root) as path:
+          remote.insert(key, [path])
+          self.assertFalse(local.has(key))
+
+          # Successfully using via combined should backfill local.
+          self.assertTrue(bool(combined.use_cached_files(key)))
+          self.assertTrue(local.has(key))
+
+          with open(path, 'w') as outfile:
+            outfile.write(TEST_CONTENT2)
+          self.assertTrue(bool(local.use_cached_files(key)))
+          with open(path, 'r') as infile:
+            self.assertEquals(TEST_CONTENT1, infile.read())
+
   def test_restful_cache(self):
     with self.assertRaises(InvalidRESTfulCacheProtoError):
       RESTfulArtifactCache('foo', BestUrlSelector(['ftp://localhost/bar']), 'foo')
@@ -105,6 +234,21 @@ class TestArtifactCache(unittest.TestCase):
       artifact_cache.delete(key)
       self.assertFalse(artifact_cache.has(key))
 
+  def test_restful_cache_has_all(self):
+    keys = [CacheKey('muppet_key', 'fake_hash_{}'.format(i)) for i in range(20)]
+    with self.setup_rest_cache() as artifact_cache:
+      with self.setup_test_file(artifact_cache.artifact_root) as path:
+        for key in keys[::3]:
+          artifact_cache.insert(key, [path])
+      self.assertEquals([i % 3 == 0 for i in range(20)], artifact_cache.has_all(keys))
+
+    # Failed checks are reported as missing, and no further requests are made after a failure.
+    with self.setup_rest_cache(return_failed=True) as artifact_cache:
+      artifact_cache._max_concurrent_requests = 1
+      with mock.patch.object(artifact_cache, '_request', wraps=artifact_cache._request) as request:
+        self.assertEquals([False, False, False], artifact_cache.has_all(keys[:3]))
+        self.assertEquals(1, request.call_count)
+
   def test_local_backed_remote_cache(self):
     """make sure that the combined cache finds what it should and that it backfills"""
     with self.setup_server() as server:
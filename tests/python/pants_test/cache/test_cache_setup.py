@@ -13,6 +13,7 @@ from pants.cache.cache_setup import (CacheFactory, CacheSetup, CacheSpec, CacheS
                                      EmptyCacheSpecError, InvalidCacheSpecError,
                                      LocalCacheSpecRequiredError, RemoteCacheSpecRequiredError,
                                      TooManyCacheSpecsError)
+from pants.cache.content_addressed_artifact_cache import ContentAddressedLocalArtifactCache
 from pants.cache.local_artifact_cache import LocalArtifactCache
 from pants.cache.resolver import Resolver
 from pants.cache.restful_artifact_cache import RESTfulArtifactCache
@@ -86,6 +87,8 @@ class TestCacheSetup(BaseTest):
       'max_entries_per_target': 1,
       'write_permissions': None,
       'dereference_symlinks': True,
+      'local_backend': 'tarball',
+      'local_hardlink': True,
       # Usually read from global scope.
       'pants_workdir': self.pants_workdir
     }
@@ -162,10 +165,10 @@ class TestCacheSetup(BaseTest):
                       cache_factory._resolve(self.CACHE_SPEC_LOCAL_RESOLVE))
 
   def test_cache_spec_parsing(self):
-    def mk_cache(spec, resolver=None):
+    def mk_cache(spec, resolver=None, local_backend='tarball'):
       Subsystem.reset()
       self.set_options_for_scope(CacheSetup.subscope(DummyTask.options_scope),
-                                 read_from=spec, compression=1)
+                                 read_from=spec, compression=1, local_backend=local_backend)
       self.context(for_task_types=[DummyTask])  # Force option initialization.
       cache_factory = CacheSetup.create_cache_factory_for_task(
         self.create_task(),
@@ -173,14 +176,15 @@ class TestCacheSetup(BaseTest):
         resolver=resolver)
       return cache_factory.get_read_cache()
 
-    def check(expected_type, spec, resolver=None):
-      cache = mk_cache(spec, resolver=resolver)
+    def check(expected_type, spec, resolver=None, local_backend='tarball'):
+      cache = mk_cache(spec, resolver=resolver, local_backend=local_backend)
       self.assertIsInstance(cache, expected_type)
       self.assertEquals(cache.artifact_root, self.pants_workdir)
 
     with temporary_dir() as tmpdir:
       cachedir = os.path.join(tmpdir, 'cachedir')  # Must be a real path, so we can safe_mkdir it.
       check(LocalArtifactCache, [cachedir])
+      check(ContentAddressedLocalArtifactCache, [cachedir], local_backend='content-addressed')
       check(RESTfulArtifactCache, ['http://localhost/bar'])
       check(RESTfulArtifactCache, ['https://localhost/bar'])
       check(RESTfulArtifactCache, [cachedir, 'http://localhost/bar'])
@@ -5,6 +5,7 @@
 from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
                         unicode_literals, with_statement)
 
+import pickle
 import unittest
 import urlparse
 
@@ -114,3 +115,22 @@ class TestBestUrlSelector(BaseTest):
     self.call_url(self.url2, with_error=True)
     self.call_url(self.url2, with_error=True)
     self.call_url(self.url1)
+
+  def test_concurrent_failures_rotate_once(self):
+    # Two calls that selected url1 concurrently both fail: url1 is only rotated away from once.
+    selector = BestUrlSelector([self.url1, self.url2], max_failures=0)
+    with self.assertRaises(RequestException):
+      with selector.select_best_url():
+        with self.assertRaises(RequestException):
+          with selector.select_best_url():
+            raise RequestException('first failure')
+        raise RequestException('second failure')
+    self.call_url_with(selector, self.url2)
+
+  def test_pickleable(self):
+    selector = pickle.loads(pickle.dumps(self.best_url_selector))
+    self.call_url_with(selector, self.url1)
+
+  def call_url_with(self, selector, expected_url):
+    with selector.select_best_url() as url:
+      self.assertEquals(urlparse.urlparse(expected_url), url)
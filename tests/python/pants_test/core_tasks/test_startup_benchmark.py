@@ -0,0 +1,64 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+from textwrap import dedent
+
+from mock import patch
+from pkg_resources import WorkingSet
+
+from pants.base.exceptions import TaskError
+from pants.core_tasks.startup_benchmark import StartupBenchmark
+from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_file_dump
+from pants_test.tasks.task_test_base import ConsoleTaskTestBase
+
+
+class StartupBenchmarkTest(ConsoleTaskTestBase):
+
+  @classmethod
+  def task_type(cls):
+    return StartupBenchmark
+
+  def assert_backends_timed(self, backends, plugins=(), **options):
+    self.set_options_for_scope('', backend_packages=backends, plugins=list(plugins))
+    output = self.execute_console_task(options=dict(repeats=1, **options))
+    self.assertEqual(['pants.build_graph', 'pants.core_tasks'] + backends + list(plugins) +
+                     ['total'],
+                     [line.split()[1] for line in output])
+    for line in output:
+      self.assertGreaterEqual(float(line.split()[0].rstrip('s')), 0)
+
+  def test_backends(self):
+    self.assert_backends_timed(['pants.backend.graph_info'])
+
+  def test_isolated(self):
+    self.assert_backends_timed(['pants.backend.graph_info'], isolated=True)
+
+  def test_missing_backend(self):
+    self.set_options_for_scope('', backend_packages=['pants.backend.nonexistent'])
+    with self.assertRaises(TaskError):
+      self.execute_console_task(options={'repeats': 1})
+
+  def test_plugins(self):
+    with temporary_dir() as plugin_root:
+      safe_file_dump(os.path.join(plugin_root, 'benchmarked_plugin_register.py'),
+                     'def register_goals():\n  pass\n')
+      safe_file_dump(os.path.join(plugin_root, 'benchmarked_plugin.egg-info', 'PKG-INFO'),
+                     'Metadata-Version: 1.0\nName: benchmarked-plugin\nVersion: 1.0\n')
+      safe_file_dump(os.path.join(plugin_root, 'benchmarked_plugin.egg-info', 'entry_points.txt'),
+                     dedent("""
+                       [pantsbuild.plugin]
+                       register_goals = benchmarked_plugin_register:register_goals
+                     """))
+      with patch('pants.core_tasks.startup_benchmark.working_set', WorkingSet([plugin_root])):
+        self.assert_backends_timed(['pants.backend.graph_info'], plugins=['benchmarked-plugin'])
+
+  def test_missing_plugin(self):
+    self.set_options_for_scope('', plugins=['nonexistent-plugin'])
+    with self.assertRaises(TaskError):
+      self.execute_console_task(options={'repeats': 1})
@@ -0,0 +1,84 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import unittest
+
+from pants.core_tasks.stats_report import StatsReport, find_regression, percentile
+from pants.stats.statsdb import StatsDB
+from pants_test.tasks.task_test_base import ConsoleTaskTestBase
+
+
+class StatsReportFunctionsTest(unittest.TestCase):
+
+  def test_percentile(self):
+    self.assertEqual(3, percentile([3], 90))
+    self.assertEqual(2.5, percentile([1, 2, 3, 4], 50))
+    self.assertEqual(4, percentile([1, 2, 3, 4], 100))
+
+  def test_find_regression(self):
+    self.assertIsNone(find_regression([10, 11, 10, 10.5], threshold=0.2))
+    # A single slow run that recovered is not a regression.
+    self.assertIsNone(find_regression([10, 11, 10, 14, 10], threshold=0.2))
+    self.assertEqual((3, 10), find_regression([10, 11, 10, 14, 13], threshold=0.2))
+    self.assertIsNone(find_regression([10, 11, 10, 14, 13], threshold=0.2, min_delta=5))
+    self.assertEqual((3, 0.9), find_regression([0.9, 0.8, 0.9, 0.5], threshold=0.2,
+                                               higher_is_better=True))
+
+
+class StatsReportTest(ConsoleTaskTestBase):
+
+  @classmethod
+  def task_type(cls):
+    return StatsReport
+
+  def setUp(self):
+    super(StatsReportTest, self).setUp()
+    path = os.path.join(self.build_root, 'statsdb.sqlite')
+    self.set_options_for_scope('statsdb', path=path)
+    statsdb = StatsDB(path)
+    statsdb.ensure_tables()
+    timings = [('compile.zinc', [10, 11, 10, 14, 13]), ('resolve.ivy', [2, 2, 2, 2, 2])]
+    for i in range(5):
+      statsdb.insert_stats({
+        'run_info': {
+          'id': 'run{}'.format(i),
+          'timestamp': str(1438600000 + i),
+          'machine': 'ernie',
+          'user': 'bert',
+          'version': '9.8.7',
+          'buildroot': '/path/to/repo',
+          'outcome': 'SUCCESS',
+          'cmd_line': 'pants compile baz:qux',
+          'revision': 'rev{}'.format(i),
+        },
+        'cumulative_timings': [{'label': label, 'timing': values[i]} for label, values in timings],
+        'self_timings': [],
+      })
+
+  def test_report(self):
+    self.assert_console_output(
+      'cumulative_timings:',
+      '  compile.zinc: 5 runs, p50 11.000, p90 13.600, latest 13.000, '
+      'REGRESSED +30.0% from 10.000 in run run3 (revision rev3)',
+      '  resolve.ivy: 5 runs, p50 2.000, p90 2.000, latest 2.000',
+    )
+
+  def test_regressions_only(self):
+    self.assert_console_output(
+      'cumulative_timings:',
+      '  compile.zinc: 5 runs, p50 11.000, p90 13.600, latest 13.000, '
+      'REGRESSED +30.0% from 10.000 in run run3 (revision rev3)',
+      options={'regressions_only': True},
+    )
+
+  def test_num_runs(self):
+    self.assert_console_output(
+      'cumulative_timings:',
+      '  compile.zinc: 3 runs, p50 13.000, p90 13.800, latest 13.000',
+      options={'num_runs': 3, 'labels': ['zinc']},
+    )
@@ -261,27 +261,35 @@ class ChangedIntegrationTest(PantsRunIntegrationTest, TestGenerator):
 
     for filename, dependee_mapping in cls.TEST_MAPPING.items():
       for dependee_type in dependee_mapping.keys():
-        # N.B. The parameters here are used purely to close over the respective loop variables.
-        def inner_integration_coverage_test(self, filename=filename, dependee_type=dependee_type):
-          with create_isolated_git_repo() as worktree:
-            # Mutate the working copy so we can do `--changed-parent=HEAD` deterministically.
-            with mutated_working_copy([os.path.join(worktree, filename)]):
-              stdout = self.run_list(
-                ['--changed-include-dependees={}'.format(dependee_type), '--changed-parent=HEAD'],
-              )
-
-              self.assertEqual(
-                lines_to_set(self.TEST_MAPPING[filename][dependee_type]),
-                lines_to_set(stdout)
-              )
-
-        cls.add_test(
-          'test_changed_coverage_{}_{}'.format(dependee_type, safe_filename(filename)),
-          inner_integration_coverage_test
-        )
+        # Dependees are found either with the dependee index, or by constructing the whole graph.
+        for dependee_index in (True, False):
+          if dependee_type == 'none' and not dependee_index:
+            continue
+
+          # N.B. The parameters here are used purely to close over the respective loop variables.
+          def inner_integration_coverage_test(self, filename=filename, dependee_type=dependee_type,
+                                              dependee_index=dependee_index):
+            with create_isolated_git_repo() as worktree:
+              # Mutate the working copy so we can do `--changed-parent=HEAD` deterministically.
+              with mutated_working_copy([os.path.join(worktree, filename)]):
+                stdout = self.run_list(
+                  ['--changed-include-dependees={}'.format(dependee_type), '--changed-parent=HEAD'],
+                  global_args=['--{}dependee-index'.format('' if dependee_index else 'no-')],
+                )
+
+                self.assertEqual(
+                  lines_to_set(self.TEST_MAPPING[filename][dependee_type]),
+                  lines_to_set(stdout)
+                )
+
+          cls.add_test(
+            'test_changed_coverage_{}_{}{}'.format(dependee_type, safe_filename(filename),
+                                                   '' if dependee_index else '_without_index'),
+            inner_integration_coverage_test
+          )
 
-  def run_list(self, extra_args, success=True):
-    list_args = ['-q', 'list'] + extra_args
+  def run_list(self, extra_args, success=True, global_args=()):
+    list_args = list(global_args) + ['-q', 'list'] + extra_args
     pants_run = self.do_command(*list_args, success=success)
     return pants_run.stdout_data
 
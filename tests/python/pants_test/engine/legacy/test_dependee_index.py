@@ -0,0 +1,161 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import unittest
+
+import mock
+
+from pants.build_graph.address import Address, BuildFileAddress
+from pants.build_graph.injectables_mixin import InjectablesMixin
+from pants.build_graph.target import Target
+from pants.engine.fs import FileContent, FilesContent
+from pants.engine.legacy.dependee_index import DependeeIndex
+from pants.engine.legacy.graph import HydratedTarget, HydratedTargets
+from pants.engine.legacy.structs import TargetAdaptor
+from pants.subsystem.subsystem import Subsystem
+from pants.util.contextutil import temporary_dir
+from pants_test.subsystem.subsystem_util import init_subsystem
+
+
+class Injector(InjectablesMixin, Subsystem):
+  options_scope = 'test-injector'
+
+  @classmethod
+  def register_options(cls, register):
+    super(Injector, cls).register_options(register)
+    register('--library', default='//:library')
+
+  @property
+  def injectables_spec_mapping(self):
+    return {'library': [self.get_options().library]}
+
+
+class InjectedTarget(Target):
+  @classmethod
+  def subsystems(cls):
+    return super(InjectedTarget, cls).subsystems() + (Injector,)
+
+  @classmethod
+  def compute_dependency_specs(cls, kwargs=None, payload=None):
+    for spec in super(InjectedTarget, cls).compute_dependency_specs(kwargs, payload):
+      yield spec
+    for spec in Injector.global_instance().injectables_specs_for_key('library'):
+      yield spec
+
+
+class DependeeIndexTest(unittest.TestCase):
+
+  def setUp(self):
+    # Directory -> (BUILD file content, dict of target name to dependency specs).
+    self.build_files = {}
+    self.parsed_dirs = []
+    self.scheduler = mock.Mock()
+    self.scheduler.product_request.side_effect = self.product_request
+    self.target_types = {'target': Target}
+
+  def tearDown(self):
+    Subsystem.reset()
+
+  def product_request(self, product, subjects):
+    if product is FilesContent:
+      return [FilesContent([FileContent(os.path.join(directory, 'BUILD'), content)
+                            for directory, (content, _) in self.build_files.items()])]
+    self.assertIs(HydratedTargets, product)
+    (specs,) = subjects
+    directories = [spec.directory for spec in specs.dependencies]
+    self.parsed_dirs.extend(directories)
+    return [HydratedTargets([self.hydrated_target(directory, name, dependencies)
+                             for directory in directories
+                             for name, dependencies in self.build_files[directory][1].items()])]
+
+  def hydrated_target(self, directory, name, dependencies):
+    address = BuildFileAddress(rel_path=os.path.join(directory, 'BUILD'), target_name=name)
+    adaptor = TargetAdaptor(address=address, name=name, type_alias='target',
+                            dependencies=[Address.parse(d) for d in dependencies])
+    return HydratedTarget(address, adaptor, tuple())
+
+  def set_build_file(self, directory, **targets):
+    content = repr(sorted(targets.items())).encode('utf-8')
+    self.build_files[directory] = (content, targets)
+
+  def create_index(self, path=None, build_ignore_patterns=None):
+    return DependeeIndex(self.scheduler, self.target_types,
+                         build_ignore_patterns=build_ignore_patterns, path=path)
+
+  def dependees(self, index, spec):
+    return sorted(address.spec for address in index.dependees_of(Address.parse(spec)))
+
+  def parsed(self):
+    parsed_dirs = sorted(self.parsed_dirs)
+    self.parsed_dirs = []
+    return parsed_dirs
+
+  def test_incremental_update(self):
+    self.set_build_file('a', lib=[])
+    self.set_build_file('b', lib=['a:lib'])
+    self.set_build_file('c', lib=['a:lib', 'b:lib'], bin=['c:lib'])
+
+    index = self.create_index().update()
+    self.assertEqual(['a', 'b', 'c'], self.parsed())
+    self.assertEqual(['b:lib', 'c:lib'], self.dependees(index, 'a:lib'))
+    self.assertEqual(['c:bin'], self.dependees(index, 'c:lib'))
+
+    index.update()
+    self.assertEqual([], self.parsed())
+
+    self.set_build_file('c', lib=['b:lib'])
+    index.update()
+    self.assertEqual(['c'], self.parsed())
+    self.assertEqual(['b:lib'], self.dependees(index, 'a:lib'))
+    self.assertEqual([], self.dependees(index, 'c:lib'))
+
+    del self.build_files['b']
+    index.update()
+    self.assertEqual([], self.parsed())
+    self.assertEqual([], self.dependees(index, 'a:lib'))
+    self.assertEqual(['c:lib'], self.dependees(index, 'b:lib'))
+
+  def test_persisted(self):
+    self.set_build_file('a', lib=[])
+    self.set_build_file('b', lib=['a:lib'])
+
+    with temporary_dir() as workdir:
+      path = os.path.join(workdir, 'dependee_index', 'index.json')
+      self.create_index(path=path).update()
+      self.assertEqual(['a', 'b'], self.parsed())
+
+      self.set_build_file('a', lib=['b:other'])
+      index = self.create_index(path=path).update()
+      self.assertEqual(['a'], self.parsed())
+      self.assertEqual(['b:lib'], self.dependees(index, 'a:lib'))
+      self.assertEqual(['a:lib'], self.dependees(index, 'b:other'))
+
+      # An index created with different options does not reuse the persisted one.
+      self.create_index(path=path, build_ignore_patterns=['c']).update()
+      self.assertEqual(['a', 'b'], self.parsed())
+
+  def test_injected_dependencies_follow_options(self):
+    self.target_types = {'target': InjectedTarget}
+    self.set_build_file('a', lib=[])
+
+    with temporary_dir() as workdir:
+      path = os.path.join(workdir, 'dependee_index', 'index.json')
+      init_subsystem(Injector, {'test-injector': {'library': '//:old'}})
+      index = self.create_index(path=path).update()
+      self.assertEqual(['a'], self.parsed())
+      self.assertEqual(['a:lib'], self.dependees(index, '//:old'))
+
+      self.create_index(path=path).update()
+      self.assertEqual([], self.parsed())
+
+      Subsystem.reset()
+      init_subsystem(Injector, {'test-injector': {'library': '//:new'}})
+      index = self.create_index(path=path).update()
+      self.assertEqual(['a'], self.parsed())
+      self.assertEqual([], self.dependees(index, '//:old'))
+      self.assertEqual(['a:lib'], self.dependees(index, '//:new'))
@@ -42,7 +42,8 @@ class GraphTestBase(unittest.TestCase):
     return options
 
   @contextmanager
-  def graph_helper(self, build_file_aliases=None, build_file_imports_behavior='allow', include_trace_on_error=True):
+  def graph_helper(self, build_file_aliases=None, build_file_imports_behavior='allow', include_trace_on_error=True,
+                   cache_targets=False):
     with temporary_dir() as work_dir:
       path_ignore_patterns = ['.*']
       graph_helper = EngineInitializer.setup_legacy_graph(path_ignore_patterns,
@@ -50,7 +51,8 @@ class GraphTestBase(unittest.TestCase):
                                                           build_file_imports_behavior,
                                                           build_file_aliases=build_file_aliases,
                                                           native=self._native,
-                                                          include_trace_on_error=include_trace_on_error)
+                                                          include_trace_on_error=include_trace_on_error,
+                                                          cache_targets=cache_targets)
       yield graph_helper
 
   @contextmanager
@@ -141,6 +143,29 @@ class GraphInvalidationTest(GraphTestBase):
         node_count, last_node_count = scheduler.node_count(), node_count
         self.assertLess(node_count, last_node_count)
 
+  def test_target_cache(self):
+    spec = '3rdparty/python:'
+    with self.graph_helper(cache_targets=True) as graph_helper:
+      target_roots = self.create_target_roots([spec])
+      graph_helper.warm_product_graph(target_roots)
+      self.assertGreater(len(graph_helper.target_cache), 0)
+
+      first_graph, _ = self.create_graph_from_specs(graph_helper, [spec])
+      second_graph, _ = self.create_graph_from_specs(graph_helper, [spec])
+      address = Address.parse('3rdparty/python:pytest')
+      first, second = first_graph.get_target(address), second_graph.get_target(address)
+
+      # Each graph gets its own Target, backed by the cached instantiation's payload.
+      self.assertIsNot(first, second)
+      self.assertIs(first.payload, second.payload)
+      self.assertIs(first_graph, first._build_graph)
+      self.assertIs(second_graph, second._build_graph)
+
+      # Invalidating the BUILD file invalidates the cached instantiation.
+      graph_helper.scheduler.invalidate_files(['3rdparty/python/BUILD'])
+      third_graph, _ = self.create_graph_from_specs(graph_helper, [spec])
+      self.assertIsNot(first.payload, third_graph.get_target(address).payload)
+
   def _ordering_test(self, spec, expected_sources=None):
     expected_sources = expected_sources or ['p', 'a', 'n', 't', 's', 'b', 'u', 'i', 'l', 'd']
     with self.open_scheduler([spec]) as (graph, _, _):
@@ -0,0 +1,90 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import unittest
+
+import mock
+
+from pants.build_graph.address import BuildFileAddress
+from pants.engine.legacy.graph import HydratedTarget, HydratedTargets
+from pants.engine.legacy.source_mapper import EngineSourceMapper
+from pants.engine.legacy.structs import TargetAdaptor
+from pants.source.wrapped_globs import EagerFilesetWithSpec
+
+
+class EngineSourceMapperTest(unittest.TestCase):
+
+  def setUp(self):
+    self.scheduler = mock.Mock()
+    self.source_mapper = EngineSourceMapper(self.scheduler)
+
+  def hydrated_target(self, spec_path, name, files=(), source=None):
+    address = BuildFileAddress(rel_path='{}/BUILD'.format(spec_path), target_name=name)
+    kwargs = dict(address=address, name=name)
+    if files:
+      kwargs['sources'] = EagerFilesetWithSpec(spec_path,
+                                               {'globs': ['{}/*.py'.format(spec_path)]},
+                                               list(files),
+                                               'hash')
+    if source:
+      kwargs['source'] = source
+    return HydratedTarget(address, TargetAdaptor(**kwargs), tuple())
+
+  def set_targets(self, *hydrated_targets):
+    self.scheduler.product_request.return_value = [HydratedTargets(hydrated_targets)]
+
+  def owners(self, *sources):
+    return sorted(address.spec for address in
+                  self.source_mapper.iter_target_addresses_for_sources(sources))
+
+  def test_owners(self):
+    self.set_targets(self.hydrated_target('a', 'lib', files=['one.py', 'two.py']),
+                     self.hydrated_target('a', 'bin', source='main.py'),
+                     self.hydrated_target('b', 'other', files=['three.py']))
+
+    self.assertEqual(['a:lib'], self.owners('a/one.py'))
+    self.assertEqual(['a:bin', 'a:lib'], self.owners('a/two.py', 'a/main.py'))
+    self.assertEqual(['a:bin', 'a:lib'], self.owners('a/BUILD'))
+    self.assertEqual([], self.owners('a/README'))
+
+  def test_deleted_file_matches_filespec(self):
+    self.set_targets(self.hydrated_target('a', 'lib', files=['one.py']))
+    self.assertEqual(['a:lib'], self.owners('a/deleted.py'))
+
+  def test_index_updates(self):
+    self.set_targets(self.hydrated_target('a', 'lib', files=['one.py']))
+    self.assertEqual(['a:lib'], self.owners('a/one.py'))
+
+    # The target is invalidated and now owns a different file.
+    self.set_targets(self.hydrated_target('a', 'lib', source='two.py'))
+    self.assertEqual([], self.owners('a/one.py'))
+    self.assertEqual(['a:lib'], self.owners('a/two.py'))
+
+    # The target is removed.
+    self.set_targets()
+    self.assertEqual([], self.owners('a/two.py'))
+    self.assertEqual({}, dict(self.source_mapper._owners_by_path))
+    self.assertEqual({}, dict(self.source_mapper._addresses_by_spec_path))
+
+  def test_targets_outside_searched_dirs_stay_indexed(self):
+    self.set_targets(self.hydrated_target('a', 'lib', files=['one.py']),
+                     self.hydrated_target('b', 'lib', files=['two.py']))
+    self.assertEqual(['a:lib', 'b:lib'], self.owners('a/one.py', 'b/two.py'))
+
+    # Only `a` and the buildroot are searched, so the target in `b` is not dropped.
+    self.set_targets()
+    self.assertEqual([], self.owners('a/one.py'))
+    self.assertEqual({'b/two.py'}, set(self.source_mapper._owners_by_path))
+
+  def test_unchanged_targets_are_not_reindexed(self):
+    hydrated_target = self.hydrated_target('a', 'lib', files=['one.py'])
+    self.set_targets(hydrated_target)
+    self.assertEqual(['a:lib'], self.owners('a/one.py'))
+
+    with mock.patch.object(self.source_mapper, '_owned_paths') as owned_paths:
+      self.assertEqual(['a:lib'], self.owners('a/one.py'))
+      self.assertFalse(owned_paths.called)
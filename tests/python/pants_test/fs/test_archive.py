@@ -7,9 +7,10 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import os
 import unittest
+from zipfile import ZIP_DEFLATED, ZIP_STORED
 
-from pants.fs.archive import archiver
-from pants.util.contextutil import temporary_dir
+from pants.fs.archive import ZipArchiver, archiver
+from pants.util.contextutil import open_zip, temporary_dir
 from pants.util.dirutil import relative_symlink, safe_mkdir, safe_walk, touch
 
 
@@ -60,6 +61,41 @@ class ArchiveTest(unittest.TestCase):
   def test_zip(self):
     self.round_trip(archiver('zip'), expected_ext='zip', empty_dirs=False)
 
+  def test_zip_concurrent_compression(self):
+    self.round_trip(ZipArchiver(ZIP_DEFLATED, 'zip', compression_workers=4),
+                    expected_ext='zip',
+                    empty_dirs=False)
+
+  def test_zip_stores_compressed_members(self):
+    def check_members(zip_archiver):
+      with temporary_dir() as fromdir:
+        contents = {
+          'lib/dep.jar': os.urandom(4096),
+          'static/logo.png': os.urandom(4096),
+          'conf/app.properties': b'key=value\n' * 1000,
+        }
+        for index in range(20):
+          contents['classes/c{}.txt'.format(index)] = '{}\n'.format(index).encode('ascii') * 1000
+        for relpath, content in contents.items():
+          path = os.path.join(fromdir, relpath)
+          safe_mkdir(os.path.dirname(path))
+          with open(path, 'wb') as fp:
+            fp.write(content)
+
+        with temporary_dir() as archivedir:
+          archive = zip_archiver.create(fromdir, archivedir, 'archive')
+          with open_zip(archive) as zip:
+            self.assertIsNone(zip.testzip())
+            infos = {info.filename: info for info in zip.infolist()}
+            self.assertEqual(set(contents), set(infos))
+            for relpath, content in contents.items():
+              expected_type = ZIP_STORED if relpath.endswith(('.jar', '.png')) else ZIP_DEFLATED
+              self.assertEqual(expected_type, infos[relpath].compress_type)
+              self.assertEqual(content, zip.read(relpath))
+
+    check_members(ZipArchiver(ZIP_DEFLATED, 'zip'))
+    check_members(ZipArchiver(ZIP_DEFLATED, 'zip', compression_workers=4))
+
   def test_zip_filter(self):
     def do_filter(path):
       return path == 'allowed.txt'
@@ -6,13 +6,20 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import BaseHTTPServer
+import cProfile
 import json
+import os
+import pstats
+import sys
 import threading
 import urlparse
 
+import mock
+
 from pants.goal.run_tracker import RunTracker
-from pants.util.contextutil import temporary_file_path
+from pants.util.contextutil import temporary_dir, temporary_file_path
 from pants_test.base_test import BaseTest
+from pants_test.subsystem.subsystem_util import init_subsystem
 
 
 class RunTrackerTest(BaseTest):
@@ -166,3 +173,47 @@ class RunTrackerTest(BaseTest):
     keys = ['one', 'two', 'a', 'b', 'c']
     with self.assertRaises(ValueError):
       RunTracker._merge_list_of_keys_into_dict(data, keys, 'new A')
+
+  def test_profile_workunits(self):
+    with temporary_dir() as workdir:
+      init_subsystem(RunTracker, options={
+        '': {'pants_workdir': workdir},
+        RunTracker.options_scope: {'profile_workunits': ['profiled']},
+      })
+      run_tracker = RunTracker.global_instance()
+      run_tracker.initialize()
+      run_tracker.start(mock.Mock())
+
+      with run_tracker.new_workunit('unprofiled') as unprofiled:
+        with run_tracker.new_workunit('profiled') as outer:
+          with run_tracker.new_workunit('profiled') as inner:
+            pass
+
+      self.assertIsNone(unprofiled.profile_path)
+      # Only the outermost profiled workunit of a thread is profiled.
+      self.assertIsNone(inner.profile_path)
+      self.assertEqual(os.path.join(run_tracker.run_info_dir, 'profiles'),
+                       os.path.dirname(outer.profile_path))
+      stats = pstats.Stats(outer.profile_path)
+      self.assertTrue(any(function == 'new_workunit' for _, _, function in stats.stats))
+
+  def test_profile_workunits_under_another_profiler(self):
+    with temporary_dir() as workdir:
+      init_subsystem(RunTracker, options={
+        '': {'pants_workdir': workdir},
+        RunTracker.options_scope: {'profile_workunits': ['profiled']},
+      })
+      run_tracker = RunTracker.global_instance()
+      run_tracker.initialize()
+      run_tracker.start(mock.Mock())
+
+      # E.g. PANTS_PROFILE, which must not be clobbered.
+      profiler = cProfile.Profile()
+      profiler.enable()
+      try:
+        with run_tracker.new_workunit('profiled') as profiled:
+          pass
+        self.assertIs(profiler, sys.getprofile())
+      finally:
+        profiler.disable()
+      self.assertIsNone(profiled.profile_path)
@@ -0,0 +1,80 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import sys
+import unittest
+from textwrap import dedent
+
+from pants.goal.error import GoalError
+from pants.goal.goal import Goal
+from pants.goal.task_registrar import TaskRegistrar
+from pants.util.dirutil import safe_file_dump, safe_mkdtemp
+
+
+class TaskRegistrarTest(unittest.TestCase):
+  _MODULE = 'pants_test_lazily_loaded_task'
+
+  def setUp(self):
+    self.addCleanup(Goal.clear)
+    module_root = safe_mkdtemp()
+    safe_file_dump(os.path.join(module_root, '{}.py'.format(self._MODULE)), dedent("""
+      from pants.task.task import Task
+
+
+      class LazyTask(Task):
+        \"\"\"A lazily loaded task.\"\"\"
+      """))
+    sys.path.append(module_root)
+    self.addCleanup(sys.path.remove, module_root)
+    self.addCleanup(sys.modules.pop, self._MODULE, None)
+
+  def install(self, name='lazy', goal='laziness'):
+    TaskRegistrar(name, '{}:LazyTask'.format(self._MODULE)).install(goal)
+    return Goal.by_name(goal)
+
+  def test_loaded_when_needed(self):
+    goal = self.install()
+    self.assertTrue(goal.active)
+    self.assertEqual(['laziness.lazy'], list(Goal.unloaded_task_scopes()))
+    self.assertEqual([], list(Goal.get_optionables()))
+    self.assertNotIn(self._MODULE, sys.modules)
+
+    task_type = goal.task_type_by_name('lazy')
+    self.assertEqual('LazyTask', task_type.__bases__[0].__name__)
+    self.assertEqual('laziness.lazy', task_type.options_scope)
+    self.assertEqual([], list(Goal.unloaded_task_scopes()))
+    self.assertEqual([task_type], list(Goal.get_optionables()))
+    self.assertIs(task_type, goal.task_type_by_name('lazy'))
+
+  def test_namesake_description(self):
+    goal = self.install(name='laziness')
+    self.assertEqual('A lazily loaded task.', goal.description)
+
+  def test_load_callback(self):
+    loaded = []
+    Goal.set_load_callback(loaded.append)
+    self.install(goal='laziness')
+    self.install(goal='idleness')
+    self.assertEqual([], loaded)
+
+    Goal.load_all()
+    self.assertEqual(['idleness.lazy', 'laziness.lazy'],
+                     sorted(task_type.options_scope for task_type in loaded))
+
+  def test_uninstall_unloaded(self):
+    goal = self.install()
+    goal.uninstall_task('lazy')
+    self.assertFalse(goal.active)
+    self.assertNotIn(self._MODULE, sys.modules)
+
+  def test_bad_action(self):
+    for action in ('{}.LazyTask'.format(self._MODULE), '{}:Missing'.format(self._MODULE),
+                   'pants_test_missing_module:LazyTask'):
+      TaskRegistrar('bad', action).install('badness', replace=True)
+      with self.assertRaises(GoalError):
+        Goal.by_name('badness').task_types()
@@ -66,6 +66,25 @@ class UnionProductsTest(BaseTest):
     self.assertEquals(copied.get_for_targets(b.closure(bfs=True)), OrderedSet([2, 3]))
     self.assertEquals(copied.get_for_targets(c.closure(bfs=True)), OrderedSet([3]))
 
+  def test_copy_on_write(self):
+    a = self.make_target('a')
+    b = self.make_target('b')
+    self.products.add_for_target(a, [1])
+    self.products.add_for_target(b, [2])
+
+    copied = self.products.copy()
+    self.products.add_for_target(a, [3])
+    self.products.remove_for_target(b, [2])
+
+    self.assertEquals(self.products.get_for_target(a), OrderedSet([1, 3]))
+    self.assertEquals(self.products.get_for_target(b), OrderedSet())
+    self.assertEquals(copied.get_for_target(a), OrderedSet([1]))
+    self.assertEquals(copied.get_for_target(b), OrderedSet([2]))
+
+    copied.add_for_target(b, [4])
+    self.assertEquals(self.products.get_for_target(b), OrderedSet())
+    self.assertEquals(copied.get_for_target(b), OrderedSet([2, 4]))
+
   def test_remove_for_target(self):
     c = self.make_target('c')
     b = self.make_target('b', dependencies=[c])
@@ -10,7 +10,10 @@ import unittest
 from pkg_resources import WorkingSet
 
 from pants.base.exceptions import BuildConfigurationError
+from pants.goal.goal import Goal
 from pants.init.options_initializer import OptionsInitializer
+from pants.init.util import clean_global_runtime_state
+from pants.option.arg_splitter import GLOBAL_SCOPE
 from pants.option.options_bootstrapper import OptionsBootstrapper
 
 
@@ -21,3 +24,51 @@ class OptionsInitializerTest(unittest.TestCase):
 
     with self.assertRaises(BuildConfigurationError):
       initializer.setup()
+
+  def setup(self, *args):
+    options_bootstrapper = OptionsBootstrapper(
+      env={},
+      args=['./pants', '--pants-config-files=[]', '--backend-packages=[]'] + list(args))
+    options, _ = OptionsInitializer(options_bootstrapper, WorkingSet()).setup(init_logging=False)
+    return options
+
+  def test_reuses_registered_options(self):
+    setup = self.setup
+    self.addCleanup(clean_global_runtime_state, reset_subsystem=True)
+    options = setup('--fail-fast', 'clean-all', 'src::')
+    reused_options = setup('clean-all', 'tests::')
+
+    self.assertIs(options.get_parser(GLOBAL_SCOPE), reused_options.get_parser(GLOBAL_SCOPE))
+    self.assertEqual(['src::'], options.target_specs)
+    self.assertEqual(['tests::'], reused_options.target_specs)
+    self.assertTrue(options.for_global_scope().fail_fast)
+    self.assertFalse(reused_options.for_global_scope().fail_fast)
+
+  def test_caches_recently_registered_options(self):
+    self.addCleanup(clean_global_runtime_state, reset_subsystem=True)
+    options = self.setup('clean-all')
+    for i in range(OptionsInitializer._MAX_REGISTERED_OPTIONS):
+      self.setup('--pants-distdir=dist{}'.format(i), 'clean-all')
+    self.assertEqual(OptionsInitializer._MAX_REGISTERED_OPTIONS,
+                     len(OptionsInitializer._registered_options))
+    self.assertIsNot(options.get_parser(GLOBAL_SCOPE),
+                     self.setup('clean-all').get_parser(GLOBAL_SCOPE))
+
+  def test_loads_scheduled_tasks(self):
+    self.addCleanup(clean_global_runtime_state, reset_subsystem=True)
+    options = self.setup('clean-all', '--goals-all')
+
+    unloaded_scopes = set(Goal.unloaded_task_scopes())
+    self.assertNotIn('clean-all', unloaded_scopes)
+    self.assertNotIn('goals', unloaded_scopes)
+    self.assertIn('roots', unloaded_scopes)
+    self.assertTrue(options.for_scope('goals').all)
+
+    # Tasks that are loaded later, e.g. as the producers of products, have their options registered.
+    Goal.by_name('roots').task_type_by_name('roots')
+    self.assertEqual('\\n', options.for_scope('roots').sep)
+
+  def test_help_loads_all_tasks(self):
+    self.addCleanup(clean_global_runtime_state, reset_subsystem=True)
+    self.setup('help', 'clean-all')
+    self.assertEqual([], list(Goal.unloaded_task_scopes()))
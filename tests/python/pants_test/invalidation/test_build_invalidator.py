@@ -9,7 +9,8 @@ import tempfile
 import unittest
 from contextlib import contextmanager
 
-from pants.invalidation.build_invalidator import BuildInvalidator, CacheKey
+from pants.invalidation.build_invalidator import BuildInvalidator, CacheKey, LogBuildInvalidator
+from pants.subsystem.subsystem import Subsystem
 from pants.util.contextutil import temporary_dir
 from pants.util.dirutil import safe_rmtree
 from pants_test.subsystem.subsystem_util import init_subsystem
@@ -83,6 +84,20 @@ class BuildInvalidatorTest(BaseBuildInvalidatorTest):
       self.assertTrue(invalidator.needs_update(key))
       self.assertIsNone(invalidator.previous_key(key))
 
+  def test_previous_keys(self):
+    with self.invalidator() as invalidator:
+      key1 = self.cache_key(key_id='1', key_hash='1')
+      key2 = self.cache_key(key_id='2', key_hash='2')
+      uncacheable_key = self.uncacheable_cache_key(key_id='3')
+      invalidator.update(key1)
+      invalidator.update(uncacheable_key)
+      self.assertEqual([key1, None, None],
+                       invalidator.previous_keys([self.update_hash(key1, new_hash='0'),
+                                                  key2,
+                                                  uncacheable_key]))
+      invalidator.force_invalidate_all()
+      self.assertEqual([None, None], invalidator.previous_keys([key1, key2]))
+
   def test_needs_update_missing_key(self):
     with self.invalidator() as invalidator:
       key = self.cache_key()
@@ -136,12 +151,50 @@ class BuildInvalidatorTest(BaseBuildInvalidatorTest):
       self.assertTrue(invalidator.needs_update(key2))
 
 
+class LogBuildInvalidatorTest(BuildInvalidatorTest):
+  @contextmanager
+  def invalidator(self):
+    with temporary_dir() as root:
+      yield LogBuildInvalidator(root)
+
+  def test_reload(self):
+    with temporary_dir() as root:
+      key1 = self.cache_key(key_id='1', key_hash='1')
+      key2 = self.cache_key(key_id='2', key_hash='2')
+      invalidator = LogBuildInvalidator(root, scope='compile')
+      invalidator.update(key1)
+      invalidator.update(self.update_hash(key2, new_hash='1/137'))
+      invalidator.update(key2)
+      invalidator.force_invalidate(key1)
+
+      reloaded = LogBuildInvalidator(root, scope='compile')
+      self.assertTrue(reloaded.needs_update(key1))
+      self.assertFalse(reloaded.needs_update(key2))
+
+  def test_compaction(self):
+    with temporary_dir() as root:
+      invalidator = LogBuildInvalidator(root)
+      key = self.cache_key()
+      for i in range(LogBuildInvalidator._COMPACTION_MIN_RECORDS):
+        invalidator.update(self.update_hash(key, new_hash=str(i)))
+
+      reloaded = LogBuildInvalidator(root)
+      self.assertEqual(str(i), reloaded.previous_key(key).hash)
+      with open(reloaded._log_path, 'rb') as fd:
+        self.assertEqual(1, len(fd.readlines()))
+
+
 class BuildInvalidatorFactoryTest(BaseBuildInvalidatorTest):
+  store = 'files'
+
   def setUp(self):
     pants_workdir = tempfile.mkdtemp()
     self.addCleanup(safe_rmtree, pants_workdir)
 
-    init_subsystem(BuildInvalidator.Factory, options={'': {'pants_workdir': pants_workdir}})
+    Subsystem.reset()
+    init_subsystem(BuildInvalidator.Factory,
+                   options={'': {'pants_workdir': pants_workdir},
+                            'build-invalidator': {'store': self.store}})
     self.root_invalidator = BuildInvalidator.Factory.create()
     self.scoped_invalidator1 = BuildInvalidator.Factory.create(build_task='gen')
     self.scoped_invalidator2 = BuildInvalidator.Factory.create(build_task='resolve')
@@ -169,3 +222,10 @@ class BuildInvalidatorFactoryTest(BaseBuildInvalidatorTest):
 
     self.assertTrue(self.scoped_invalidator1.needs_update(self.key))
     self.assertFalse(self.scoped_invalidator2.needs_update(self.key))
+
+
+class LogBuildInvalidatorFactoryTest(BuildInvalidatorFactoryTest):
+  store = 'log'
+
+  def test_store(self):
+    self.assertIsInstance(self.root_invalidator, LogBuildInvalidator)
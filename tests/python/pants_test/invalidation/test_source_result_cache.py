@@ -0,0 +1,65 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import os
+import unittest
+
+from pants.base.file_digest_cache import FileDigestCache
+from pants.invalidation.source_result_cache import SourceResultCache
+from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_file_dump
+
+
+class SourceResultCacheTest(unittest.TestCase):
+  def setUp(self):
+    self.digest_cache = FileDigestCache()
+
+  def source_result_cache(self, root, config_fingerprint='config'):
+    return SourceResultCache(os.path.join(root, 'results.json'), config_fingerprint,
+                             digest_cache=self.digest_cache)
+
+  def test_unchecked(self):
+    with temporary_dir() as root:
+      a = os.path.join(root, 'A.java')
+      b = os.path.join(root, 'B.java')
+      safe_file_dump(a, 'class A {}')
+      safe_file_dump(b, 'class B {}')
+
+      cache = self.source_result_cache(root)
+      self.assertEqual([a, b], cache.unchecked([a, b]))
+      cache.record_clean([a])
+      self.assertEqual([b], cache.unchecked([a, b]))
+
+      safe_file_dump(a, 'class A { int a; }')
+      self.assertEqual([a, b], cache.unchecked([a, b]))
+
+  def test_missing_sources_are_unchecked(self):
+    with temporary_dir() as root:
+      a = os.path.join(root, 'A.java')
+      cache = self.source_result_cache(root)
+      cache.record_clean([a])
+      self.assertEqual([a], cache.unchecked([a]))
+
+  def test_save(self):
+    with temporary_dir() as root:
+      a = os.path.join(root, 'A.java')
+      safe_file_dump(a, 'class A {}')
+
+      cache = self.source_result_cache(root)
+      cache.record_clean([a])
+      cache.save()
+
+      self.assertEqual([], self.source_result_cache(root).unchecked([a]))
+      self.assertEqual([a], self.source_result_cache(root, 'changed').unchecked([a]))
+
+  def test_unreadable_results(self):
+    with temporary_dir() as root:
+      a = os.path.join(root, 'A.java')
+      safe_file_dump(a, 'class A {}')
+      safe_file_dump(os.path.join(root, 'results.json'), '{"config": "config", "clean": ')
+
+      self.assertEqual([a], self.source_result_cache(root).unchecked([a]))
@@ -83,6 +83,34 @@ that.""",
     config = Config.load([])
     self.assertEquals([], config.sections())
 
+  def test_load_reuses_unchanged_configs(self):
+    with temporary_file() as ini:
+      ini.write('[a]\nfast: True\n')
+      ini.close()
+      config = Config.load([ini.name]).configs()[0]
+      self.assertIs(config, Config.load([ini.name]).configs()[0])
+      self.assertIsNot(config, Config.load([ini.name],
+                                           seed_values={'buildroot': '/build/root'}).configs()[0])
+
+      with open(ini.name, 'w') as fp:
+        fp.write('[a]\nfast: False\n')
+      self.assertEquals('False', Config.load([ini.name]).get('a', 'fast'))
+
+  def test_load_evicts_least_recently_used_configs(self):
+    with temporary_file() as ini:
+      ini.write('[a]\nfast: True\n')
+      ini.close()
+      load = lambda buildroot: Config.load([ini.name], seed_values={'buildroot': buildroot})
+      config = load('/build/root').configs()[0]
+      for i in range(Config._MAX_SINGLE_FILE_CONFIGS - 1):
+        load('/build/root{}'.format(i))
+        # Using a config keeps it cached.
+        self.assertIs(config, load('/build/root').configs()[0])
+
+      load('/build/other/root')
+      self.assertEquals(Config._MAX_SINGLE_FILE_CONFIGS, len(Config._single_file_configs))
+      self.assertIs(config, load('/build/root').configs()[0])
+
   def _check_defaults(self, accessor, default):
     self.assertEquals(None, accessor('c', 'fast'))
     self.assertEquals(None, accessor('c', 'preempt', None))
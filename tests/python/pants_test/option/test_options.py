@@ -785,6 +785,36 @@ class OptionsTest(unittest.TestCase):
     self.assertEqual('red', options.for_global_scope().pants_foo)
     self.assertEqual('BAR', defaulted_only_options.for_global_scope().pants_foo)
 
+  def test_for_args(self):
+    options = self._parse('./pants --bar-baz=fred -n33 simple -n1',
+                          env={'PANTS_FOO': 'BAR'},
+                          config={'simple': {'num': 42}})
+    self.assertEqual('fred', options.for_global_scope().bar_baz)
+    self.assertEqual(1, options.for_scope('simple').num)
+
+    reparsed_options = options.for_args(shlex.split(str('./pants compile src/java::')))
+    self.assertEqual(['compile'], list(reparsed_options.goals))
+    self.assertEqual(['src/java::'], reparsed_options.target_specs)
+    self.assertIsNone(reparsed_options.for_global_scope().bar_baz)
+    self.assertEqual(99, reparsed_options.for_global_scope().num)
+    self.assertEqual('BAR', reparsed_options.for_global_scope().pants_foo)
+    self.assertEqual(42, reparsed_options.for_scope('simple').num)
+
+  def test_add_scopes(self):
+    options = self._parse('./pants simple', config={'late.task': {'flavor': 'sweet'}})
+    self.assertFalse(options.is_known_scope('late'))
+
+    options.add_scopes([task('late.task'), subsystem('late-subsystem')])
+    self.assertTrue(options.is_known_scope('late'))
+    self.assertEqual(task('late.task'), options.known_scope_to_info['late.task'])
+    options.register('late.task', '--flavor')
+    options.register('late-subsystem', '--color', default='red')
+
+    self.assertEqual('sweet', options.for_scope('late.task').flavor)
+    self.assertEqual(99, options.for_scope('late.task').num)
+    self.assertEqual('red', options.for_scope('late-subsystem').color)
+    self.assertEqual('sweet', options.for_args(['./pants']).for_scope('late.task').flavor)
+
   def test_deprecated_option_past_removal(self):
     """Ensure that expired options raise CodeRemovedError on attempted use."""
     # Test option past removal from flag
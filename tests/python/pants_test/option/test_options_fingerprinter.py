@@ -67,8 +67,9 @@ class OptionsFingerprinterTest(BaseTest):
     self.assertNotEquals(fp1, fp3)
 
   def test_fingerprint_file(self):
-    fp1, fp2, fp3 = (self.options_fingerprinter.fingerprint(file_option,
-                                                            self.create_file(f, contents=c))
+    # Fingerprints are memoized per fingerprinter, so use a new one each time the file changes.
+    fp1, fp2, fp3 = (OptionsFingerprinter().fingerprint(file_option,
+                                                        self.create_file(f, contents=c))
                      for (f, c) in (('foo/bar.config', 'blah blah blah'),
                                     ('foo/bar.config', 'meow meow meow'),
                                     ('spam/egg.config', 'blah blah blah')))
@@ -76,6 +77,13 @@ class OptionsFingerprinterTest(BaseTest):
     self.assertNotEquals(fp1, fp3)
     self.assertNotEquals(fp2, fp3)
 
+  def test_fingerprint_file_memoized(self):
+    f = self.create_file('foo/bar.config', contents='blah blah blah')
+    fp1 = self.options_fingerprinter.fingerprint(file_option, f)
+    self.create_file('foo/bar.config', contents='meow meow meow meow')
+    self.assertEquals(fp1, self.options_fingerprinter.fingerprint(file_option, f))
+    self.assertNotEquals(fp1, OptionsFingerprinter().fingerprint(file_option, f))
+
   def test_fingerprint_file_outside_buildroot(self):
     with temporary_dir() as tmp:
       outside_buildroot = self.create_file(os.path.join(tmp, 'foobar'), contents='foobar')
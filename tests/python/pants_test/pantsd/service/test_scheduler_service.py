@@ -0,0 +1,78 @@
+# coding=utf-8
+# Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import (absolute_import, division, generators, nested_scopes, print_function,
+                        unicode_literals, with_statement)
+
+import threading
+import unittest
+
+import mock
+
+from pants.pantsd.service.scheduler_service import SchedulerService
+
+
+class TestSchedulerService(unittest.TestCase):
+  BUILD_ROOT = '/build_root'
+
+  def setUp(self):
+    self.mock_graph_helper = mock.Mock()
+    self.mock_scheduler = self.mock_graph_helper.scheduler
+    self.mock_scheduler.invalidate_files.return_value = 7
+    self.service = self._create_service(debounce_secs=0)
+
+  def _create_service(self, debounce_secs):
+    service = SchedulerService(mock.Mock(), self.mock_graph_helper, self.BUILD_ROOT, [],
+                               debounce_secs=debounce_secs)
+    service.setup(threading.RLock(), threading.RLock())
+    return service
+
+  @staticmethod
+  def _event(files, is_fresh_instance=False):
+    return dict(subscription='all_files', is_fresh_instance=is_fresh_instance, files=files)
+
+  def test_initial_event_is_ignored(self):
+    self.service._enqueue_fs_event(self._event(['a/BUILD'], is_fresh_instance=True))
+    self.service._process_event_queue()
+
+    self.assertFalse(self.mock_scheduler.invalidate_files.called)
+    self.assertTrue(self.service._watchman_is_running.is_set())
+
+  def test_queued_events_are_coalesced(self):
+    self.service._enqueue_fs_event(self._event(['a/BUILD'], is_fresh_instance=True))
+    self.service._enqueue_fs_event(self._event(['a/BUILD', 'b/BUILD']))
+    self.service._enqueue_fs_event(self._event(['b/BUILD', 'c/BUILD']))
+    self.service._process_event_queue()
+
+    self.mock_scheduler.invalidate_files.assert_called_once_with({'a/BUILD', 'b/BUILD', 'c/BUILD'})
+    self.assertTrue(self.service._event_queue.empty())
+
+    stats = self.service.consume_invalidation_stats()
+    self.assertEqual(1, stats['invalidation_count'])
+    self.assertEqual(3, stats['invalidated_file_count'])
+    self.assertEqual(7, stats['invalidated_node_count'])
+    self.assertGreaterEqual(stats['invalidation_latency'], 0)
+
+    # Stats are reset once consumed.
+    self.assertEqual(0, self.service.consume_invalidation_stats()['invalidation_count'])
+
+  def test_events_within_debounce_window_are_coalesced(self):
+    service = self._create_service(debounce_secs=5)
+    service._enqueue_fs_event(self._event(['a/BUILD']))
+    late_event = threading.Timer(0.1, service._enqueue_fs_event, args=(self._event(['b/BUILD']),))
+    late_event.start()
+    try:
+      with mock.patch.object(SchedulerService, 'QUEUE_SIZE', 2):
+        service._process_event_queue()
+    finally:
+      late_event.join()
+
+    self.mock_scheduler.invalidate_files.assert_called_once_with({'a/BUILD', 'b/BUILD'})
+
+  def test_invalid_event_is_skipped(self):
+    self.service._enqueue_fs_event(self._event(['a/BUILD']))
+    self.service._enqueue_fs_event(dict(subscription='all_files', files=['b/BUILD']))
+    self.service._process_event_queue()
+
+    self.mock_scheduler.invalidate_files.assert_called_once_with({'a/BUILD'})
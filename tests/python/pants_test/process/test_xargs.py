@@ -97,3 +97,38 @@ class XargsTest(unittest.TestCase):
                       mock.call(['one', 'two']),
                       mock.call(['three', 'four'])],
                      self.call.mock_calls)
+
+  def test_shard(self):
+    self.assertEqual([[]], Xargs.shard([], 3))
+    self.assertEqual([['one', 'two', 'three']], Xargs.shard(['one', 'two', 'three'], 1))
+    self.assertEqual([['one', 'two'], ['three', 'four'], ['five']],
+                     Xargs.shard(['one', 'two', 'three', 'four', 'five'], 3))
+    self.assertEqual([['one'], ['two']], Xargs.shard(['one', 'two'], 4))
+
+  def test_execute_sharded(self):
+    mapped = []
+
+    def map_func(func, shards):
+      mapped.extend(shards)
+      return [func(shard) for shard in shards]
+
+    self.call.side_effect = (0, 42, 7)
+    xargs = Xargs(self.call, shards=3, map_func=map_func)
+
+    self.assertEqual(42, xargs.execute(['one', 'two', 'three', 'four']))
+
+    self.assertEqual([['one', 'two'], ['three'], ['four']], mapped)
+    self.assertEqual([mock.call(['one', 'two']), mock.call(['three']), mock.call(['four'])],
+                     self.call.mock_calls)
+
+  def test_execute_sharded_split(self):
+    self.call.side_effect = (self.TOO_BIG, 0, 0, 0)
+    xargs = Xargs(self.call, shards=2)
+
+    self.assertEqual(0, xargs.execute(['one', 'two', 'three', 'four']))
+
+    self.assertEqual([mock.call(['one', 'two']),
+                      mock.call(['one']),
+                      mock.call(['two']),
+                      mock.call(['three', 'four'])],
+                     self.call.mock_calls)
@@ -8,7 +8,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 import re
 import unittest
 
-from pants.source.filespec import glob_to_regex
+from pants.source.filespec import glob_to_regex, globs_matches, globs_regex
 
 
 class GlobToRegexTest(unittest.TestCase):
@@ -113,3 +113,24 @@ class GlobToRegexTest(unittest.TestCase):
 
   def test_glob_to_regex_literal_file(self):
     self.assert_rule_match('a/b/c.py', ('a/b/c.py',))
+
+
+class GlobsMatchesTest(unittest.TestCase):
+  def test_globs_matches(self):
+    self.assertTrue(globs_matches(['a/b/c.py'], ['a/**/*.py'], []))
+    self.assertFalse(globs_matches(['a/b/c.java'], ['a/**/*.py'], []))
+    self.assertFalse(globs_matches(['a/b/c.py'], [], []))
+
+  def test_globs_matches_exclude(self):
+    self.assertFalse(globs_matches(['a/b/c.py'], ['a/**/*.py'], ['a/b/*']))
+    self.assertTrue(globs_matches(['a/b/c.py', 'a/d.py'], ['a/**/*.py'], ['a/b/*']))
+
+  def test_globs_matches_many_patterns(self):
+    # More recursive globs than a single regex could hold capturing groups for.
+    patterns = ['dir{}/**/*.py'.format(i) for i in range(200)]
+    self.assertTrue(globs_matches(['dir199/a/b.py'], patterns, []))
+    self.assertFalse(globs_matches(['dir200/a/b.py'], patterns, []))
+
+  def test_globs_regex_memoized(self):
+    self.assertIs(globs_regex(('a/*.py', 'b/*.py')), globs_regex(('a/*.py', 'b/*.py')))
+    self.assertIsNone(globs_regex(()))
@@ -6,9 +6,10 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import os
+import sqlite3
 import unittest
 
-from pants.stats.statsdb import StatsDB
+from pants.stats.statsdb import StatsDB, StatsDBError
 from pants.util.contextutil import temporary_dir
 
 
@@ -67,3 +68,74 @@ class StatsDBTest(unittest.TestCase):
       self.assertEqual(
         sorted([('2015-08-03', 'compile.java', 2, 21340), ('2015-08-03', 'resolve.ivy', 1, 56000)]),
         sorted(aggs))
+
+  def test_series(self):
+    with temporary_dir() as tmpdir:
+      statsdb = StatsDB(os.path.join(tmpdir, 'statsdb.sqlite'))
+      statsdb.ensure_tables()
+      for i, timing in enumerate([10, 11, 12]):
+        statsdb.insert_stats({
+          'run_info': {
+            'id': 'run{}'.format(i),
+            'timestamp': str(1438600000 + i),
+            'machine': 'ernie',
+            'user': 'bert',
+            'version': '9.8.7',
+            'buildroot': '/path/to/repo',
+            'outcome': 'SUCCESS',
+            'cmd_line': 'pants compile baz:qux',
+            'revision': 'rev{}'.format(i),
+            'target_data': {'baz:qux': {'compile.zinc': {'compile': {'time': timing / 10}}}},
+          },
+          'cumulative_timings': [t('compile.zinc', timing)],
+          'self_timings': [],
+          'critical_path_timings': [t('compile', timing + 1)],
+          'artifact_cache_stats': [{'cache_name': 'compile.zinc', 'num_hits': i, 'num_misses': 4}],
+          'pantsd_stats': {'resulting_graph_size': 100 + i, 'preceding_graph_size': None},
+        })
+
+      self.assertEqual([('run1', 1438600001, 'rev1'), ('run2', 1438600002, 'rev2')],
+                       statsdb.get_recent_runs('% compile %', 2))
+      self.assertEqual({'compile.zinc': {'run1': 11.0, 'run2': 12.0}},
+                       statsdb.get_series('cumulative_timings', '% compile %', 2))
+      self.assertEqual({'compile': {'run1': 12.0, 'run2': 13.0}},
+                       statsdb.get_series('critical_path_timings', '%', 2))
+      self.assertEqual({'compile.zinc baz:qux': {'run1': 1.1, 'run2': 1.2}},
+                       statsdb.get_series('target_timings', '%', 2))
+      self.assertEqual({'compile.zinc': {'run1': 0.2, 'run2': 2 / 6}},
+                       statsdb.get_series('artifact_cache_hit_rates', '%', 2))
+      self.assertEqual({'resulting_graph_size': {'run1': 101, 'run2': 102}},
+                       statsdb.get_series('pantsd_stats', '%', 2))
+      self.assertEqual({}, statsdb.get_series('self_timings', '% test %', 2))
+      with self.assertRaises(StatsDBError):
+        statsdb.get_series('unknown', '%', 2)
+
+  def test_adds_revision_to_existing_db(self):
+    with temporary_dir() as tmpdir:
+      path = os.path.join(tmpdir, 'statsdb.sqlite')
+      conn = sqlite3.connect(path)
+      conn.execute("""
+        CREATE TABLE run_info (id TEXT PRIMARY KEY, timestamp INTEGER, machine TEXT, user TEXT,
+                               version TEXT, buildroot TEXT, outcome TEXT, cmd_line TEXT)
+      """)
+      conn.commit()
+      conn.close()
+
+      statsdb = StatsDB(path)
+      statsdb.ensure_tables()
+      statsdb.insert_stats({
+        'run_info': {
+          'id': 'run1',
+          'timestamp': '1438600000',
+          'machine': 'ernie',
+          'user': 'bert',
+          'version': '9.8.7',
+          'buildroot': '/path/to/repo',
+          'outcome': 'SUCCESS',
+          'cmd_line': 'pants compile baz:qux',
+          'revision': 'abc',
+        },
+        'cumulative_timings': [],
+        'self_timings': [],
+      })
+      self.assertEqual([('run1', 1438600000, 'abc')], statsdb.get_recent_runs('%', 1))
@@ -7,6 +7,8 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import collections
 import os
+import threading
+import time
 from contextlib import contextmanager
 from unittest import TestCase
 from xml.etree.ElementTree import ParseError
@@ -14,8 +16,10 @@ from xml.etree.ElementTree import ParseError
 from mock import Mock, patch
 
 from pants.base.exceptions import ErrorWhileTesting
-from pants.task.task import TaskBase
-from pants.task.testrunner_task_mixin import TestRunnerTaskMixin
+from pants.build_graph.target import Target
+from pants.task.task import Task, TaskBase
+from pants.task.testrunner_task_mixin import (PartitionedTestRunnerTaskMixin, TestResult,
+                                                TestRunnerTaskMixin)
 from pants.util.contextutil import temporary_dir
 from pants.util.dirutil import safe_open
 from pants.util.process_handler import ProcessHandler, subprocess
@@ -378,6 +382,110 @@ class TestRunnerTaskMixinMultipleTargets(TaskTestBase):
     self.assertEqual([targetB, targetC], cm.exception.failed_targets)
 
 
+class PartitionedTestRunnerTaskMixinConcurrencyTest(TaskTestBase):
+
+  @classmethod
+  def task_type(cls):
+    class PartitionedTestRunnerTaskMixinTask(PartitionedTestRunnerTaskMixin, Task):
+      parallelism = 1
+      wait_secs = 0.2
+      failing = frozenset()
+
+      def __init__(self, *args, **kwargs):
+        super(PartitionedTestRunnerTaskMixinTask, self).__init__(*args, **kwargs)
+        self.ran = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+      @property
+      def partition_parallelism(self):
+        return self.parallelism
+
+      @contextmanager
+      def partitions(self, per_target, all_targets, test_targets):
+        def iter_partitions():
+          for test_target in test_targets:
+            yield (test_target,), (test_target.name,)
+        yield iter_partitions
+
+      def run_tests(self, fail_fast, test_targets, name):
+        self.ran.append(name)
+        rc = self._spawn_and_wait()
+        result = TestResult.rc(1 if name in self.failing else rc)
+        return result.with_failed_targets(test_targets)
+
+      def collect_files(self, *args):
+        return []
+
+      def _spawn(self, *args, **kwargs):
+        task = self
+
+        class FakeProcessHandler(ProcessHandler):
+          def wait(_, timeout=None):
+            with task._lock:
+              task.running += 1
+              task.max_running = max(task.max_running, task.running)
+            time.sleep(task.wait_secs)
+            with task._lock:
+              task.running -= 1
+            return 0
+
+          def kill(_):
+            pass
+
+          def terminate(_):
+            pass
+
+          def poll(_):
+            pass
+
+        return FakeProcessHandler()
+
+      def _test_target_filter(self):
+        return lambda target: True
+
+      def _validate_target(self, target):
+        pass
+
+    return PartitionedTestRunnerTaskMixinTask
+
+  def _create_task(self, parallelism, failing=(), fail_fast=False):
+    self.set_options(fast=False, fail_fast=fail_fast, timeouts=False)
+    targets = [self.make_target(name, Target) for name in ('a', 'b', 'c', 'd')]
+    task = self.create_task(self.context(target_roots=targets))
+    task.parallelism = parallelism
+    task.failing = frozenset(failing)
+    return task
+
+  def test_serial(self):
+    task = self._create_task(parallelism=1)
+    task.execute()
+    self.assertEqual(['a', 'b', 'c', 'd'], task.ran)
+    self.assertEqual(1, task.max_running)
+
+  def test_concurrent(self):
+    task = self._create_task(parallelism=2)
+    task.execute()
+    self.assertEqual({'a', 'b', 'c', 'd'}, set(task.ran))
+    self.assertEqual(2, task.max_running)
+
+  def test_concurrent_failure(self):
+    task = self._create_task(parallelism=2, failing=['b'])
+    with self.assertRaises(ErrorWhileTesting) as cm:
+      task.execute()
+    self.assertEqual({'a', 'b', 'c', 'd'}, set(task.ran))
+    self.assertEqual(['b'], [t.name for t in cm.exception.failed_targets])
+
+  def test_concurrent_fail_fast(self):
+    task = self._create_task(parallelism=2, failing=['a'], fail_fast=True)
+    task.wait_secs = 0.5
+    with self.assertRaises(ErrorWhileTesting):
+      task.execute()
+    # The failure of `a` is seen before the in-flight `b` completes, so no further partitions start.
+    self.assertEqual({'a', 'b'}, set(task.ran))
+
+
 class TestRunnerTaskMixinXmlParsing(TestRunnerTaskMixin, TestCase):
   @staticmethod
   def _raise_handler(e):